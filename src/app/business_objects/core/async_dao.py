@@ -0,0 +1,360 @@
+from typing import AsyncIterator, Dict, Iterable
+
+from pymongo.errors import BulkWriteError
+
+from app.business_objects.core.dao import (
+    BaseEntityRepository,
+    inject_async_mongodb_error_handling,
+)
+from app.business_objects.core.bulk import BulkResult
+from app.business_objects.core.errors import DuplicateEntityError
+from app.business_objects.core.pagination import Page
+from app.business_objects.core.cache import MISSING, widen_projection
+from app.business_objects.core.routing import Routing
+from app.context import get_context, ServerContext
+
+
+# =========================================================
+# CLASS ASYNC ENTITY REPOSITORY
+# =========================================================
+class AsyncEntityRepository(BaseEntityRepository):
+    def __init__(
+        self,
+        collection_name: str,
+        context: ServerContext = get_context(),
+        routing: Routing or None = None,
+    ):
+        """
+        Asyncio counterpart of EntityRepository. Operations
+        are coroutines backed by the shared AsyncMongoClient,
+        so an async endpoint can keep many Mongo operations
+        in flight without pinning a threadpool thread per
+        request.
+
+        :param collection_name: Name of the MongoDB Collection
+        :param context: Shared worker context that provides access to
+        database connection parameters and dependency inversion
+        :param routing: Read preference, read concern and write
+        concern of the repository, on top of the MONGO_READ_*
+        and MONGO_WRITE_CONCERN settings
+        """
+        super().__init__(collection_name, context.async_database, context, routing)
+
+    # -----------------------------------------------------
+    # METHOD STREAM
+    # -----------------------------------------------------
+    async def stream(
+        self,
+        query: Dict,
+        projection: Dict or None = None,
+        batch_size: int or None = None,
+        limit: int = 0,
+        routing: Routing or None = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Lazily iterates over the documents that match the
+        given filter. Documents are fetched from the server in
+        batches and handed over one at a time, so the full
+        result set is never held in memory. Errors raised
+        while iterating are propagated to the caller.
+
+        :param query: A dictionary containing a valid MongoDB
+        filter
+        :param projection: Optional MongoDB projection
+        :param batch_size: Number of documents per batch.
+        Defaults to QUERY_BATCH_SIZE
+        :param limit: Maximum number of documents (0 = no limit)
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: Async iterator of documents
+        """
+        cursor = self.collection(routing).find(
+            query,
+            projection,
+            batch_size=batch_size or self.context.query_batch_size,
+            limit=limit,
+        )
+        try:
+            async for document in cursor:
+                yield document
+        finally:
+            await cursor.close()
+
+    # -----------------------------------------------------
+    # METHOD GET
+    # -----------------------------------------------------
+    @inject_async_mongodb_error_handling
+    async def get(
+        self,
+        query: Dict,
+        projection: Dict or None = None,
+        routing: Routing or None = None,
+    ):
+        """
+        Get a set of documents on the given collection based
+        on a filter (represented in Python as a dictionary).
+
+        :param query: A dictionary containing a valid MongoDB
+        filter
+        :param projection: Optional MongoDB projection
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: List of results
+        """
+        return (
+            await self.collection(routing)
+            .find(
+                query,
+                projection,
+                batch_size=self.context.query_batch_size,
+                limit=self.context.query_limit,
+            )
+            .to_list()
+        )
+
+    # -----------------------------------------------------
+    # METHOD PAGINATE
+    # -----------------------------------------------------
+    @inject_async_mongodb_error_handling
+    async def paginate(
+        self,
+        query: Dict,
+        page_size: int,
+        token: str or None = None,
+        projection: Dict or None = None,
+        routing: Routing or None = None,
+    ) -> Page:
+        """
+        Keyset pagination ordered by pagination_key, see
+        EntityRepository.paginate.
+
+        :param query: A dictionary containing a valid MongoDB
+        filter
+        :param page_size: Documents per page, capped to
+        QUERY_LIMIT
+        :param token: Continuation token of a previous page
+        :param projection: Optional MongoDB projection
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: Page
+        :raises InvalidPageTokenError: If the token is not valid
+        """
+        pagination = self._pagination(query, page_size, token, projection)
+        documents = (
+            await self.collection(routing)
+            .find(
+                pagination.filter,
+                pagination.fetch_projection,
+                sort=pagination.sort,
+                limit=pagination.limit,
+            )
+            .to_list()
+        )
+        return pagination.build_page(documents)
+
+    # -----------------------------------------------------
+    # METHOD FIND ONE
+    # -----------------------------------------------------
+    async def find_one(
+        self,
+        query: Dict,
+        projection: Dict or None = None,
+        unique: bool = False,
+        routing: Routing or None = None,
+    ) -> Dict:
+        """
+        Point lookup of a single document, see
+        EntityRepository.find_one.
+
+        :param query: A dictionary containing a valid MongoDB
+        filter
+        :param projection: Optional MongoDB projection
+        :param unique: When True, fails if more than one
+        document matches the query
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: The matching document
+        :raises EntityNotFoundError: If no document matches
+        :raises DuplicateEntityError: If unique is True and
+        more than one document matches
+        :raises HTTPException: 503 if the lookup fails
+        """
+        key = self._cache_key(query, projection, unique, routing)
+        if key is None:
+            document = await self.__find_document(query, projection, unique, routing)
+        else:
+            cache = self.document_cache
+            document = cache.get(key)
+            if document is None:
+                generation = cache.generation
+                widened, added = widen_projection(projection, cache.tag_fields)
+                document = await self.__find_document(query, widened, unique, routing)
+                if document is not False:
+                    document = self._cache_put(key, document, generation, added)
+            elif document is MISSING:
+                document = None
+        return self._found(query, document)
+
+    # -----------------------------------------------------
+    # METHOD FIND DOCUMENT
+    # -----------------------------------------------------
+    @inject_async_mongodb_error_handling
+    async def __find_document(
+        self,
+        query: Dict,
+        projection: Dict or None,
+        unique: bool,
+        routing: Routing or None,
+    ) -> Dict or None:
+        if unique:
+            documents = (
+                await self.collection(routing)
+                .find(query, projection, batch_size=2, limit=2)
+                .to_list()
+            )
+            if len(documents) > 1:
+                raise DuplicateEntityError(self.collection_name, query)
+            return documents[0] if documents else None
+        return await self.collection(routing).find_one(query, projection)
+
+    # -----------------------------------------------------
+    # METHOD GET BY ID
+    # -----------------------------------------------------
+    async def get_by_id(
+        self,
+        issue_id: str,
+        projection: Dict or None = None,
+        routing: Routing or None = None,
+    ) -> Dict:
+        """
+        Given an issue_id (Internal unique identifier for
+        ControlDB), it gets the entity with matching id if it
+        exists
+        :param issue_id: Unique ControlDB identifier for the
+        entity
+        :param projection: Optional MongoDB projection
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: Dict if entity exists. Raises HTTP 404 if not
+        found, HTTP 503 if the lookup fails
+        """
+        return await self.find_one(
+            {"id": issue_id}, projection, unique=True, routing=routing
+        )
+
+    # -----------------------------------------------------
+    # METHOD UPDATE ONE
+    # -----------------------------------------------------
+    @inject_async_mongodb_error_handling
+    async def update_one(
+        self, issue_id: str, new_values: dict, routing: Routing or None = None
+    ):
+        new_values = self._coerce(new_values)
+        try:
+            return await self.collection(routing).update_one(
+                {"id": issue_id}, {"$set": new_values}
+            )
+        finally:
+            self._invalidate({"id": issue_id}, new_values)
+
+    # -----------------------------------------------------
+    # METHOD UPDATE MANY
+    # -----------------------------------------------------
+    @inject_async_mongodb_error_handling
+    async def update_many(
+        self, filter_query: dict, new_values: dict, routing: Routing or None = None
+    ):
+        new_values = self._coerce(new_values)
+        try:
+            return await self.collection(routing).update_many(
+                filter_query, {"$set": new_values}
+            )
+        finally:
+            self._invalidate(filter_query, new_values)
+
+    # -----------------------------------------------------
+    # METHOD CREATE
+    # -----------------------------------------------------
+    async def create(self, values: dict, routing: Routing or None = None):
+        values = self._coerce(values)
+        try:
+            return (await self.collection(routing).insert_one(values)).inserted_id
+        finally:
+            self._invalidate(None, values)
+
+    # -----------------------------------------------------
+    # METHOD BULK WRITE
+    # -----------------------------------------------------
+    @inject_async_mongodb_error_handling(idempotent=False)
+    async def bulk_write(
+        self,
+        operations: Iterable,
+        chunk_size: int or None = None,
+        routing: Routing or None = None,
+    ) -> BulkResult:
+        """
+        Applies the operations with unordered bulk writes of
+        chunk_size operations, see EntityRepository.bulk_write.
+
+        :param operations: Iterable of pymongo write operations
+        :param chunk_size: Operations per bulk write. Defaults
+        to MONGO_BULK_CHUNK_SIZE
+        :param routing: Optional per-call routing, e.g. to wait
+        for a majority write concern
+        :return: BulkResult
+        """
+        entities = self.collection(routing)
+        result = BulkResult()
+        offset: int = 0
+        try:
+            for chunk in self._chunks(operations, chunk_size):
+                try:
+                    result.add_result(await entities.bulk_write(chunk, ordered=False))
+                except BulkWriteError as bulk_write_error:
+                    result.add_error_details(bulk_write_error.details, offset)
+                offset += len(chunk)
+        finally:
+            self._bulk_written()
+        return result
+
+    # -----------------------------------------------------
+    # METHOD CREATE MANY
+    # -----------------------------------------------------
+    async def create_many(
+        self, documents: Iterable[Dict], chunk_size: int or None = None
+    ) -> BulkResult:
+        return await self.bulk_write(self._insert_operations(documents), chunk_size)
+
+    # -----------------------------------------------------
+    # METHOD UPSERT MANY
+    # -----------------------------------------------------
+    async def upsert_many(
+        self,
+        documents: Iterable[Dict],
+        key: str = "id",
+        chunk_size: int or None = None,
+    ) -> BulkResult:
+        """
+        Inserts or updates documents matched by key.
+        :param documents: Documents to upsert
+        :param key: Field that identifies each document
+        :param chunk_size: Operations per bulk write
+        :return: BulkResult
+        """
+        return await self.bulk_write(
+            self._upsert_operations(documents, key), chunk_size
+        )
+
+    # -----------------------------------------------------
+    # METHOD UPDATE MANY BY ID
+    # -----------------------------------------------------
+    async def update_many_by_id(
+        self, updates: Dict[str, Dict], chunk_size: int or None = None
+    ) -> BulkResult:
+        """
+        Sets different values on many documents.
+        :param updates: Dict of id to the values to set
+        :param chunk_size: Operations per bulk write
+        :return: BulkResult
+        """
+        return await self.bulk_write(self._update_by_id_operations(updates), chunk_size)
@@ -0,0 +1,129 @@
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+from pymongo import InsertOne, UpdateOne
+from pymongo.results import BulkWriteResult
+
+
+# =========================================================
+# CLASS BULK RESULT
+# =========================================================
+class BulkResult:
+    """
+    Aggregated outcome of a chunked, unordered bulk write.
+    Errors are reported per item, with the index of the item
+    in the original input rather than within its chunk.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        self.inserted: int = 0
+        self.matched: int = 0
+        self.modified: int = 0
+        self.upserted: int = 0
+        self.errors: List[Dict] = []
+
+    # -----------------------------------------------------
+    # METHOD ADD RESULT
+    # -----------------------------------------------------
+    def add_result(self, result: BulkWriteResult):
+        self.inserted += result.inserted_count
+        self.matched += result.matched_count
+        self.modified += result.modified_count
+        self.upserted += result.upserted_count
+
+    # -----------------------------------------------------
+    # METHOD ADD ERROR DETAILS
+    # -----------------------------------------------------
+    def add_error_details(self, details: Dict, offset: int):
+        """
+        Merges the details of a BulkWriteError. With unordered
+        writes the rest of the chunk is still applied, so the
+        counters of the successful items are kept as well.
+        :param details: BulkWriteError.details
+        :param offset: Position of the chunk in the input
+        """
+        self.inserted += details.get("nInserted", 0)
+        self.matched += details.get("nMatched", 0)
+        self.modified += details.get("nModified", 0)
+        self.upserted += details.get("nUpserted", 0)
+        for error in details.get("writeErrors", []):
+            self.errors.append(
+                {
+                    "index": offset + error["index"],
+                    "code": error.get("code"),
+                    "message": error.get("errmsg"),
+                }
+            )
+        for error in details.get("writeConcernErrors", []):
+            self.errors.append(
+                {
+                    "index": None,
+                    "code": error.get("code"),
+                    "message": error.get("errmsg"),
+                }
+            )
+
+    # -----------------------------------------------------
+    # PROPERTY SUCCEEDED
+    # -----------------------------------------------------
+    @property
+    def succeeded(self) -> bool:
+        return not self.errors
+
+    # -----------------------------------------------------
+    # METHOD DICT
+    # -----------------------------------------------------
+    def dict(self) -> dict:
+        return {
+            "inserted": self.inserted,
+            "matched": self.matched,
+            "modified": self.modified,
+            "upserted": self.upserted,
+            "errors": self.errors,
+        }
+
+
+# ---------------------------------------------------------
+# FUNCTION CHUNKED
+# ---------------------------------------------------------
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """
+    Splits an iterable in lists of at most size items
+    without materializing the whole iterable.
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ---------------------------------------------------------
+# FUNCTION INSERT OPERATIONS
+# ---------------------------------------------------------
+def insert_operations(documents: Iterable[Dict]) -> Iterator[InsertOne]:
+    return (InsertOne(document) for document in documents)
+
+
+# ---------------------------------------------------------
+# FUNCTION UPSERT OPERATIONS
+# ---------------------------------------------------------
+def upsert_operations(documents: Iterable[Dict], key: str) -> Iterator[UpdateOne]:
+    return (
+        UpdateOne({key: document[key]}, {"$set": document}, upsert=True)
+        for document in documents
+    )
+
+
+# ---------------------------------------------------------
+# FUNCTION UPDATE BY ID OPERATIONS
+# ---------------------------------------------------------
+def update_by_id_operations(updates: Dict[str, Dict]) -> Iterator[UpdateOne]:
+    return (
+        UpdateOne({"id": issue_id}, {"$set": new_values})
+        for issue_id, new_values in updates.items()
+    )
@@ -0,0 +1,324 @@
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Set, Tuple
+
+from app.caching import TTLCache
+
+# Cached result of a lookup that matched no document
+MISSING = object()
+# Entries are also tagged with the _id of their document, the
+# only key that change events of updates and deletes carry
+ID_FIELD: str = "_id"
+
+
+# ---------------------------------------------------------
+# CLASS CACHE POLICY
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Caching of the point lookups of a repository. Only
+    lookups by a single key field, e.g. {"id": ...}, are
+    cached; writes invalidate the entries of the documents
+    they touch by the value of their key fields.
+    """
+
+    keys: Tuple[str, ...]
+    max_size: int = 10000
+    ttl: float = 60
+    negative_ttl: float = 5
+
+
+# ---------------------------------------------------------
+# FUNCTION WIDEN PROJECTION
+# ---------------------------------------------------------
+def widen_projection(
+    projection: Dict or None, fields: Tuple[str, ...]
+) -> Tuple[Dict or None, List[str]]:
+    """
+    Makes sure a projection fetches the given fields, so a
+    cached document can always be tagged with its keys.
+    :param projection: Projection of the lookup
+    :param fields: Fields that must be fetched
+    :return: The widened projection and the fields it added,
+    to be removed from the document afterwards
+    """
+    if projection is None:
+        return None, []
+    inclusion = any(value for field, value in projection.items() if field != ID_FIELD)
+    if inclusion:
+        # _id is fetched unless it is excluded explicitly
+        added = [
+            field for field in fields if not projection.get(field, field == ID_FIELD)
+        ]
+        return {**projection, **{field: 1 for field in added}}, added
+    added = [field for field in fields if field in projection]
+    return {
+        field: value for field, value in projection.items() if field not in added
+    }, added
+
+
+# =========================================================
+# CLASS DOCUMENT CACHE
+# =========================================================
+class DocumentCache:
+    """
+    Read-through cache of the documents of a collection. It
+    holds copies of the documents returned by point lookups,
+    and of the lookups that found nothing for a shorter
+    negative_ttl, so hot documents stop hitting the database.
+
+    Entries are tagged with the values of the key fields of
+    their document. Writes go through the repository, which
+    invalidates the tags of the documents it writes, or the
+    whole cache when the documents cannot be told. Fills
+    that started before an invalidation are discarded, so a
+    lookup racing with a write does not cache the old value.
+    Writes made by other processes are invalidated from their
+    change events, see ChangeStreamInvalidator, or seen after
+    the entries expire when there are no change streams.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, name: str, policy: CachePolicy):
+        """
+        :param name: Name of the cached collection
+        :param policy: Keys, size and lifetimes of the entries
+        """
+        self.name: str = name
+        self.policy: CachePolicy = policy
+        self.entries: TTLCache = TTLCache(policy.max_size, policy.ttl)
+        self.__lock = threading.Lock()
+        self.__tags: Dict[Tuple[str, Hashable], Set[Hashable]] = {}
+        self.__generation: int = 0
+        self.__prune_at: int = 4 * max(policy.max_size, 1)
+        self.__counters: Dict[str, int] = {
+            "negative_hits": 0,
+            "invalidations": 0,
+            "discarded_fills": 0,
+        }
+
+    # -----------------------------------------------------
+    # PROPERTY GENERATION
+    # -----------------------------------------------------
+    @property
+    def generation(self) -> int:
+        """
+        Taken before reading from the database and given back
+        to put, which ignores the fill when an invalidation
+        happened in between.
+        """
+        return self.__generation
+
+    # -----------------------------------------------------
+    # PROPERTY TAG FIELDS
+    # -----------------------------------------------------
+    @property
+    def tag_fields(self) -> Tuple[str, ...]:
+        """
+        Fields every cached document is fetched with, so its
+        entry can be invalidated by any of them.
+        """
+        return self.policy.keys + (ID_FIELD,)
+
+    # -----------------------------------------------------
+    # METHOD KEY OF
+    # -----------------------------------------------------
+    def key_of(
+        self, query: Dict, projection: Dict or None, unique: bool
+    ) -> Hashable or None:
+        """
+        :return: Key of the lookup, or None when it is not
+        cacheable, i.e. not an equality on a single key field
+        """
+        if len(query) != 1:
+            return None
+        ((field, value),) = query.items()
+        if field not in self.policy.keys or not isinstance(value, (str, int)):
+            return None
+        projected = (
+            tuple(sorted(projection.items())) if projection is not None else None
+        )
+        try:
+            hash(projected)
+        except TypeError:
+            # Projection operators such as $slice or $elemMatch
+            return None
+        return field, value, projected, unique
+
+    # -----------------------------------------------------
+    # METHOD GET
+    # -----------------------------------------------------
+    def get(self, key: Hashable):
+        """
+        :param key: Key returned by key_of
+        :return: Copy of the cached document, MISSING for a
+        cached miss, or None when the lookup is not cached
+        """
+        value = self.entries.get(key)
+        if value is MISSING:
+            with self.__lock:
+                self.__counters["negative_hits"] += 1
+            return MISSING
+        return copy.deepcopy(value) if value is not None else None
+
+    # -----------------------------------------------------
+    # METHOD PUT
+    # -----------------------------------------------------
+    def put(
+        self,
+        key: Hashable,
+        document: Dict or None,
+        generation: int,
+        added: List[str] = (),
+    ):
+        """
+        :param key: Key returned by key_of
+        :param document: Document found, None when there was no
+        match
+        :param generation: Generation taken before the read
+        :param added: Fields fetched only to tag the entry, see
+        tag_fields and widen_projection. They are removed from
+        the document
+        """
+        field, value = key[0], key[1]
+        tags = {(field, value)}
+        if document is not None:
+            tags.update(
+                (name, document[name])
+                for name in self.policy.keys
+                if isinstance(document.get(name), (str, int))
+            )
+            if document.get(ID_FIELD) is not None:
+                tags.add((ID_FIELD, document[ID_FIELD]))
+            document = copy.deepcopy(document)
+            for name in added:
+                document.pop(name, None)
+        with self.__lock:
+            if generation != self.__generation:
+                self.__counters["discarded_fills"] += 1
+                return
+            for tag in tags:
+                self.__tags.setdefault(tag, set()).add(key)
+            if len(self.__tags) > self.__prune_at:
+                self.__prune_tags()
+            if document is None:
+                self.entries.set(key, MISSING, self.policy.negative_ttl)
+            else:
+                self.entries.set(key, document)
+
+    # -----------------------------------------------------
+    # METHOD PRUNE TAGS
+    # -----------------------------------------------------
+    def __prune_tags(self):
+        # Tags of entries evicted or expired by the TTLCache
+        for tag in list(self.__tags):
+            keys = {key for key in self.__tags[tag] if key in self.entries}
+            if keys:
+                self.__tags[tag] = keys
+            else:
+                del self.__tags[tag]
+        # Pruning scans every tag: wait for the live tags to
+        # double, so its cost stays constant per put
+        self.__prune_at = max(4 * max(self.policy.max_size, 1), 2 * len(self.__tags))
+
+    # -----------------------------------------------------
+    # METHOD IS TAG
+    # -----------------------------------------------------
+    def __is_tag(self, field: str, value) -> bool:
+        if field == ID_FIELD:
+            return value is not None
+        return field in self.policy.keys and isinstance(value, (str, int))
+
+    # -----------------------------------------------------
+    # METHOD INVALIDATE
+    # -----------------------------------------------------
+    def invalidate(self, *documents: Dict):
+        """
+        Drops the entries of the documents whose key fields
+        have the given values.
+        :param documents: Dicts of field to value, e.g. the
+        filter and the new values of a write
+        """
+        tags = [
+            (field, value)
+            for document in documents
+            for field, value in document.items()
+            if self.__is_tag(field, value)
+        ]
+        with self.__lock:
+            self.__generation += 1
+            self.__counters["invalidations"] += 1
+            for tag in tags:
+                for key in self.__tags.pop(tag, ()):
+                    self.entries.delete(key)
+
+    # -----------------------------------------------------
+    # METHOD INVALIDATE WRITE
+    # -----------------------------------------------------
+    def invalidate_write(self, query: Dict or None, *documents: Dict):
+        """
+        Invalidates the entries a write may have changed.
+        :param query: Filter of the write. None for inserts,
+        whose documents identify themselves. Filters that are
+        not an equality on a key field clear the whole cache
+        :param documents: Values written
+        """
+        if query is not None and self.key_of(query, None, False) is None:
+            self.clear()
+        else:
+            self.invalidate(query or {}, *documents)
+
+    # -----------------------------------------------------
+    # METHOD CLEAR
+    # -----------------------------------------------------
+    def clear(self):
+        with self.__lock:
+            self.__generation += 1
+            self.__counters["invalidations"] += 1
+            self.__tags.clear()
+            self.entries.clear()
+
+    # -----------------------------------------------------
+    # PROPERTY STATISTICS
+    # -----------------------------------------------------
+    @property
+    def statistics(self) -> dict:
+        with self.__lock:
+            counters = dict(self.__counters)
+        return {**self.entries.statistics, **counters}
+
+
+_document_caches: Dict[str, DocumentCache] = {}
+_document_caches_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# FUNCTION GET DOCUMENT CACHE
+# ---------------------------------------------------------
+def get_document_cache(name: str, policy: CachePolicy) -> DocumentCache:
+    """
+    Returns the process-wide cache of a collection. The
+    sync and async repositories of a collection, and every
+    instance of them, share it.
+    :param name: Name of the collection
+    :param policy: Policy used when the cache is created
+    :return: DocumentCache
+    """
+    cache = _document_caches.get(name)
+    if cache is not None:
+        return cache
+    with _document_caches_lock:
+        if name not in _document_caches:
+            _document_caches[name] = DocumentCache(name, policy)
+    return _document_caches[name]
+
+
+# ---------------------------------------------------------
+# FUNCTION GET DOCUMENT CACHES
+# ---------------------------------------------------------
+def get_document_caches() -> Dict[str, DocumentCache]:
+    return dict(_document_caches)
@@ -1,9 +1,9 @@
 from abc import abstractmethod, ABCMeta
-from typing import List, Dict
+import math
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from fastapi import HTTPException, status
 from pymongo.errors import (
-    AutoReconnect,
     BulkWriteError,
     CollectionInvalid,
     ConfigurationError,
@@ -16,87 +16,470 @@ from pymongo.errors import (
     InvalidName,
     InvalidOperation,
     InvalidURI,
-    NetworkTimeout,
     PyMongoError,
     WriteError,
     WriteConcernError,
 )
 
+from app.business_objects.core.bulk import (
+    BulkResult,
+    chunked,
+    insert_operations,
+    update_by_id_operations,
+    upsert_operations,
+)
+from app.business_objects.core.errors import (
+    CircuitOpenError,
+    DuplicateEntityError,
+    EntityNotFoundError,
+    SchemaError,
+)
+from app.business_objects.core.pagination import (
+    InvalidPageTokenError,
+    KeysetPagination,
+    Page,
+)
+from app.business_objects.core.indexes import IndexSpec
+from app.business_objects.core.cache import (
+    CachePolicy,
+    DocumentCache,
+    get_document_cache,
+    MISSING,
+    widen_projection,
+)
+from app.business_objects.core.routing import Routing
+from app.business_objects.core.schema import Schema
+from app.business_objects.core.resilience import get_retry_policy
 from app.context import get_context, ServerContext
+from app.metrics.mongodb import REPOSITORY_ERRORS
 import functools
 
 
+# ---------------------------------------------------------
+# FUNCTION SERVICE UNAVAILABLE
+# ---------------------------------------------------------
+def _service_unavailable(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Database temporarily unavailable",
+        headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+    )
+
+
+# =========================================================
+# FUNCTION HANDLE MONGODB ERROR
+# =========================================================
+def handle_mongodb_error(error: Exception, logging) -> bool:
+    """
+    Logs the given Mongo error and translates it into the
+    value returned by the decorated operation. Shared by the
+    sync and async error handling decorators so both report
+    errors the same way.
+    :param error: Exception raised by the Mongo operation
+    :param logging: Logger used to report the error
+    :return: False (or raises HTTPException when applicable).
+    Transient errors and an open circuit breaker raise a 503
+    so callers never mistake them for a missing entity
+    """
+    REPOSITORY_ERRORS.increment(type(error).__name__)
+    try:
+        raise error
+    except HTTPException:
+        raise
+    except IndexError as ie:
+        logging.error(str(ie))
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    except EntityNotFoundError as not_found_error:
+        logging.debug(str(not_found_error))
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    except InvalidPageTokenError as invalid_page_token_error:
+        logging.debug(str(invalid_page_token_error))
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid page token"
+        )
+    except SchemaError as schema_error:
+        logging.debug(str(schema_error))
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(schema_error)
+        )
+    except DuplicateEntityError as duplicate_entity_error:
+        logging.error(str(duplicate_entity_error))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    except CircuitOpenError as circuit_open_error:
+        logging.warning(str(circuit_open_error))
+        raise _service_unavailable(circuit_open_error.retry_after)
+    except ConnectionFailure as connection_failure_error:
+        # AutoReconnect, NetworkTimeout and server selection
+        # timeouts: retries were exhausted or the deadline spent
+        logging.error(str(connection_failure_error))
+        raise _service_unavailable(1)
+    except ExecutionTimeout as timeout_error:
+        logging.error(str(timeout_error))
+        raise _service_unavailable(1)
+    except BulkWriteError as bwe:
+        if bwe.timeout:
+            logging.error(str(bwe))
+        logging.error("%s: %s", bwe, bwe.details.get("writeErrors", []))
+    except CollectionInvalid as collection_invalid_error:
+        logging.error(str(collection_invalid_error))
+    except InvalidURI as invalid_url_error:
+        logging.error(str(invalid_url_error))
+    except ConfigurationError as configuration_error:
+        logging.error(str(configuration_error))
+    except CursorNotFound as cursor_not_found_error:
+        logging.error(str(cursor_not_found_error))
+    except DocumentTooLarge as document_too_large_error:
+        logging.error(str(document_too_large_error))
+    except DuplicateKeyError as duplicated_key_error:
+        logging.error(str(duplicated_key_error))
+    except EncryptionError as ece:
+        logging.error(str(ece.cause))
+    except InvalidName as invalid_name_error:
+        logging.error(str(invalid_name_error))
+    except InvalidOperation as invalid_operation_error:
+        logging.error(str(invalid_operation_error))
+    except PyMongoError as pymongo_error:
+        logging.error(str(pymongo_error))
+    except WriteConcernError as write_concern_error:
+        logging.error(str(write_concern_error))
+    except WriteError as write_error:
+        logging.error(str(write_error))
+    except Exception as error:
+        logging.error(str(error))
+    return False
+
+
 # =========================================================
 # DECORATOR INJECT MONGO ERROR HANDLING
 # =========================================================
-def inject_mongodb_error_handling(func):
+def inject_mongodb_error_handling(func=None, *, idempotent: bool = True):
     """
     Decorator that centralizes and provides proper error
     handling and logging for every single Mongo operation
     without duplicating error handling code across  all
-    service methods
+    service methods. Operations run through the process-wide
+    RetryPolicy, so they are bounded by a deadline, retried
+    after transient errors when idempotent and rejected while
+    the circuit breaker is open.
     :param func: functions to be wrapped
+    :param idempotent: Whether the operation can be retried
+    safely. Use idempotent=False for inserts
     :return:
     """
-    logging = get_context().logging
+    if func is None:
+        return functools.partial(inject_mongodb_error_handling, idempotent=idempotent)
+    logging = get_context().logger(func.__module__)
+    operation = func.__qualname__
 
     @functools.wraps(func)
     def error_handling_wrapper(*args, **kwargs):
         try:
-            return func(*args, **kwargs)
-        except IndexError as ie:
-            logging.error(str(ie))
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-        except NetworkTimeout as nt:
-            logging.error(str(nt))
-        except AutoReconnect as ar:
-            logging.error(str(ar))
-        except BulkWriteError as bwe:
-            if bwe.timeout:
-                logging.error(str(bwe))
-            logging.error(str(bwe))
-        except CollectionInvalid as collection_invalid_error:
-            logging.error(str(collection_invalid_error))
-        except InvalidURI as invalid_url_error:
-            logging.error(str(invalid_url_error))
-        except ConfigurationError as configuration_error:
-            logging.error(str(configuration_error))
-        except ConnectionFailure as connection_failure_error:
-            logging.error(str(connection_failure_error))
-        except CursorNotFound as cursor_not_found_error:
-            logging.error(str(cursor_not_found_error))
-        except DocumentTooLarge as document_too_large_error:
-            logging.error(str(document_too_large_error))
-        except DuplicateKeyError as duplicated_key_error:
-            logging.error(str(duplicated_key_error))
-        except EncryptionError as ece:
-            logging.error(str(ece.cause))
-        except ExecutionTimeout as timeout_error:
-            logging.error(str(timeout_error))
-        except InvalidName as invalid_name_error:
-            logging.error(str(invalid_name_error))
-        except InvalidOperation as invalid_operation_error:
-            logging.error(str(invalid_operation_error))
-        except PyMongoError as pymongo_error:
-            logging.error(str(pymongo_error))
-        except WriteConcernError as write_concern_error:
-            logging.error(str(write_concern_error))
-        except WriteError as write_error:
-            logging.error(str(write_error))
+            return get_retry_policy().call(operation, idempotent, func, *args, **kwargs)
         except Exception as error:
-            logging.error(str(error))
-        return False
+            return handle_mongodb_error(error, logging)
 
     return error_handling_wrapper
 
 
 # =========================================================
-# CLASS HEIMDALL ENTITY REPOSITORY
+# DECORATOR INJECT ASYNC MONGO ERROR HANDLING
 # =========================================================
-class EntityRepository:
+def inject_async_mongodb_error_handling(func=None, *, idempotent: bool = True):
+    """
+    Async counterpart of inject_mongodb_error_handling for
+    coroutines that await Mongo operations.
+    :param func: coroutine function to be wrapped
+    :param idempotent: Whether the operation can be retried
+    safely. Use idempotent=False for inserts
+    :return:
+    """
+    if func is None:
+        return functools.partial(
+            inject_async_mongodb_error_handling, idempotent=idempotent
+        )
+    logging = get_context().logger(func.__module__)
+    operation = func.__qualname__
+
+    @functools.wraps(func)
+    async def error_handling_wrapper(*args, **kwargs):
+        try:
+            return await get_retry_policy().call_async(
+                operation, idempotent, func, *args, **kwargs
+            )
+        except Exception as error:
+            return handle_mongodb_error(error, logging)
+
+    return error_handling_wrapper
+
+
+# =========================================================
+# CLASS BASE ENTITY REPOSITORY
+# =========================================================
+class BaseEntityRepository:
     __metaclass__ = ABCMeta
 
-    def __init__(self, collection_name: str, context: ServerContext = get_context()):
+    def __init__(
+        self,
+        collection_name: str,
+        database,
+        context: ServerContext,
+        routing: Routing or None = None,
+    ):
+        """
+        Logic shared by EntityRepository and
+        AsyncEntityRepository that does not talk to the
+        database: routing, document cache, schema coercion,
+        pagination and bulk operation building. Subclasses
+        only implement the driver calls.
+
+        :param collection_name: Name of the MongoDB Collection
+        :param database: Sync or async database handle
+        :param context: Shared worker context that provides access to
+        database connection parameters and dependency inversion
+        :param routing: Read preference, read concern and write
+        concern of the repository, on top of the MONGO_READ_*
+        and MONGO_WRITE_CONCERN settings
+        """
+        self.db = database
+        self.routing: Routing = Routing.from_context(context).merge(routing)
+        self.entities = self.routing.apply(self.db[collection_name])
+        self.collection_name = collection_name
+        self.context: ServerContext = context
+        self.pagination_key: str = "_id"
+        policy = self.get_cache_policy()
+        self.document_cache: DocumentCache or None = (
+            get_document_cache(collection_name, policy)
+            if policy is not None and context.document_cache_enabled
+            else None
+        )
+        self.schema: Schema or None = self.get_schema()
+
+    # -----------------------------------------------------
+    # METHOD COLLECTION
+    # -----------------------------------------------------
+    def collection(self, routing: Routing or None = None):
+        """
+        :param routing: Per-call routing. Fields it leaves
+        unset keep the value of the repository routing
+        :return: Collection handle using the routing
+        """
+        if routing is None:
+            return self.entities
+        return self.routing.merge(routing).apply(self.db[self.collection_name])
+
+    # -----------------------------------------------------
+    # METHOD GET INDEX FIELDS
+    # -----------------------------------------------------
+    @abstractmethod
+    def get_index_fields(self) -> List[str]:
+        pass
+
+    # -----------------------------------------------------
+    # METHOD GET CACHE POLICY
+    # -----------------------------------------------------
+    def get_cache_policy(self) -> CachePolicy or None:
+        """
+        Caching of the point lookups of the repository, used
+        when DOCUMENT_CACHE_ENABLED is set. Repositories of
+        read-mostly collections override it; by default
+        nothing is cached.
+        :return: CachePolicy or None
+        """
+        return None
+
+    # -----------------------------------------------------
+    # METHOD GET SCHEMA
+    # -----------------------------------------------------
+    def get_schema(self) -> Schema or None:
+        """
+        Native types of the fields of the collection. Values
+        given to create, the bulk methods and the updates are
+        converted to them. By default nothing is converted.
+        :return: Schema or None
+        """
+        return None
+
+    # -----------------------------------------------------
+    # METHOD NATIVE UPDATES
+    # -----------------------------------------------------
+    def native_updates(self, document: Dict) -> Tuple[Dict, List[str]]:
+        """
+        Values that migrate a stored document to the schema,
+        see SchemaBackfill. Repositories storing fields derived
+        from the converted ones override it to update them too.
+        :param document: Stored document
+        :return: Dotted path to new value, and the paths whose
+        value cannot be converted
+        """
+        return self.schema.native_values(document)
+
+    # -----------------------------------------------------
+    # METHOD GET INDEX SPECS
+    # -----------------------------------------------------
+    def get_index_specs(self) -> List[IndexSpec]:
+        """
+        Declarative indexes of the collection. By default one
+        single field index per index field. Repositories can
+        override it to declare compound, unique, TTL or
+        partial indexes.
+        :return: List of IndexSpec
+        """
+        return [IndexSpec(field) for field in self.get_index_fields()]
+
+    # -----------------------------------------------------
+    # METHOD PAGINATION
+    # -----------------------------------------------------
+    def _pagination(
+        self,
+        query: Dict,
+        page_size: int,
+        token: str or None,
+        projection: Dict or None,
+    ) -> KeysetPagination:
+        return KeysetPagination(
+            query,
+            max(1, min(page_size, self.context.query_limit)),
+            token,
+            self.pagination_key,
+            projection,
+        )
+
+    # -----------------------------------------------------
+    # METHOD CACHE KEY
+    # -----------------------------------------------------
+    def _cache_key(
+        self,
+        query: Dict,
+        projection: Dict or None,
+        unique: bool,
+        routing: Routing or None,
+    ):
+        """
+        :return: Key of the lookup in the document cache, or
+        None when the lookup is not cached
+        """
+        if self.document_cache is None or routing is not None:
+            return None
+        return self.document_cache.key_of(query, projection, unique)
+
+    # -----------------------------------------------------
+    # METHOD CACHE PUT
+    # -----------------------------------------------------
+    def _cache_put(self, key, document: Dict or None, generation: int, added):
+        """
+        Caches a document fetched with the widened projection
+        and strips the fields added to it.
+        :return: The document as requested by the caller
+        """
+        self.document_cache.put(key, document, generation, added)
+        if document is not None:
+            for name in added:
+                document.pop(name, None)
+        return document
+
+    # -----------------------------------------------------
+    # METHOD FOUND
+    # -----------------------------------------------------
+    def _found(self, query: Dict, document: Dict or None) -> Dict:
+        """
+        :param query: Filter of the lookup
+        :param document: Document found, None when there is
+        none or False when the lookup failed
+        :return: The document
+        :raises HTTPException: 404 when no document matches,
+        503 when the lookup failed
+        """
+        if document is False:
+            # The error was logged by the error handling of the
+            # lookup; a failed lookup is not a missing entity
+            raise _service_unavailable(1)
+        if document is None:
+            return handle_mongodb_error(
+                EntityNotFoundError(self.collection_name, query),
+                self.context.logger(__name__),
+            )
+        return document
+
+    # -----------------------------------------------------
+    # METHOD COERCE
+    # -----------------------------------------------------
+    def _coerce(self, values: Dict) -> Dict:
+        """
+        :param values: Values to write
+        :return: Values converted to the schema
+        :raises HTTPException: 422 when a value cannot be
+        converted
+        """
+        if self.schema is None:
+            return values
+        try:
+            return self.schema.coerce(values)
+        except SchemaError as schema_error:
+            return handle_mongodb_error(schema_error, self.context.logger(__name__))
+
+    # -----------------------------------------------------
+    # METHOD COERCE ALL
+    # -----------------------------------------------------
+    def _coerce_all(self, documents: Iterable[Dict]) -> List[Dict]:
+        """
+        Converts the whole batch before the first write, so an
+        invalid document rejects the batch instead of leaving
+        the documents of the previous chunks written.
+        """
+        return [self._coerce(document) for document in documents]
+
+    # -----------------------------------------------------
+    # METHOD INVALIDATE
+    # -----------------------------------------------------
+    def _invalidate(self, query: Dict or None, values: Dict):
+        if self.document_cache is not None:
+            self.document_cache.invalidate_write(query, values)
+
+    # -----------------------------------------------------
+    # METHOD CHUNKS
+    # -----------------------------------------------------
+    def _chunks(self, operations: Iterable, chunk_size: int or None):
+        return chunked(operations, chunk_size or self.context.bulk_chunk_size)
+
+    # -----------------------------------------------------
+    # METHOD BULK WRITTEN
+    # -----------------------------------------------------
+    def _bulk_written(self):
+        if self.document_cache is not None:
+            # Bulk operations can touch any document
+            self.document_cache.clear()
+
+    # -----------------------------------------------------
+    # METHOD INSERT OPERATIONS
+    # -----------------------------------------------------
+    def _insert_operations(self, documents: Iterable[Dict]):
+        return insert_operations(self._coerce_all(documents))
+
+    # -----------------------------------------------------
+    # METHOD UPSERT OPERATIONS
+    # -----------------------------------------------------
+    def _upsert_operations(self, documents: Iterable[Dict], key: str):
+        return upsert_operations(self._coerce_all(documents), key)
+
+    # -----------------------------------------------------
+    # METHOD UPDATE BY ID OPERATIONS
+    # -----------------------------------------------------
+    def _update_by_id_operations(self, updates: Dict[str, Dict]):
+        return update_by_id_operations(
+            {issue_id: self._coerce(values) for issue_id, values in updates.items()}
+        )
+
+
+# =========================================================
+# CLASS HEIMDALL ENTITY REPOSITORY
+# =========================================================
+class EntityRepository(BaseEntityRepository):
+    def __init__(
+        self,
+        collection_name: str,
+        context: ServerContext = get_context(),
+        routing: Routing or None = None,
+    ):
         """
         EntityRepository is not designed to be instantiated
         directly because it is an abstract class. This class
@@ -107,90 +490,322 @@ class EntityRepository:
         :param collection_name: Name of the MongoDB Collection
         :param context: Shared worker context that provides access to
         database connection parameters and dependency inversion
+        :param routing: Read preference, read concern and write
+        concern of the repository, on top of the MONGO_READ_*
+        and MONGO_WRITE_CONCERN settings
         """
-        self.db = context.database
-        self.entities = self.db[collection_name]
-        self.collection_name = collection_name
-        self.context: ServerContext = context
+        super().__init__(collection_name, context.database, context, routing)
 
     # -----------------------------------------------------
-    # TRAVERSE CURSOR AND COPY
+    # METHOD STREAM
     # -----------------------------------------------------
-    @staticmethod
-    def traverse_cursor_and_copy(cursor):
+    def stream(
+        self,
+        query: Dict,
+        projection: Dict or None = None,
+        batch_size: int or None = None,
+        limit: int = 0,
+        routing: Routing or None = None,
+    ) -> Iterator[Dict]:
         """
-        Helper function that creates a local copy in-memory
-        of the results obtained after traversing a cursor
-        that is created as a result of a query with high
-        projection. This enables data transformations on the
-        results without losing the state of the returned
-        documents.
+        Lazily iterates over the documents that match the
+        given filter. Documents are fetched from the server in
+        batches and handed over one at a time, so the full
+        result set is never held in memory. Errors raised
+        while iterating are propagated to the caller.
 
-        :param cursor: Iterable cursor that points to the
-        results from the query.
-        :return: A local copy (stored in Heap memory segment)
-        of results (List of dictionaries).
+        :param query: A dictionary containing a valid MongoDB
+        filter
+        :param projection: Optional MongoDB projection
+        :param batch_size: Number of documents per batch.
+        Defaults to QUERY_BATCH_SIZE
+        :param limit: Maximum number of documents (0 = no limit)
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: Iterator of documents
         """
-        result_set: list = []
-        for result in cursor:
-            result_set.append(result.copy())
-        return result_set
+        with self.collection(routing).find(
+            query,
+            projection,
+            batch_size=batch_size or self.context.query_batch_size,
+            limit=limit,
+        ) as cursor:
+            yield from cursor
 
     # -----------------------------------------------------
     # METHOD GET
     # -----------------------------------------------------
     @inject_mongodb_error_handling
-    def get(self, query: Dict):
+    def get(
+        self,
+        query: Dict,
+        projection: Dict or None = None,
+        routing: Routing or None = None,
+    ):
         """
         Get a set of documents on the given collection based
         on a filter (represented in Python as a dictionary).
 
         :param query: A dictionary containing a valid MongoDB
         filter
-        :return: Local copy of results
+        :param projection: Optional MongoDB projection
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: List of results
         """
-        return self.traverse_cursor_and_copy(
-            self.entities.find(query).limit(self.context.query_limit)
+        return list(
+            self.stream(
+                query,
+                projection=projection,
+                limit=self.context.query_limit,
+                routing=routing,
+            )
         )
 
     # -----------------------------------------------------
-    # METHOD GET BY ID
+    # METHOD PAGINATE
+    # -----------------------------------------------------
+    @inject_mongodb_error_handling
+    def paginate(
+        self,
+        query: Dict,
+        page_size: int,
+        token: str or None = None,
+        projection: Dict or None = None,
+        routing: Routing or None = None,
+    ) -> Page:
+        """
+        Keyset pagination ordered by pagination_key. Latency
+        does not depend on the page depth because pages are
+        located with a range filter on the indexed key rather
+        than skipping documents.
+
+        :param query: A dictionary containing a valid MongoDB
+        filter
+        :param page_size: Documents per page, capped to
+        QUERY_LIMIT
+        :param token: Continuation token of a previous page.
+        Tokens encode the direction (forward / backward)
+        :param projection: Optional MongoDB projection
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: Page
+        :raises InvalidPageTokenError: If the token is not valid
+        """
+        pagination = self._pagination(query, page_size, token, projection)
+        documents = list(
+            self.collection(routing).find(
+                pagination.filter,
+                pagination.fetch_projection,
+                sort=pagination.sort,
+                limit=pagination.limit,
+            )
+        )
+        return pagination.build_page(documents)
+
+    # -----------------------------------------------------
+    # METHOD FIND ONE
+    # -----------------------------------------------------
+    def find_one(
+        self,
+        query: Dict,
+        projection: Dict or None = None,
+        unique: bool = False,
+        routing: Routing or None = None,
+    ) -> Dict:
+        """
+        Point lookup of a single document. Only the matching
+        document is transferred, instead of up to QUERY_LIMIT
+        documents. Lookups by a key field of the cache policy
+        are served from the document cache of the repository,
+        unless a routing is given.
+
+        :param query: A dictionary containing a valid MongoDB
+        filter
+        :param projection: Optional MongoDB projection
+        :param unique: When True, fails if more than one
+        document matches the query
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: The matching document
+        :raises EntityNotFoundError: If no document matches
+        :raises DuplicateEntityError: If unique is True and
+        more than one document matches
+        :raises HTTPException: 503 if the lookup fails
+        """
+        key = self._cache_key(query, projection, unique, routing)
+        if key is None:
+            document = self.__find_document(query, projection, unique, routing)
+        else:
+            cache = self.document_cache
+            document = cache.get(key)
+            if document is None:
+                generation = cache.generation
+                widened, added = widen_projection(projection, cache.tag_fields)
+                document = self.__find_document(query, widened, unique, routing)
+                if document is not False:
+                    document = self._cache_put(key, document, generation, added)
+            elif document is MISSING:
+                document = None
+        return self._found(query, document)
+
+    # -----------------------------------------------------
+    # METHOD FIND DOCUMENT
     # -----------------------------------------------------
     @inject_mongodb_error_handling
-    def get_by_id(self, issue_id: str) -> Dict or None:
+    def __find_document(
+        self,
+        query: Dict,
+        projection: Dict or None,
+        unique: bool,
+        routing: Routing or None,
+    ) -> Dict or None:
+        if unique:
+            documents = list(
+                self.stream(query, projection, batch_size=2, limit=2, routing=routing)
+            )
+            if len(documents) > 1:
+                raise DuplicateEntityError(self.collection_name, query)
+            return documents[0] if documents else None
+        return self.collection(routing).find_one(query, projection)
+
+    # -----------------------------------------------------
+    # METHOD GET BY ID
+    # -----------------------------------------------------
+    def get_by_id(
+        self,
+        issue_id: str,
+        projection: Dict or None = None,
+        routing: Routing or None = None,
+    ) -> Dict:
         """
         Given an issue_id (Internal unique identifier for
         ControlDB), it gets the entity with matching id if it
         exists
         :param issue_id: Unique ControlDB identifier for the
         entity
-        :return: Dict if entity exists or None if not found
+        :param projection: Optional MongoDB projection
+        :param routing: Optional per-call routing, e.g. to read
+        from secondaries or wait for a write concern
+        :return: Dict if entity exists. Raises HTTP 404 if not
+        found, HTTP 503 if the lookup fails
         """
-        return self.get({"id": issue_id}).pop()
+        return self.find_one({"id": issue_id}, projection, unique=True, routing=routing)
 
     # -----------------------------------------------------
     # METHOD UPDATE ONE
     # -----------------------------------------------------
     @inject_mongodb_error_handling
-    def update_one(self, issue_id: str, new_values: dict):
-        return self.entities.update_one({"id": issue_id}, {"$set": new_values})
+    def update_one(
+        self, issue_id: str, new_values: dict, routing: Routing or None = None
+    ):
+        new_values = self._coerce(new_values)
+        try:
+            return self.collection(routing).update_one(
+                {"id": issue_id}, {"$set": new_values}
+            )
+        finally:
+            self._invalidate({"id": issue_id}, new_values)
 
     # -----------------------------------------------------
     # METHOD UPDATE MANY
     # -----------------------------------------------------
     @inject_mongodb_error_handling
-    def update_many(self, filter_query: dict, new_values: dict):
-        return self.entities.update_many(filter_query, {"$set": new_values})
+    def update_many(
+        self, filter_query: dict, new_values: dict, routing: Routing or None = None
+    ):
+        new_values = self._coerce(new_values)
+        try:
+            return self.collection(routing).update_many(
+                filter_query, {"$set": new_values}
+            )
+        finally:
+            self._invalidate(filter_query, new_values)
 
     # -----------------------------------------------------
     # METHOD CREATE
     # -----------------------------------------------------
-    def create(self, values: dict):
-        return self.entities.insert_one(values).inserted_id
+    def create(self, values: dict, routing: Routing or None = None):
+        values = self._coerce(values)
+        try:
+            return self.collection(routing).insert_one(values).inserted_id
+        finally:
+            self._invalidate(None, values)
 
     # -----------------------------------------------------
-    # METHOD GET INDEX FIELDS
+    # METHOD BULK WRITE
     # -----------------------------------------------------
-    @abstractmethod
-    def get_index_fields(self) -> List[str]:
-        pass
+    @inject_mongodb_error_handling(idempotent=False)
+    def bulk_write(
+        self,
+        operations: Iterable,
+        chunk_size: int or None = None,
+        routing: Routing or None = None,
+    ) -> BulkResult:
+        """
+        Applies the operations with unordered bulk writes of
+        chunk_size operations, i.e. one round-trip per chunk
+        instead of one per operation. A failing item does not
+        stop the rest of its chunk nor the following chunks;
+        failures are reported per item in the result.
+
+        :param operations: Iterable of pymongo write operations
+        :param chunk_size: Operations per bulk write. Defaults
+        to MONGO_BULK_CHUNK_SIZE
+        :param routing: Optional per-call routing, e.g. to wait
+        for a majority write concern
+        :return: BulkResult
+        """
+        entities = self.collection(routing)
+        result = BulkResult()
+        offset: int = 0
+        try:
+            for chunk in self._chunks(operations, chunk_size):
+                try:
+                    result.add_result(entities.bulk_write(chunk, ordered=False))
+                except BulkWriteError as bulk_write_error:
+                    result.add_error_details(bulk_write_error.details, offset)
+                offset += len(chunk)
+        finally:
+            self._bulk_written()
+        return result
+
+    # -----------------------------------------------------
+    # METHOD CREATE MANY
+    # -----------------------------------------------------
+    def create_many(
+        self, documents: Iterable[Dict], chunk_size: int or None = None
+    ) -> BulkResult:
+        return self.bulk_write(self._insert_operations(documents), chunk_size)
+
+    # -----------------------------------------------------
+    # METHOD UPSERT MANY
+    # -----------------------------------------------------
+    def upsert_many(
+        self,
+        documents: Iterable[Dict],
+        key: str = "id",
+        chunk_size: int or None = None,
+    ) -> BulkResult:
+        """
+        Inserts or updates documents matched by key.
+        :param documents: Documents to upsert
+        :param key: Field that identifies each document
+        :param chunk_size: Operations per bulk write
+        :return: BulkResult
+        """
+        return self.bulk_write(self._upsert_operations(documents, key), chunk_size)
+
+    # -----------------------------------------------------
+    # METHOD UPDATE MANY BY ID
+    # -----------------------------------------------------
+    def update_many_by_id(
+        self, updates: Dict[str, Dict], chunk_size: int or None = None
+    ) -> BulkResult:
+        """
+        Sets different values on many documents.
+        :param updates: Dict of id to the values to set
+        :param chunk_size: Operations per bulk write
+        :return: BulkResult
+        """
+        return self.bulk_write(self._update_by_id_operations(updates), chunk_size)
@@ -0,0 +1,65 @@
+from typing import List
+
+
+# =========================================================
+# CLASS ENTITY NOT FOUND ERROR
+# =========================================================
+class EntityNotFoundError(LookupError):
+    """
+    Raised by point lookups when no document matches the
+    query. Translated into an HTTP 404 by the Mongo error
+    handling decorators.
+    """
+
+    def __init__(self, collection_name: str, query: dict):
+        super().__init__(f"No document in {collection_name} matches {query}")
+        self.collection_name: str = collection_name
+        self.query: dict = query
+
+
+# =========================================================
+# CLASS DUPLICATE ENTITY ERROR
+# =========================================================
+class DuplicateEntityError(LookupError):
+    """
+    Raised by point lookups that enforce uniqueness when
+    more than one document matches the query.
+    """
+
+    def __init__(self, collection_name: str, query: dict):
+        super().__init__(f"More than one document in {collection_name} matches {query}")
+        self.collection_name: str = collection_name
+        self.query: dict = query
+
+
+# =========================================================
+# CLASS CIRCUIT OPEN ERROR
+# =========================================================
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of sending an operation to MongoDB while
+    the circuit breaker is open. Translated into an HTTP 503
+    by the Mongo error handling decorators.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"MongoDB circuit breaker is open, retry in {retry_after:.1f}s"
+        )
+        self.retry_after: float = retry_after
+
+
+# =========================================================
+# CLASS SCHEMA ERROR
+# =========================================================
+class SchemaError(ValueError):
+    """
+    Raised when values of a document cannot be converted to
+    the types declared by the schema of its repository.
+    Translated into an HTTP 422 by the Mongo error handling
+    decorators.
+    """
+
+    def __init__(self, fields: List[str]):
+        super().__init__(f"Invalid value for {', '.join(fields)}")
+        self.fields: List[str] = fields
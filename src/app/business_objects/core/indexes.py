@@ -0,0 +1,277 @@
+import threading
+from typing import Dict, List, Tuple
+
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+
+from app.context import get_context
+
+
+# =========================================================
+# CLASS INDEX SPEC
+# =========================================================
+class IndexSpec:
+    """
+    Declarative description of an index. Repositories return
+    a list of IndexSpec from get_index_specs() and the
+    IndexManager reconciles them against the live collection.
+    Supports single field, compound, unique, TTL and partial
+    indexes.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        keys: str or List[Tuple[str, int]],
+        unique: bool = False,
+        expire_after_seconds: int or None = None,
+        partial_filter: Dict or None = None,
+        name: str or None = None,
+    ):
+        """
+        :param keys: Field name or list of (field, direction)
+        pairs for compound indexes
+        :param unique: Whether the index enforces uniqueness
+        :param expire_after_seconds: TTL in seconds (TTL index)
+        :param partial_filter: Filter expression of a partial
+        index
+        :param name: Index name. Defaults to the name MongoDB
+        generates from the keys
+        """
+        if isinstance(keys, str):
+            keys = [(keys, ASCENDING)]
+        self.keys: List[Tuple[str, int]] = list(keys)
+        self.unique: bool = unique
+        self.expire_after_seconds: int or None = expire_after_seconds
+        self.partial_filter: Dict or None = partial_filter
+        self.name: str = name or "_".join(
+            f"{field}_{direction}" for field, direction in self.keys
+        )
+
+    # -----------------------------------------------------
+    # METHOD TO INDEX MODEL
+    # -----------------------------------------------------
+    def to_index_model(self) -> IndexModel:
+        options: dict = {"name": self.name, "background": True}
+        if self.unique:
+            options["unique"] = True
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        if self.partial_filter is not None:
+            options["partialFilterExpression"] = self.partial_filter
+        return IndexModel(self.keys, **options)
+
+    # -----------------------------------------------------
+    # METHOD HAS SAME KEYS
+    # -----------------------------------------------------
+    def has_same_keys(self, index_information: dict) -> bool:
+        return [tuple(key) for key in index_information["key"]] == self.keys
+
+    # -----------------------------------------------------
+    # METHOD HAS SAME OPTIONS
+    # -----------------------------------------------------
+    def has_same_options(self, index_information: dict) -> bool:
+        options = (
+            bool(index_information.get("unique", False)),
+            index_information.get("expireAfterSeconds"),
+            index_information.get("partialFilterExpression"),
+        )
+        return options == (self.unique, self.expire_after_seconds, self.partial_filter)
+
+    # -----------------------------------------------------
+    # METHOD STR
+    # -----------------------------------------------------
+    def __str__(self) -> str:
+        return self.name
+
+
+# =========================================================
+# CLASS INDEX DRIFT
+# =========================================================
+class IndexDrift:
+    """
+    Differences between the declared indexes of a repository
+    and the indexes that exist on its collection.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        collection_name: str,
+        missing: List[IndexSpec],
+        changed: Dict[str, IndexSpec],
+        extra: List[str],
+    ):
+        """
+        :param collection_name: Name of the collection
+        :param missing: Declared indexes that do not exist
+        :param changed: Existing index names whose options
+        differ from the declaration, with the declared spec
+        :param extra: Existing index names that are not
+        declared
+        """
+        self.collection_name: str = collection_name
+        self.missing: List[IndexSpec] = missing
+        self.changed: Dict[str, IndexSpec] = changed
+        self.extra: List[str] = extra
+
+    # -----------------------------------------------------
+    # PROPERTY IN SYNC
+    # -----------------------------------------------------
+    @property
+    def in_sync(self) -> bool:
+        return not (self.missing or self.changed or self.extra)
+
+    # -----------------------------------------------------
+    # METHOD DICT
+    # -----------------------------------------------------
+    def dict(self) -> dict:
+        return {
+            "collection": self.collection_name,
+            "missing": [str(spec) for spec in self.missing],
+            "changed": list(self.changed.keys()),
+            "extra": self.extra,
+        }
+
+
+# ---------------------------------------------------------
+# FUNCTION COMPUTE INDEX DRIFT
+# ---------------------------------------------------------
+def compute_index_drift(
+    collection_name: str, specs: List[IndexSpec], index_information: Dict[str, dict]
+) -> IndexDrift:
+    """
+    Compares declared indexes with the output of
+    Collection.index_information(). Indexes are matched by
+    key pattern, so an index created with another name is
+    not reported as missing.
+    :param collection_name: Name of the collection
+    :param specs: Declared indexes
+    :param index_information: Live indexes of the collection
+    :return: IndexDrift
+    """
+    existing = {
+        name: information
+        for name, information in index_information.items()
+        if name != "_id_"
+    }
+    missing: List[IndexSpec] = []
+    changed: Dict[str, IndexSpec] = {}
+    matched: set = set()
+    for spec in specs:
+        name = next(
+            (
+                name
+                for name, information in existing.items()
+                if spec.has_same_keys(information)
+            ),
+            None,
+        )
+        if name is None:
+            missing.append(spec)
+            continue
+        matched.add(name)
+        if not spec.has_same_options(existing[name]):
+            changed[name] = spec
+    extra = [name for name in existing if name not in matched]
+    return IndexDrift(collection_name, missing, changed, extra)
+
+
+# =========================================================
+# CLASS INDEX MANAGER
+# =========================================================
+class IndexManager:
+    """
+    Reconciles the indexes declared by repositories with the
+    live collections. Missing indexes are created; changed
+    and undeclared indexes are only reported unless dropping
+    them is explicitly requested.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, repositories: list):
+        """
+        :param repositories: Repositories (EntityRepository)
+        whose indexes are managed
+        """
+        self.repositories: list = repositories
+        self.logging = get_context().logger(__name__)
+
+    # -----------------------------------------------------
+    # METHOD DRIFT
+    # -----------------------------------------------------
+    def drift(self) -> List[IndexDrift]:
+        return [
+            compute_index_drift(
+                repository.collection_name,
+                repository.get_index_specs(),
+                repository.entities.index_information(),
+            )
+            for repository in self.repositories
+        ]
+
+    # -----------------------------------------------------
+    # METHOD RECONCILE
+    # -----------------------------------------------------
+    def reconcile(
+        self, drop_changed: bool = False, drop_extra: bool = False
+    ) -> List[IndexDrift]:
+        """
+        Creates missing indexes and optionally rebuilds
+        changed indexes and drops undeclared ones.
+        :param drop_changed: Drop and recreate indexes whose
+        options differ from the declaration
+        :param drop_extra: Drop indexes that are not declared
+        :return: Drift found before reconciling
+        """
+        report: List[IndexDrift] = []
+        for repository in self.repositories:
+            try:
+                drift = compute_index_drift(
+                    repository.collection_name,
+                    repository.get_index_specs(),
+                    repository.entities.index_information(),
+                )
+                to_create: List[IndexSpec] = list(drift.missing)
+                if drop_changed:
+                    for name, spec in drift.changed.items():
+                        repository.entities.drop_index(name)
+                        to_create.append(spec)
+                if drop_extra:
+                    for name in drift.extra:
+                        repository.entities.drop_index(name)
+                if to_create:
+                    repository.entities.create_indexes(
+                        [spec.to_index_model() for spec in to_create]
+                    )
+                if not drift.in_sync:
+                    self.logging.warning("Index drift: %s", drift.dict())
+                report.append(drift)
+            except PyMongoError as error:
+                self.logging.error(
+                    "Unable to reconcile indexes of %s: %s",
+                    repository.collection_name,
+                    error,
+                )
+        return report
+
+    # -----------------------------------------------------
+    # METHOD RECONCILE IN BACKGROUND
+    # -----------------------------------------------------
+    def reconcile_in_background(self) -> threading.Thread:
+        """
+        Reconciles indexes in a daemon thread so the worker
+        can start serving requests while indexes are built.
+        :return: The started thread
+        """
+        thread = threading.Thread(
+            target=self.reconcile, name="index-reconciliation", daemon=True
+        )
+        thread.start()
+        return thread
@@ -0,0 +1,245 @@
+import threading
+from typing import Dict, List
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.business_objects.core.cache import get_document_caches
+from app.context import ServerContext
+
+RUNNING: str = "running"
+STOPPED: str = "stopped"
+TTL_ONLY: str = "ttl-only"
+
+# Servers that are not replica sets do not support change streams
+CHANGE_STREAMS_NOT_SUPPORTED: tuple = (40573, 40415)
+# The resume token is no longer in the oplog, events were lost
+CHANGE_STREAM_HISTORY_LOST: tuple = (280, 286)
+# Events of other operations (drop, rename, invalidate...) clear the cache
+DOCUMENT_OPERATIONS: tuple = ("insert", "update", "replace", "delete")
+MAX_BACKOFF: float = 30.0
+
+
+# =========================================================
+# CLASS CHANGE STREAM INVALIDATOR
+# =========================================================
+class ChangeStreamInvalidator:
+    """
+    Background listener that consumes the change stream of
+    the cached collections and invalidates the entries of the
+    local document caches, so a write made by another worker
+    or container is not served from the cache until the
+    entry expires.
+
+    The last resume token is kept so the stream resumes after
+    a network error or a failover without missing events.
+    When the events cannot be resumed, the caches are
+    cleared. Deployments that are not replica sets
+    (MONGO_CLUSTER=0) have no change streams; caches then
+    rely on the TTL of their entries only.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, context: ServerContext, collection_names: List[str]):
+        """
+        :param context: Server context
+        :param collection_names: Collections whose changes
+        invalidate the document cache of the same name
+        """
+        self.context: ServerContext = context
+        self.collection_names: List[str] = list(collection_names)
+        self.state: str = STOPPED
+        self.resume_token: dict or None = None
+        self.__stopped = threading.Event()
+        self.__thread: threading.Thread or None = None
+        self.__lock = threading.Lock()
+        self.__counters: Dict[str, int] = {"events": 0, "errors": 0, "cache_clears": 0}
+
+    # -----------------------------------------------------
+    # PROPERTY PIPELINE
+    # -----------------------------------------------------
+    @property
+    def pipeline(self) -> List[dict]:
+        return [
+            {"$match": {"ns.coll": {"$in": self.collection_names}}},
+            {
+                "$project": {
+                    "operationType": 1,
+                    "ns": 1,
+                    "documentKey": 1,
+                    "fullDocument": 1,
+                    "updateDescription.updatedFields": 1,
+                }
+            },
+        ]
+
+    # -----------------------------------------------------
+    # METHOD START
+    # -----------------------------------------------------
+    def start(self) -> threading.Thread or None:
+        """
+        Starts the listener in a daemon thread.
+        :return: The started thread, or None when there is
+        nothing to listen to or the deployment has no change
+        streams
+        """
+        if not self.collection_names:
+            return None
+        if not self.context.is_cluster:
+            self.state = TTL_ONLY
+            self.context.logger(__name__).info(
+                "Change streams need a replica set, cached documents expire by TTL only"
+            )
+            return None
+        self.__stopped.clear()
+        self.state = RUNNING
+        self.__thread = threading.Thread(
+            target=self.__run, name="change-stream-invalidator", daemon=True
+        )
+        self.__thread.start()
+        return self.__thread
+
+    # -----------------------------------------------------
+    # METHOD STOP
+    # -----------------------------------------------------
+    def stop(self, timeout: float = 5.0):
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+        if self.state == RUNNING:
+            self.state = STOPPED
+
+    # -----------------------------------------------------
+    # METHOD RUN
+    # -----------------------------------------------------
+    def __run(self):
+        failures = 0
+        while not self.__stopped.is_set():
+            try:
+                self.__consume()
+                failures = 0
+            except OperationFailure as error:
+                if error.code in CHANGE_STREAMS_NOT_SUPPORTED:
+                    self.state = TTL_ONLY
+                    self.context.logger(__name__).warning(
+                        "Change streams are not supported, "
+                        "cached documents expire by TTL only"
+                    )
+                    return
+                if error.code in CHANGE_STREAM_HISTORY_LOST:
+                    self.resume_token = None
+                    self.clear_caches()
+                failures += 1
+                self.__failed(error, failures)
+            except PyMongoError as error:
+                failures += 1
+                self.__failed(error, failures)
+
+    # -----------------------------------------------------
+    # METHOD CONSUME
+    # -----------------------------------------------------
+    def __consume(self):
+        with self.context.database.watch(
+            self.pipeline, resume_after=self.resume_token, max_await_time_ms=1000
+        ) as stream:
+            if self.resume_token is None:
+                # Nothing tells what changed before the stream
+                # was opened: start from an empty cache
+                self.clear_caches()
+            while not self.__stopped.is_set() and stream.alive:
+                change = stream.try_next()
+                if change is not None:
+                    self.apply(change)
+                self.resume_token = stream.resume_token
+
+    # -----------------------------------------------------
+    # METHOD FAILED
+    # -----------------------------------------------------
+    def __failed(self, error: Exception, failures: int):
+        with self.__lock:
+            self.__counters["errors"] += 1
+        self.context.logger(__name__).error("Change stream interrupted: %s", error)
+        self.__stopped.wait(min(2**failures, MAX_BACKOFF))
+
+    # -----------------------------------------------------
+    # METHOD APPLY
+    # -----------------------------------------------------
+    def apply(self, change: dict):
+        """
+        Invalidates the cached entries a change event
+        affects.
+        :param change: Change event
+        """
+        with self.__lock:
+            self.__counters["events"] += 1
+        cache = get_document_caches().get(change.get("ns", {}).get("coll"))
+        if cache is None:
+            return
+        operation = change.get("operationType")
+        if operation not in DOCUMENT_OPERATIONS:
+            cache.clear()
+            return
+        cache.invalidate(
+            change.get("documentKey") or {},
+            change.get("fullDocument") or {},
+            change.get("updateDescription", {}).get("updatedFields") or {},
+        )
+
+    # -----------------------------------------------------
+    # METHOD CLEAR CACHES
+    # -----------------------------------------------------
+    def clear_caches(self):
+        caches = get_document_caches()
+        for name in self.collection_names:
+            if name in caches:
+                caches[name].clear()
+        with self.__lock:
+            self.__counters["cache_clears"] += 1
+
+    # -----------------------------------------------------
+    # PROPERTY STATISTICS
+    # -----------------------------------------------------
+    @property
+    def statistics(self) -> dict:
+        with self.__lock:
+            counters = dict(self.__counters)
+        return {
+            "state": self.state,
+            "collections": self.collection_names,
+            "resumable": self.resume_token is not None,
+            **counters,
+        }
+
+
+_invalidator: dict = {}
+
+
+# ---------------------------------------------------------
+# FUNCTION INSTALL CHANGE STREAM INVALIDATOR
+# ---------------------------------------------------------
+def install_change_stream_invalidator(
+    context: ServerContext, collection_names: List[str]
+) -> ChangeStreamInvalidator:
+    """
+    Starts the invalidator of the worker process, replacing
+    a previous one.
+    :param context: Server context
+    :param collection_names: Cached collections
+    :return: ChangeStreamInvalidator
+    """
+    previous = _invalidator.pop("instance", None)
+    if previous is not None:
+        previous.stop()
+    invalidator = ChangeStreamInvalidator(context, collection_names)
+    invalidator.start()
+    _invalidator["instance"] = invalidator
+    return invalidator
+
+
+# ---------------------------------------------------------
+# FUNCTION GET CHANGE STREAM INVALIDATOR
+# ---------------------------------------------------------
+def get_change_stream_invalidator() -> ChangeStreamInvalidator or None:
+    return _invalidator.get("instance")
@@ -0,0 +1,196 @@
+import datetime
+import time
+from typing import Dict, List
+
+from pymongo import ASCENDING, UpdateOne
+
+from app.business_objects.core.dao import EntityRepository
+from app.business_objects.core.routing import PRIMARY
+from app.business_objects.core.schema import get_path
+
+CHECKPOINT_COLLECTION: str = "migrations"
+# Documents whose values cannot be converted, listed in the
+# logs; the rest are only counted
+MAX_LOGGED_FAILURES: int = 100
+
+
+# =========================================================
+# CLASS SCHEMA BACKFILL
+# =========================================================
+class SchemaBackfill:
+    """
+    Converts the documents stored before the schema of a
+    repository to its native types. Documents are scanned in
+    _id order, in batches of batch_size, and only those that
+    still hold string values in a field of the schema are
+    fetched. Each batch is written with one unordered bulk
+    write, then the last _id scanned is saved in the
+    migrations collection, so an interrupted backfill resumes
+    where it stopped.
+
+    Updates are guarded by the values they replace: a
+    document written concurrently, e.g. by an ingestion, is
+    left to that write. Documents with values that cannot be
+    converted are skipped, counted and logged.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        repository: EntityRepository,
+        batch_size: int or None = None,
+        pause: float = 0,
+    ):
+        """
+        :param repository: Repository whose schema is applied
+        :param batch_size: Documents per batch. Defaults to
+        MONGO_BULK_CHUNK_SIZE
+        :param pause: Seconds to wait between batches, to leave
+        room for the regular load
+        """
+        if repository.schema is None:
+            raise ValueError(f"{repository.collection_name} has no schema")
+        self.repository: EntityRepository = repository
+        self.batch_size: int = batch_size or repository.context.bulk_chunk_size
+        self.pause: float = pause
+        self.name: str = f"{repository.collection_name}.native-types"
+        self.checkpoints = repository.db[CHECKPOINT_COLLECTION]
+        self.__logged_failures: int = 0
+
+    # -----------------------------------------------------
+    # PROPERTY CHECKPOINT
+    # -----------------------------------------------------
+    @property
+    def checkpoint(self) -> Dict:
+        """
+        :return: Last _id scanned and counters of the previous
+        runs, empty when the backfill never ran
+        """
+        return self.checkpoints.find_one({"_id": self.name}) or {}
+
+    # -----------------------------------------------------
+    # METHOD RESET
+    # -----------------------------------------------------
+    def reset(self):
+        """
+        Forgets the checkpoint, so the next run scans the whole
+        collection again, e.g. to retry documents that could
+        not be converted once they are fixed.
+        """
+        self.checkpoints.delete_one({"_id": self.name})
+
+    # -----------------------------------------------------
+    # METHOD RUN
+    # -----------------------------------------------------
+    def run(self, max_batches: int or None = None, dry_run: bool = False) -> Dict:
+        """
+        :param max_batches: Batches to process before stopping,
+        None to process the whole collection
+        :param dry_run: Count the documents to convert without
+        writing them nor the checkpoint
+        :return: Counters of this run: scanned, converted,
+        conflicts (changed concurrently) and failed documents,
+        and whether the backfill is complete
+        """
+        statistics = {"scanned": 0, "converted": 0, "conflicts": 0, "failed": 0}
+        last_id = self.checkpoint.get("last_id")
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            if batches and self.pause:
+                time.sleep(self.pause)
+            documents = self.__fetch(last_id)
+            if not documents:
+                statistics["complete"] = True
+                return statistics
+            counters = self.__convert(documents, dry_run)
+            last_id = documents[-1]["_id"]
+            for name, value in counters.items():
+                statistics[name] += value
+            if not dry_run:
+                self.__save(last_id, counters)
+            batches += 1
+        statistics["complete"] = False
+        return statistics
+
+    # -----------------------------------------------------
+    # METHOD FETCH
+    # -----------------------------------------------------
+    def __fetch(self, last_id) -> List[Dict]:
+        query = dict(self.repository.schema.pending_query)
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        # Updates are guarded by the values read, which must
+        # be the latest ones
+        cursor = (
+            self.repository.collection(PRIMARY)
+            .find(query)
+            .sort("_id", ASCENDING)
+            .limit(self.batch_size)
+        )
+        with cursor:
+            return list(cursor)
+
+    # -----------------------------------------------------
+    # METHOD CONVERT
+    # -----------------------------------------------------
+    def __convert(self, documents: List[Dict], dry_run: bool) -> Dict[str, int]:
+        operations: List[UpdateOne] = []
+        failed = 0
+        for document in documents:
+            values, invalid = self.repository.native_updates(document)
+            if invalid:
+                failed += 1
+                self.__log_failure(document["_id"], invalid)
+                continue
+            if not values:
+                continue
+            guard = {"_id": document["_id"]}
+            guard.update((path, get_path(document, path)[1]) for path in values)
+            operations.append(UpdateOne(guard, {"$set": values}))
+        counters = {
+            "scanned": len(documents),
+            "converted": len(operations),
+            "conflicts": 0,
+            "failed": failed,
+        }
+        if operations and not dry_run:
+            result = self.repository.bulk_write(operations, chunk_size=len(operations))
+            if not result:
+                raise RuntimeError(
+                    f"{self.name}: the batch after {documents[0]['_id']} could not be "
+                    "written, run the backfill again to resume"
+                )
+            counters["converted"] = result.matched
+            counters["failed"] += len(result.errors)
+            counters["conflicts"] = (
+                len(operations) - result.matched - len(result.errors)
+            )
+        return counters
+
+    # -----------------------------------------------------
+    # METHOD SAVE
+    # -----------------------------------------------------
+    def __save(self, last_id, counters: Dict[str, int]):
+        self.checkpoints.update_one(
+            {"_id": self.name},
+            {
+                "$set": {"last_id": last_id, "updated_at": datetime.datetime.utcnow()},
+                "$inc": counters,
+            },
+            upsert=True,
+        )
+
+    # -----------------------------------------------------
+    # METHOD LOG FAILURE
+    # -----------------------------------------------------
+    def __log_failure(self, document_id, fields: List[str]):
+        if self.__logged_failures < MAX_LOGGED_FAILURES:
+            self.__logged_failures += 1
+            self.repository.context.logger(__name__).warning(
+                "%s: cannot convert %s of document %s",
+                self.name,
+                ", ".join(fields),
+                document_id,
+            )
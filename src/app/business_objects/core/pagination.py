@@ -0,0 +1,272 @@
+import base64
+import binascii
+import re
+from typing import Dict, List, Tuple
+
+from bson import json_util
+from bson.code import Code
+from bson.regex import Regex
+
+FORWARD: str = "next"
+BACKWARD: str = "prev"
+
+
+# =========================================================
+# CLASS INVALID PAGE TOKEN ERROR
+# =========================================================
+class InvalidPageTokenError(ValueError):
+    """
+    Raised when a continuation token cannot be decoded or
+    was issued for another sort key.
+    """
+
+
+# ---------------------------------------------------------
+# FUNCTION IS LITERAL
+# ---------------------------------------------------------
+def is_literal(value) -> bool:
+    """
+    Whether a value decoded from a token can only match by
+    equality, i.e. holds no query operator ($ key), regular
+    expression nor JavaScript.
+    :param value: Decoded value
+    :return: bool
+    """
+    if isinstance(value, dict):
+        return all(
+            not str(key).startswith("$") and is_literal(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return all(is_literal(item) for item in value)
+    return not isinstance(value, (Regex, re.Pattern, Code))
+
+
+# =========================================================
+# CLASS PAGE
+# =========================================================
+class Page:
+    """
+    A page of documents with the opaque continuation tokens
+    to move forward and backward from it.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        items: List[Dict],
+        next_page_token: str or None,
+        previous_page_token: str or None,
+    ):
+        self.items: List[Dict] = items
+        self.next_page_token: str or None = next_page_token
+        self.previous_page_token: str or None = previous_page_token
+
+    # -----------------------------------------------------
+    # METHOD DICT
+    # -----------------------------------------------------
+    def dict(self) -> dict:
+        return {
+            "items": self.items,
+            "next_page_token": self.next_page_token,
+            "previous_page_token": self.previous_page_token,
+        }
+
+
+# =========================================================
+# CLASS KEYSET PAGINATION
+# =========================================================
+class KeysetPagination:
+    """
+    Keyset (seek) pagination over a sort key and _id as tie
+    breaker. Each page is located with a range filter on the
+    last seen key instead of skip, so fetching page N costs
+    the same as fetching the first page as long as the sort
+    key is indexed. Continuation tokens are base64 encoded
+    Extended JSON, which preserves BSON types such as
+    ObjectId and datetime.
+
+    The class only builds queries and pages; repositories
+    perform the actual I/O.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        query: Dict,
+        page_size: int,
+        token: str or None = None,
+        sort_key: str = "_id",
+        projection: Dict or None = None,
+    ):
+        """
+        :param query: A dictionary containing a valid MongoDB
+        filter
+        :param page_size: Number of documents per page
+        :param token: Continuation token from a previous page,
+        None for the first page
+        :param sort_key: Indexed field used to order the pages
+        :param projection: Optional MongoDB projection
+        """
+        self.query: Dict = query
+        self.page_size: int = page_size
+        self.sort_key: str = sort_key
+        self.projection: Dict or None = projection
+        self.direction: str = FORWARD
+        self.position: Tuple or None = None
+        if token:
+            self.direction, self.position = self.decode_token(token, sort_key)
+
+    # -----------------------------------------------------
+    # METHOD ENCODE TOKEN
+    # -----------------------------------------------------
+    @staticmethod
+    def encode_token(direction: str, sort_key: str, document: Dict) -> str:
+        payload = json_util.dumps(
+            {
+                "d": direction,
+                "s": sort_key,
+                "k": document.get(sort_key),
+                "i": document["_id"],
+            }
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    # -----------------------------------------------------
+    # METHOD DECODE TOKEN
+    # -----------------------------------------------------
+    @staticmethod
+    def decode_token(token: str, sort_key: str) -> Tuple[str, Tuple]:
+        try:
+            payload = json_util.loads(base64.urlsafe_b64decode(token.encode()))
+            direction = payload["d"]
+            position = (payload["k"], payload["i"])
+            token_sort_key = payload["s"]
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise InvalidPageTokenError("Invalid page token")
+        if direction not in (FORWARD, BACKWARD) or token_sort_key != sort_key:
+            raise InvalidPageTokenError("Invalid page token")
+        # Tokens come from clients: their values end up in
+        # the filter and must not inject operators
+        if not is_literal(position):
+            raise InvalidPageTokenError("Invalid page token")
+        return direction, position
+
+    # -----------------------------------------------------
+    # PROPERTY FILTER
+    # -----------------------------------------------------
+    @property
+    def filter(self) -> Dict:
+        if self.position is None:
+            return self.query
+        key, last_id = self.position
+        operator = "$gt" if self.direction == FORWARD else "$lt"
+        if self.sort_key == "_id":
+            keyset = {"_id": {operator: last_id}}
+        else:
+            keyset = {
+                "$or": [
+                    {self.sort_key: {operator: key}},
+                    {self.sort_key: key, "_id": {operator: last_id}},
+                ]
+            }
+        if not self.query:
+            return keyset
+        return {"$and": [self.query, keyset]}
+
+    # -----------------------------------------------------
+    # PROPERTY SORT
+    # -----------------------------------------------------
+    @property
+    def sort(self) -> List[Tuple[str, int]]:
+        order = 1 if self.direction == FORWARD else -1
+        if self.sort_key == "_id":
+            return [("_id", order)]
+        return [(self.sort_key, order), ("_id", order)]
+
+    # -----------------------------------------------------
+    # PROPERTY FETCH PROJECTION
+    # -----------------------------------------------------
+    @property
+    def fetch_projection(self) -> Dict or None:
+        """
+        Projection sent to the server. The sort key and _id
+        are always fetched because tokens are built from
+        them; they are removed from the page afterwards when
+        the caller excluded them.
+        """
+        if self.projection is None:
+            return None
+        projection = {
+            field: value for field, value in self.projection.items() if field != "_id"
+        }
+        if self.sort_key != "_id":
+            if any(projection.values()):
+                projection[self.sort_key] = 1
+            else:
+                projection.pop(self.sort_key, None)
+        return projection or None
+
+    # -----------------------------------------------------
+    # PROPERTY LIMIT
+    # -----------------------------------------------------
+    @property
+    def limit(self) -> int:
+        # One extra document tells whether there is another page
+        return self.page_size + 1
+
+    # -----------------------------------------------------
+    # METHOD STRIP
+    # -----------------------------------------------------
+    def __strip(self, document: Dict) -> Dict:
+        if self.projection is None:
+            return document
+        fields = {
+            field: value for field, value in self.projection.items() if field != "_id"
+        }
+        if not self.projection.get("_id", 1):
+            document.pop("_id", None)
+        if self.sort_key != "_id":
+            inclusion = any(fields.values())
+            if (inclusion and not fields.get(self.sort_key)) or (
+                self.sort_key in fields and not fields[self.sort_key]
+            ):
+                document.pop(self.sort_key, None)
+        return document
+
+    # -----------------------------------------------------
+    # METHOD BUILD PAGE
+    # -----------------------------------------------------
+    def build_page(self, documents: List[Dict]) -> Page:
+        """
+        Builds the page from the documents fetched with
+        filter, sort and limit.
+        :param documents: Up to page_size + 1 documents
+        :return: Page
+        """
+        has_more = len(documents) > self.page_size
+        documents = documents[: self.page_size]
+        if self.direction == BACKWARD:
+            documents.reverse()
+        next_page_token = None
+        previous_page_token = None
+        if documents:
+            if self.direction == BACKWARD or has_more:
+                next_page_token = self.encode_token(
+                    FORWARD, self.sort_key, documents[-1]
+                )
+            if (self.direction == FORWARD and self.position is not None) or (
+                self.direction == BACKWARD and has_more
+            ):
+                previous_page_token = self.encode_token(
+                    BACKWARD, self.sort_key, documents[0]
+                )
+        return Page(
+            [self.__strip(document) for document in documents],
+            next_page_token,
+            previous_page_token,
+        )
@@ -0,0 +1,396 @@
+import asyncio
+import contextlib
+import random
+import threading
+import time
+from typing import Callable
+
+import pymongo
+from pymongo.errors import ConnectionFailure, PyMongoError
+
+from app.business_objects.core.errors import CircuitOpenError
+from app.context import (
+    get_context,
+    on_reload,
+    ServerContext,
+    settings_changed,
+    Settings,
+)
+from app.metrics.mongodb import CIRCUIT_BREAKER_REJECTIONS, REPOSITORY_RETRIES
+
+CLOSED: str = "closed"
+OPEN: str = "open"
+HALF_OPEN: str = "half-open"
+
+# Labels the server and the driver attach to errors that are
+# safe to retry once the cluster has recovered
+TRANSIENT_ERROR_LABELS = ("RetryableWriteError", "TransientTransactionError")
+
+
+# ---------------------------------------------------------
+# FUNCTION IS TRANSIENT ERROR
+# ---------------------------------------------------------
+def is_transient_error(error: Exception) -> bool:
+    """
+    Tells whether the error reflects the health of the cluster
+    rather than the operation: lost connections, network
+    timeouts, server selection timeouts and "not primary"
+    errors raised while a replica set elects a new primary.
+    :param error: Exception raised by the operation
+    :return: bool
+    """
+    if isinstance(error, ConnectionFailure):
+        return True
+    return isinstance(error, PyMongoError) and any(
+        error.has_error_label(label) for label in TRANSIENT_ERROR_LABELS
+    )
+
+
+# =========================================================
+# CLASS CIRCUIT BREAKER
+# =========================================================
+class CircuitBreaker:
+    """
+    Stops sending operations to MongoDB after failure_threshold
+    consecutive transient failures, so requests fail fast
+    instead of piling up on the connection pool while the
+    cluster is unhealthy. After reset_timeout one probe
+    operation is let through (half-open); its success closes
+    the circuit again and its failure keeps it open for
+    another reset_timeout.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        :param failure_threshold: Consecutive transient
+        failures that open the circuit. Zero disables the
+        breaker
+        :param reset_timeout: Seconds the circuit stays open
+        before a probe operation is allowed
+        """
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.__lock = threading.Lock()
+        self.__state: str = CLOSED
+        self.__failures: int = 0
+        self.__opened_at: float = 0.0
+        self.__probe_started_at: float = 0.0
+        self.__opened: int = 0
+        self.__rejected: int = 0
+
+    # -----------------------------------------------------
+    # PROPERTY STATE
+    # -----------------------------------------------------
+    @property
+    def state(self) -> str:
+        return self.__state
+
+    # -----------------------------------------------------
+    # METHOD RETRY AFTER
+    # -----------------------------------------------------
+    def retry_after(self) -> float:
+        """
+        :return: Seconds until a probe operation is allowed
+        """
+        return max(self.__opened_at + self.reset_timeout - time.monotonic(), 0.0)
+
+    # -----------------------------------------------------
+    # METHOD ALLOW
+    # -----------------------------------------------------
+    def allow(self) -> bool:
+        """
+        :return: Whether an operation may be sent to MongoDB
+        """
+        if self.__state == CLOSED:
+            return True
+        now = time.monotonic()
+        with self.__lock:
+            if self.__state == OPEN and now >= self.__opened_at + self.reset_timeout:
+                self.__state = HALF_OPEN
+                self.__probe_started_at = now
+                return True
+            # A probe that never reported back, e.g. because its
+            # request was cancelled, must not keep the circuit
+            # half-open forever
+            probe_expired = now >= self.__probe_started_at + self.reset_timeout
+            if self.__state == HALF_OPEN and probe_expired:
+                self.__probe_started_at = now
+                return True
+            if self.__state == CLOSED:
+                return True
+            self.__rejected += 1
+        CIRCUIT_BREAKER_REJECTIONS.increment()
+        return False
+
+    # -----------------------------------------------------
+    # METHOD RECORD SUCCESS
+    # -----------------------------------------------------
+    def record_success(self):
+        if self.__state == CLOSED and self.__failures == 0:
+            return
+        with self.__lock:
+            self.__state = CLOSED
+            self.__failures = 0
+
+    # -----------------------------------------------------
+    # METHOD RECORD FAILURE
+    # -----------------------------------------------------
+    def record_failure(self):
+        if self.failure_threshold <= 0:
+            return
+        with self.__lock:
+            self.__failures += 1
+            if self.__state == HALF_OPEN or self.__failures >= self.failure_threshold:
+                if self.__state != OPEN:
+                    self.__opened += 1
+                self.__state = OPEN
+                self.__opened_at = time.monotonic()
+
+    # -----------------------------------------------------
+    # PROPERTY STATISTICS
+    # -----------------------------------------------------
+    @property
+    def statistics(self) -> dict:
+        with self.__lock:
+            return {
+                "state": self.__state,
+                "consecutive_failures": self.__failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout_seconds": self.reset_timeout,
+                "retry_after_seconds": (
+                    self.retry_after() if self.__state == OPEN else 0.0
+                ),
+                "opened": self.__opened,
+                "rejected": self.__rejected,
+            }
+
+
+# =========================================================
+# CLASS RETRY POLICY
+# =========================================================
+class RetryPolicy:
+    """
+    Runs repository operations within a deadline, retrying
+    idempotent operations that fail with a transient error
+    after a full-jitter exponential backoff. Retries stop when
+    the attempts are exhausted, when the next backoff would
+    not fit in the deadline or when the circuit breaker opens.
+    Operations that are not idempotent, e.g. inserts, are
+    attempted once; the driver already retries a single write
+    once when retryable writes are enabled.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        attempts: int,
+        base_delay: float,
+        max_delay: float,
+        timeout: float or None,
+        breaker: CircuitBreaker,
+    ):
+        """
+        :param attempts: Maximum attempts of an idempotent
+        operation, the first one included
+        :param base_delay: Backoff of the first retry, in seconds
+        :param max_delay: Upper bound of the backoff, in seconds
+        :param timeout: Deadline of an operation and its
+        retries, in seconds. None disables the deadline
+        :param breaker: Circuit breaker told about the outcome
+        of each operation
+        """
+        self.attempts: int = max(attempts, 1)
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.timeout: float or None = timeout
+        self.breaker: CircuitBreaker = breaker
+
+    # -----------------------------------------------------
+    # METHOD BACKOFF
+    # -----------------------------------------------------
+    def backoff(self, attempt: int) -> float:
+        """
+        :param attempt: Number of failed attempts so far
+        :return: Seconds to wait before the next attempt
+        """
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    # -----------------------------------------------------
+    # METHOD CALL
+    # -----------------------------------------------------
+    def call(self, operation: str, idempotent: bool, func: Callable, *args, **kwargs):
+        """
+        :param operation: Name of the operation, for metrics
+        :param idempotent: Whether the operation may be retried
+        :param func: Function that runs the operation
+        :return: Result of func
+        :raises CircuitOpenError: While the circuit is open
+        """
+        deadline = self.__start()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                with self.__deadline_scope(deadline):
+                    result = func(*args, **kwargs)
+            except Exception as error:
+                delay = self.__on_failure(
+                    error, operation, idempotent, attempt, deadline
+                )
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    # -----------------------------------------------------
+    # METHOD CALL ASYNC
+    # -----------------------------------------------------
+    async def call_async(
+        self, operation: str, idempotent: bool, func: Callable, *args, **kwargs
+    ):
+        """
+        Async counterpart of call for coroutine functions.
+        """
+        deadline = self.__start()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                with self.__deadline_scope(deadline):
+                    result = await func(*args, **kwargs)
+            except Exception as error:
+                delay = self.__on_failure(
+                    error, operation, idempotent, attempt, deadline
+                )
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    # -----------------------------------------------------
+    # METHOD START
+    # -----------------------------------------------------
+    def __start(self) -> float or None:
+        if not self.breaker.allow():
+            raise CircuitOpenError(self.breaker.retry_after())
+        return time.monotonic() + self.timeout if self.timeout else None
+
+    # -----------------------------------------------------
+    # METHOD DEADLINE SCOPE
+    # -----------------------------------------------------
+    @staticmethod
+    def __deadline_scope(deadline: float or None):
+        """
+        Bounds every command of the attempt, server selection
+        and connection checkout included, by the time left
+        until the deadline.
+        """
+        if deadline is None:
+            return contextlib.nullcontext()
+        return pymongo.timeout(max(deadline - time.monotonic(), 0.001))
+
+    # -----------------------------------------------------
+    # METHOD ON FAILURE
+    # -----------------------------------------------------
+    def __on_failure(
+        self,
+        error: Exception,
+        operation: str,
+        idempotent: bool,
+        attempt: int,
+        deadline: float or None,
+    ) -> float or None:
+        """
+        :return: Seconds to wait before retrying, or None when
+        the error must be raised
+        """
+        if not is_transient_error(error):
+            # The cluster answered: the failure belongs to the
+            # operation, not to the health of the cluster
+            self.breaker.record_success()
+            return None
+        self.breaker.record_failure()
+        if not idempotent or attempt >= self.attempts:
+            return None
+        delay = self.backoff(attempt)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        if not self.breaker.allow():
+            return None
+        REPOSITORY_RETRIES.increment(operation)
+        return delay
+
+
+# ---------------------------------------------------------
+# FUNCTION BUILD RETRY POLICY
+# ---------------------------------------------------------
+def build_retry_policy(context: ServerContext) -> RetryPolicy:
+    timeout = context.mongo_operation_timeout_ms
+    return RetryPolicy(
+        attempts=context.mongo_retry_attempts,
+        base_delay=context.mongo_retry_base_delay_ms / 1000,
+        max_delay=context.mongo_retry_max_delay_ms / 1000,
+        timeout=timeout / 1000 if timeout > 0 else None,
+        breaker=CircuitBreaker(
+            context.mongo_breaker_failure_threshold,
+            context.mongo_breaker_reset_seconds,
+        ),
+    )
+
+
+# Settings the retry policy and its circuit breaker are built from
+RETRY_POLICY_SETTINGS: tuple = (
+    "mongo_retry_attempts",
+    "mongo_retry_base_delay_ms",
+    "mongo_retry_max_delay_ms",
+    "mongo_operation_timeout_ms",
+    "mongo_breaker_failure_threshold",
+    "mongo_breaker_reset_seconds",
+)
+_retry_policy: dict = {}
+_retry_policy_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# FUNCTION GET RETRY POLICY
+# ---------------------------------------------------------
+def get_retry_policy() -> RetryPolicy:
+    """
+    Returns the process-wide retry policy. Its circuit
+    breaker is shared by every repository since they all use
+    the same cluster.
+    :return: RetryPolicy
+    """
+    policy = _retry_policy.get("instance")
+    if policy is not None:
+        return policy
+    with _retry_policy_lock:
+        if "instance" not in _retry_policy:
+            _retry_policy["instance"] = build_retry_policy(get_context())
+    return _retry_policy["instance"]
+
+
+# ---------------------------------------------------------
+# FUNCTION REBUILD RETRY POLICY
+# ---------------------------------------------------------
+@on_reload
+def _rebuild_retry_policy(previous: Settings, current: Settings):
+    """
+    Drops the retry policy when a reload changes its settings.
+    The next operation builds it again, with a closed circuit
+    breaker.
+    """
+    if settings_changed(previous, current, RETRY_POLICY_SETTINGS):
+        with _retry_policy_lock:
+            _retry_policy.pop("instance", None)
@@ -0,0 +1,138 @@
+import functools
+from dataclasses import dataclass, replace
+
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+from pymongo.write_concern import WriteConcern
+
+from app.context import ServerContext
+
+READ_PREFERENCES: dict = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+READ_CONCERN_LEVELS = ("local", "available", "majority", "linearizable", "snapshot")
+
+
+# ---------------------------------------------------------
+# CLASS ROUTING
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class Routing:
+    """
+    Where reads are served from and how durable writes must
+    be. Fields left as None are inherited from the collection
+    the routing is applied to, so a per-call routing only
+    overrides what it sets on top of the routing of the
+    repository, which in turn overrides the MONGO_READ_*
+    and MONGO_WRITE_CONCERN settings.
+
+    Read preferences other than primary spread reads across
+    the secondaries of a replica set; writes always go to the
+    primary. maxStalenessSeconds (90 or more) excludes
+    secondaries lagging further behind the primary and is not
+    allowed with the primary read preference.
+    """
+
+    read_preference: str or None = None
+    max_staleness_seconds: int or None = None
+    read_concern: str or None = None
+    write_concern: str or None = None
+
+    # -----------------------------------------------------
+    # METHOD POST INIT
+    # -----------------------------------------------------
+    def __post_init__(self):
+        if self.read_preference not in (None, *READ_PREFERENCES):
+            raise ValueError(f"Unknown read preference: {self.read_preference}")
+        if self.max_staleness_seconds is not None and self.read_preference in (
+            None,
+            "primary",
+        ):
+            raise ValueError(
+                "maxStalenessSeconds requires a read preference other than primary"
+            )
+        if self.read_concern not in (None, *READ_CONCERN_LEVELS):
+            raise ValueError(f"Unknown read concern: {self.read_concern}")
+
+    # -----------------------------------------------------
+    # METHOD FROM CONTEXT
+    # -----------------------------------------------------
+    @staticmethod
+    def from_context(context: ServerContext) -> "Routing":
+        return Routing(
+            read_preference=context.mongo_read_preference,
+            max_staleness_seconds=context.mongo_max_staleness_seconds,
+            read_concern=context.mongo_read_concern,
+            write_concern=context.mongo_write_concern,
+        )
+
+    # -----------------------------------------------------
+    # METHOD MERGE
+    # -----------------------------------------------------
+    def merge(self, other: "Routing" or None) -> "Routing":
+        """
+        :param other: Routing whose fields take precedence
+        :return: Routing with the fields set by other, and
+        the ones of this routing otherwise
+        """
+        if other is None:
+            return self
+        changes = {
+            name: value for name, value in vars(other).items() if value is not None
+        }
+        if other.read_preference is not None and other.max_staleness_seconds is None:
+            # Staleness belongs to the read preference it came with
+            changes["max_staleness_seconds"] = None
+        return replace(self, **changes)
+
+    # -----------------------------------------------------
+    # METHOD APPLY
+    # -----------------------------------------------------
+    def apply(self, collection):
+        """
+        :param collection: Collection or AsyncCollection
+        :return: Copy of the collection using this routing.
+        The collection itself is returned when nothing is set
+        """
+        options = _collection_options(self)
+        return collection.with_options(**options) if options else collection
+
+
+# ---------------------------------------------------------
+# FUNCTION COLLECTION OPTIONS
+# ---------------------------------------------------------
+@functools.lru_cache(maxsize=64)
+def _collection_options(routing: Routing) -> dict:
+    """
+    Builds the driver options of a routing once, so applying
+    it on the request path only copies the collection handle.
+    """
+    options: dict = {}
+    if routing.read_preference is not None:
+        mode = READ_PREFERENCES[routing.read_preference]
+        if routing.max_staleness_seconds is not None:
+            options["read_preference"] = mode(
+                max_staleness=routing.max_staleness_seconds
+            )
+        else:
+            options["read_preference"] = mode()
+    if routing.read_concern is not None:
+        options["read_concern"] = ReadConcern(routing.read_concern)
+    if routing.write_concern is not None:
+        w = routing.write_concern
+        options["write_concern"] = WriteConcern(w=int(w) if w.isdigit() else w)
+    return options
+
+
+PRIMARY = Routing(read_preference="primary")
+SECONDARY_PREFERRED = Routing(read_preference="secondaryPreferred")
@@ -0,0 +1,196 @@
+import datetime
+from typing import Callable, Dict, List, Mapping, Tuple
+
+from app.business_objects.core.errors import SchemaError
+
+# Empty strings of exports stand for a missing value
+EMPTY_VALUES: tuple = (None, "")
+
+
+# ---------------------------------------------------------
+# FUNCTION TO INT
+# ---------------------------------------------------------
+def to_int(value) -> int or None:
+    if value in EMPTY_VALUES:
+        return None
+    if isinstance(value, bool):
+        raise TypeError("A boolean is not an integer")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{value} is not an integer")
+        return int(value)
+    return value if isinstance(value, int) else int(value.strip())
+
+
+# ---------------------------------------------------------
+# FUNCTION TO DOUBLE
+# ---------------------------------------------------------
+def to_double(value) -> float or None:
+    if value in EMPTY_VALUES:
+        return None
+    if isinstance(value, bool):
+        raise TypeError("A boolean is not a number")
+    return value if isinstance(value, float) else float(value)
+
+
+# ---------------------------------------------------------
+# FUNCTION TO UTC
+# ---------------------------------------------------------
+def to_utc(value: datetime.datetime) -> datetime.datetime:
+    # Naive UTC, as BSON dates are read back by the driver
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
+# ---------------------------------------------------------
+# FUNCTION TO EPOCH DATETIME
+# ---------------------------------------------------------
+def to_epoch_datetime(value) -> datetime.datetime or None:
+    """
+    Converts Unix time in seconds, e.g. "1658961003".
+    """
+    if value in EMPTY_VALUES:
+        return None
+    if isinstance(value, datetime.datetime):
+        return to_utc(value)
+    if isinstance(value, bool):
+        raise TypeError("A boolean is not a timestamp")
+    return datetime.datetime.fromtimestamp(float(value), datetime.timezone.utc).replace(
+        tzinfo=None
+    )
+
+
+# ---------------------------------------------------------
+# FUNCTION TO DATETIME
+# ---------------------------------------------------------
+def to_datetime(value) -> datetime.datetime or None:
+    """
+    Converts ISO 8601 dates, e.g. "2022-10-07T23:30:14.000+0000".
+    Dates without an offset are taken as UTC.
+    """
+    if value in EMPTY_VALUES:
+        return None
+    if isinstance(value, datetime.datetime):
+        return to_utc(value)
+    return to_utc(datetime.datetime.fromisoformat(value.strip()))
+
+
+# ---------------------------------------------------------
+# FUNCTION GET PATH
+# ---------------------------------------------------------
+def get_path(document: Dict, path: str) -> Tuple[bool, object]:
+    """
+    :param document: Document, or values of a $set where
+    nested fields may be given by their dotted path
+    :param path: Dotted path of the field
+    :return: Whether the field is present, and its value
+    """
+    if path in document:
+        return True, document[path]
+    value = document
+    for name in path.split("."):
+        if not isinstance(value, dict) or name not in value:
+            return False, None
+        value = value[name]
+    return True, value
+
+
+# =========================================================
+# CLASS SCHEMA
+# =========================================================
+class Schema:
+    """
+    Native types of the fields of a collection. Documents
+    are converted before they are written, so that dates and
+    numbers sent as strings can be compared and range queried
+    from indexes. Fields that are not declared, or missing,
+    are left alone.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, fields: Mapping[str, Callable]):
+        """
+        :param fields: Dotted path of each field to the function
+        converting its values, e.g. to_int. Converters return
+        native values unchanged and raise TypeError or
+        ValueError for values they cannot convert
+        """
+        self.fields: Dict[str, Callable] = dict(fields)
+
+    # -----------------------------------------------------
+    # METHOD NATIVE VALUES
+    # -----------------------------------------------------
+    def native_values(self, document: Dict) -> Tuple[Dict, List[str]]:
+        """
+        :param document: Document or values of a $set
+        :return: Dotted path to native value of the fields that
+        need converting, and the paths of the fields whose
+        value cannot be converted
+        """
+        values: Dict = {}
+        invalid: List[str] = []
+        for path, convert in self.fields.items():
+            found, value = get_path(document, path)
+            if not found:
+                continue
+            try:
+                native = convert(value)
+            except (TypeError, ValueError, OverflowError, OSError):
+                invalid.append(path)
+                continue
+            if type(native) is not type(value) or native != value:
+                values[path] = native
+        return values, invalid
+
+    # -----------------------------------------------------
+    # METHOD APPLY
+    # -----------------------------------------------------
+    @staticmethod
+    def apply(document: Dict, values: Dict) -> Dict:
+        """
+        :param document: Document
+        :param values: Dotted path to value, see native_values
+        :return: Copy of the document with the values set. Only
+        the sub-documents on the paths are copied
+        """
+        document = dict(document)
+        for path, value in values.items():
+            if path in document:
+                document[path] = value
+                continue
+            names = path.split(".")
+            parent = document
+            for name in names[:-1]:
+                parent[name] = dict(parent[name])
+                parent = parent[name]
+            parent[names[-1]] = value
+        return document
+
+    # -----------------------------------------------------
+    # METHOD COERCE
+    # -----------------------------------------------------
+    def coerce(self, document: Dict) -> Dict:
+        """
+        :param document: Document or values of a $set
+        :return: The document with native values. The same
+        document when nothing needs converting, a copy otherwise
+        :raise SchemaError: When a value cannot be converted
+        """
+        values, invalid = self.native_values(document)
+        if invalid:
+            raise SchemaError(invalid)
+        return self.apply(document, values) if values else document
+
+    # -----------------------------------------------------
+    # PROPERTY PENDING QUERY
+    # -----------------------------------------------------
+    @property
+    def pending_query(self) -> Dict:
+        """
+        Filter of the stored documents that may still hold
+        values written before the schema, i.e. as strings.
+        """
+        return {"$or": [{path: {"$type": "string"}} for path in self.fields]}
@@ -0,0 +1,15 @@
+from app.business_objects.finding.repository import AsyncFindings, Findings
+
+
+# =========================================================
+# FUNCTION INJECT FINDINGS
+# =========================================================
+def inject_findings() -> Findings:
+    return Findings()
+
+
+# =========================================================
+# FUNCTION INJECT ASYNC FINDINGS
+# =========================================================
+def inject_async_findings() -> AsyncFindings:
+    return AsyncFindings()
@@ -0,0 +1,138 @@
+import hashlib
+from typing import Dict
+
+from pymongo import UpdateOne
+
+from app.business_objects.core.schema import to_datetime, to_epoch_datetime
+from app.resources.serialization import dumps
+
+IDENTITY: str = "identity"
+FINGERPRINT: str = "fingerprint"
+# A finding is the result of a plugin on a service of a host
+# of a repository. Repositories may scan overlapping private
+# address ranges, so the repository is part of the identity
+IDENTITY_FIELDS: tuple = ("ip", "port", "protocol", "plugin_id")
+IDENTITY_SCOPE: str = "repository"
+# Fields a rescan changes without the finding changing. Only
+# moved forward when the content is the same
+SEEN_FIELDS: tuple = ("last_seen", "crt_date_last_seen")
+# Converters of the SEEN_FIELDS, see FINDING_SCHEMA. Findings
+# stored before the native types backfill hold them as strings
+SEEN_CONVERTERS: Dict = {
+    "last_seen": to_epoch_datetime,
+    "crt_date_last_seen": to_datetime,
+}
+VOLATILE_FIELDS: tuple = SEEN_FIELDS + (
+    "_id",
+    IDENTITY,
+    FINGERPRINT,
+    "db_creation_datetime",
+    "db_update_datetime",
+)
+
+
+# ---------------------------------------------------------
+# FUNCTION DIGEST
+# ---------------------------------------------------------
+def digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# ---------------------------------------------------------
+# FUNCTION FINDING IDENTITY
+# ---------------------------------------------------------
+def finding_identity(finding: Dict) -> str:
+    """
+    Key shared by every report of the same finding, e.g. by
+    the results of successive scans. Values are compared as
+    strings, so a port sent as "443" or 443 is the same.
+    :param finding: Finding document
+    :return: Hex digest
+    """
+    scope = finding.get(IDENTITY_SCOPE)
+    if isinstance(scope, dict):
+        scope = scope.get("repository_id", scope.get("name"))
+    values = [scope] + [finding.get(field) for field in IDENTITY_FIELDS]
+    return digest(
+        "\x1f".join("" if value is None else str(value) for value in values).encode()
+    )
+
+
+# ---------------------------------------------------------
+# FUNCTION FINDING FINGERPRINT
+# ---------------------------------------------------------
+def finding_fingerprint(finding: Dict) -> str:
+    """
+    Hash of the content of a finding, i.e. of every field
+    but the VOLATILE_FIELDS.
+    :param finding: Finding document
+    :return: Hex digest
+    """
+    material = dict(finding)
+    for field in VOLATILE_FIELDS:
+        material.pop(field, None)
+    return digest(dumps(material, sort_keys=True))
+
+
+# ---------------------------------------------------------
+# FUNCTION IS NEWER
+# ---------------------------------------------------------
+def is_newer(field: str, value, stored) -> bool:
+    """
+    :param field: One of the SEEN_FIELDS
+    :param value: Value of the finding
+    :param stored: Value of the stored finding, a native
+    value or a string or number not converted yet
+    :return: Whether value moves the stored value forward. A
+    stored value that cannot be converted is replaced
+    """
+    convert = SEEN_CONVERTERS[field]
+    try:
+        value = convert(value)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    try:
+        stored = convert(stored)
+    except (TypeError, ValueError, OverflowError):
+        stored = None
+    return value is not None and (stored is None or value > stored)
+
+
+# ---------------------------------------------------------
+# FUNCTION MERGE OPERATION
+# ---------------------------------------------------------
+def merge_operation(finding: Dict, stored: Dict or None) -> UpdateOne or None:
+    """
+    Write that merges a finding into the stored one with the
+    same identity.
+    :param finding: Normalized finding, with its identity and
+    fingerprint
+    :param stored: Identity, fingerprint and SEEN_FIELDS of the
+    stored finding, None when there is none
+    :return: An upsert of the whole finding when it is new or
+    its content changed. An update of the SEEN_FIELDS only
+    when they moved forward. None when there is nothing to
+    write
+    """
+    if stored is None or stored.get(FINGERPRINT) != finding[FINGERPRINT]:
+        values = dict(finding)
+        created = values.pop("db_creation_datetime", None)
+        return UpdateOne(
+            {IDENTITY: finding[IDENTITY]},
+            {"$set": values, "$setOnInsert": {"db_creation_datetime": created}},
+            upsert=True,
+        )
+    seen = {
+        field: finding[field]
+        for field in SEEN_FIELDS
+        if field in finding and is_newer(field, finding[field], stored.get(field))
+    }
+    if not seen:
+        return None
+    return UpdateOne(
+        {IDENTITY: finding[IDENTITY], FINGERPRINT: finding[FINGERPRINT]},
+        {
+            "$max": seen,
+            "$set": {"db_update_datetime": finding.get("db_update_datetime")},
+        },
+    )
@@ -0,0 +1,248 @@
+import asyncio
+import datetime
+from typing import AsyncIterator, Dict, List, Set, Tuple
+
+from app.business_objects.core.bulk import BulkResult
+from app.business_objects.finding.identity import IDENTITY, merge_operation
+from app.business_objects.finding.normalization import normalize_finding
+from app.business_objects.finding.repository import AsyncFindings
+
+# Errors listed in a report; the rest are only counted
+MAX_REPORTED_ERRORS: int = 100
+
+
+# =========================================================
+# CLASS INGESTION WRITE ERROR
+# =========================================================
+class IngestionWriteError(RuntimeError):
+    """
+    Raised when a batch could not be merged into the stored
+    findings, e.g. the database rejected the lookup or the
+    bulk write. Batches written before it are kept.
+    """
+
+
+# =========================================================
+# CLASS INGESTION REPORT
+# =========================================================
+class IngestionReport:
+    """
+    Outcome of an ingestion. Errors refer to records by
+    their position in the ingested stream.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        self.received: int = 0
+        self.inserted: int = 0
+        self.updated: int = 0
+        self.unchanged: int = 0
+        self.rejected: int = 0
+        self.errors: List[Dict] = []
+
+    # -----------------------------------------------------
+    # PROPERTY ACCEPTED
+    # -----------------------------------------------------
+    @property
+    def accepted(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    # -----------------------------------------------------
+    # METHOD REJECT
+    # -----------------------------------------------------
+    def reject(self, index: int or None, message: str, code: int or None = None):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"index": index, "code": code, "message": message})
+
+    # -----------------------------------------------------
+    # METHOD ADD BULK RESULT
+    # -----------------------------------------------------
+    def add_bulk_result(self, result: BulkResult, positions: List[int]):
+        """
+        :param result: Result of the bulk write of a batch
+        :param positions: Position in the stream of each
+        document of the batch
+        """
+        self.inserted += result.inserted + result.upserted
+        self.updated += result.matched
+        for error in result.errors:
+            index = error["index"]
+            self.reject(
+                positions[index] if index is not None else None,
+                error["message"],
+                error["code"],
+            )
+
+    # -----------------------------------------------------
+    # METHOD DICT
+    # -----------------------------------------------------
+    def dict(self) -> dict:
+        return {
+            "received": self.received,
+            "accepted": self.accepted,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+
+# =========================================================
+# CLASS FINDING INGESTION
+# =========================================================
+class FindingIngestion:
+    """
+    Writes a stream of records as findings. Records are
+    normalized as they arrive and merged into the stored
+    findings by identity in unordered bulk writes of up to
+    batch_size documents. Findings whose content did not
+    change are not rewritten, only their last_seen is moved
+    forward, see merge_operation.
+
+    Up to max_in_flight batches are written at once while the
+    next one is being read; when they are all busy, reading
+    waits for one of them to finish. Memory is bounded by about
+    (max_in_flight + 1) * batch_size documents whatever the
+    size of the stream, and a client sending faster than the
+    database writes is slowed down by TCP flow control.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        findings: AsyncFindings,
+        batch_size: int or None = None,
+        max_in_flight: int or None = None,
+    ):
+        """
+        :param findings: Repository the findings are written to
+        :param batch_size: Documents per bulk write. Defaults to
+        MONGO_BULK_CHUNK_SIZE
+        :param max_in_flight: Concurrent bulk writes. Defaults
+        to INGESTION_MAX_IN_FLIGHT
+        """
+        self.findings: AsyncFindings = findings
+        self.batch_size: int = batch_size or findings.context.bulk_chunk_size
+        self.max_in_flight: int = max(
+            max_in_flight or findings.context.ingestion_max_in_flight, 1
+        )
+        self.report: IngestionReport = IngestionReport()
+        self.__batch: List[Tuple[int, Dict]] = []
+        self.__in_flight: Set[asyncio.Task] = set()
+
+    # -----------------------------------------------------
+    # METHOD INGEST
+    # -----------------------------------------------------
+    async def ingest(
+        self, records: AsyncIterator[Tuple[int, object]]
+    ) -> IngestionReport:
+        """
+        :param records: Async iterator of (position, record).
+        A ValueError given as record, e.g. a line that is not
+        valid JSON, rejects that record. A ValueError raised by
+        the iterator ends the ingestion: the records read before
+        it are still written, then the error is raised again
+        :return: IngestionReport, also available as report
+        :raise IngestionWriteError: When a batch cannot be
+        written; the ingestion stops
+        """
+        now = datetime.datetime.utcnow()
+        try:
+            async for position, record in records:
+                self.report.received += 1
+                if isinstance(record, ValueError):
+                    self.report.reject(position, str(record))
+                    continue
+                try:
+                    self.__batch.append((position, normalize_finding(record, now)))
+                except ValueError as error:
+                    self.report.reject(position, str(error))
+                    continue
+                if len(self.__batch) >= self.batch_size:
+                    await self.__submit()
+        except ValueError:
+            await self.__flush()
+            raise
+        except BaseException:
+            self.__cancel()
+            raise
+        await self.__flush()
+        return self.report
+
+    # -----------------------------------------------------
+    # METHOD SUBMIT
+    # -----------------------------------------------------
+    async def __submit(self):
+        if not self.__batch:
+            return
+        if len(self.__in_flight) >= self.max_in_flight:
+            await self.__wait(asyncio.FIRST_COMPLETED)
+        batch, self.__batch = self.__batch, []
+        self.__in_flight.add(asyncio.ensure_future(self.__write(batch)))
+
+    # -----------------------------------------------------
+    # METHOD WRITE
+    # -----------------------------------------------------
+    async def __write(self, batch: List[Tuple[int, Dict]]):
+        # A finding reported twice in a batch is merged once,
+        # with its latest report
+        latest: Dict[str, Tuple[int, Dict]] = {
+            document[IDENTITY]: (position, document) for position, document in batch
+        }
+        self.report.unchanged += len(batch) - len(latest)
+        stored = await self.findings.get_fingerprints(list(latest))
+        if stored is False:
+            raise IngestionWriteError("The stored findings could not be read")
+        operations, positions = [], []
+        for identity, (position, document) in latest.items():
+            operation = merge_operation(document, stored.get(identity))
+            if operation is None:
+                self.report.unchanged += 1
+                continue
+            operations.append(operation)
+            positions.append(position)
+        if operations:
+            result = await self.findings.bulk_write(
+                operations, chunk_size=len(operations)
+            )
+            if result is False:
+                raise IngestionWriteError("The findings could not be written")
+            self.report.add_bulk_result(result, positions)
+
+    # -----------------------------------------------------
+    # METHOD WAIT
+    # -----------------------------------------------------
+    async def __wait(self, return_when: str):
+        done, self.__in_flight = await asyncio.wait(
+            self.__in_flight, return_when=return_when
+        )
+        for task in done:
+            # Raises the error of a failed write, e.g. the
+            # database being unavailable
+            task.result()
+
+    # -----------------------------------------------------
+    # METHOD FLUSH
+    # -----------------------------------------------------
+    async def __flush(self):
+        try:
+            await self.__submit()
+            if self.__in_flight:
+                await self.__wait(asyncio.ALL_COMPLETED)
+        except BaseException:
+            self.__cancel()
+            raise
+
+    # -----------------------------------------------------
+    # METHOD CANCEL
+    # -----------------------------------------------------
+    def __cancel(self):
+        for task in self.__in_flight:
+            task.cancel()
+        self.__in_flight = set()
@@ -0,0 +1,75 @@
+import datetime
+from typing import Dict
+
+from app.business_objects.core.errors import SchemaError
+from app.business_objects.finding.identity import (
+    FINGERPRINT,
+    IDENTITY,
+    finding_fingerprint,
+    finding_identity,
+)
+from app.business_objects.finding.repository import FINDING_SCHEMA
+
+SEVERITIES: tuple = ("info", "low", "medium", "high", "critical")
+# Fields that identify a finding and what it is about
+REQUIRED_FIELDS: tuple = ("id", "plugin_id", "ip", "severity")
+
+
+# =========================================================
+# CLASS INVALID FINDING ERROR
+# =========================================================
+class InvalidFindingError(ValueError):
+    """
+    Raised for a record that cannot be stored as a finding.
+    Ingestion rejects the record and carries on.
+    """
+
+
+# ---------------------------------------------------------
+# FUNCTION NORMALIZE FINDING
+# ---------------------------------------------------------
+def normalize_finding(record, now: datetime.datetime or None = None) -> Dict:
+    """
+    Validates a record exported by a scanner and returns the
+    document to store. Checks are done by hand rather than
+    with a pydantic model: they run for every record of an
+    ingestion, where model validation would cost more than
+    the write itself.
+    :param record: Decoded JSON record
+    :param now: Time of the ingestion, stamped on the
+    document
+    :return: Finding document, with native values, see
+    FINDING_SCHEMA, its identity and its fingerprint
+    """
+    if not isinstance(record, dict):
+        raise InvalidFindingError("A finding must be a JSON object")
+    finding: Dict = dict(record)
+    for key in [key for key in record if not key.isidentifier()]:
+        # Some exports quote field names, e.g. "'plugin_info'"
+        name = key.strip().strip("'\"")
+        if not name or name.startswith("$"):
+            raise InvalidFindingError(f"Invalid field name {key!r}")
+        finding[name] = finding.pop(key)
+    # The database assigns the _id
+    finding.pop("_id", None)
+    missing = [field for field in REQUIRED_FIELDS if finding.get(field) in (None, "")]
+    if missing:
+        raise InvalidFindingError(f"Missing {', '.join(missing)}")
+    for field in ("id", "ip"):
+        if not isinstance(finding[field], str):
+            raise InvalidFindingError(f"{field} must be a string")
+        finding[field] = finding[field].strip()
+    severity = finding["severity"]
+    if not isinstance(severity, str) or severity.strip().lower() not in SEVERITIES:
+        raise InvalidFindingError(f"severity must be one of {', '.join(SEVERITIES)}")
+    finding["severity"] = severity.strip().lower()
+    finding["db_creation_datetime"] = finding["db_update_datetime"] = (
+        now or datetime.datetime.utcnow()
+    )
+    try:
+        finding = FINDING_SCHEMA.coerce(finding)
+    except SchemaError as error:
+        raise InvalidFindingError(str(error)) from error
+    finding[IDENTITY] = finding_identity(finding)
+    finding[FINGERPRINT] = finding_fingerprint(finding)
+    return finding
@@ -0,0 +1,147 @@
+from typing import Dict, List, Tuple
+from app.business_objects.core.dao import (
+    EntityRepository,
+    inject_async_mongodb_error_handling,
+)
+from app.business_objects.core.async_dao import AsyncEntityRepository
+from app.business_objects.core.indexes import IndexSpec
+from app.business_objects.core.routing import PRIMARY
+from app.business_objects.core.schema import (
+    Schema,
+    to_datetime,
+    to_double,
+    to_epoch_datetime,
+    to_int,
+)
+from app.business_objects.finding.identity import (
+    FINGERPRINT,
+    IDENTITY,
+    SEEN_CONVERTERS,
+    SEEN_FIELDS,
+    finding_fingerprint,
+)
+
+FINDING_INDEX_FIELDS: tuple = (IDENTITY, "id", "plugin_id", "ip")
+# Scanners export numbers and dates as strings, e.g. "443",
+# "6.1", "1658961003" or "" when there is no value
+FINDING_SCHEMA = Schema(
+    {
+        "port": to_int,
+        "plugin_id": to_int,
+        "base_score": to_double,
+        "cvss_v3_base_score": to_double,
+        "created_timestamp": to_epoch_datetime,
+        "due_timestamp": to_epoch_datetime,
+        "crt_date_first_seen": to_datetime,
+        "crt_date_due_date": to_datetime,
+        "db_creation_datetime": to_datetime,
+        "db_update_datetime": to_datetime,
+        "repository.repository_id": to_int,
+        **SEEN_CONVERTERS,
+    }
+)
+
+
+# =========================================================
+# CLASS FINDINGS
+# =========================================================
+class Findings(EntityRepository):
+    """
+    Vulnerability and compliance findings exported by the
+    scanners, see samples/vulnerability,.json and
+    samples/benchmark.json.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        super().__init__(collection_name="findings")
+
+    # -----------------------------------------------------
+    # GET INDEX FIELDS
+    # -----------------------------------------------------
+    def get_index_fields(self) -> List[str]:
+        return list(FINDING_INDEX_FIELDS)
+
+    # -----------------------------------------------------
+    # GET INDEX SPECS
+    # -----------------------------------------------------
+    def get_index_specs(self) -> List[IndexSpec]:
+        return [
+            IndexSpec(IDENTITY, unique=True),
+            IndexSpec("id", unique=True, partial_filter={"id": {"$type": "string"}}),
+            IndexSpec("plugin_id"),
+            IndexSpec("ip"),
+        ]
+
+    # -----------------------------------------------------
+    # GET SCHEMA
+    # -----------------------------------------------------
+    def get_schema(self) -> Schema:
+        return FINDING_SCHEMA
+
+    # -----------------------------------------------------
+    # NATIVE UPDATES
+    # -----------------------------------------------------
+    def native_updates(self, document: Dict) -> Tuple[Dict, List[str]]:
+        values, invalid = super().native_updates(document)
+        if values and FINGERPRINT in document:
+            # Computed from the converted values since ingestion
+            values[FINGERPRINT] = finding_fingerprint(Schema.apply(document, values))
+        return values, invalid
+
+
+# =========================================================
+# CLASS ASYNC FINDINGS
+# =========================================================
+class AsyncFindings(AsyncEntityRepository):
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        super().__init__(collection_name="findings")
+
+    # -----------------------------------------------------
+    # GET INDEX FIELDS
+    # -----------------------------------------------------
+    def get_index_fields(self) -> List[str]:
+        return list(FINDING_INDEX_FIELDS)
+
+    # -----------------------------------------------------
+    # GET SCHEMA
+    # -----------------------------------------------------
+    def get_schema(self) -> Schema:
+        return FINDING_SCHEMA
+
+    # -----------------------------------------------------
+    # GET FINGERPRINTS
+    # -----------------------------------------------------
+    @inject_async_mongodb_error_handling
+    async def get_fingerprints(self, identities: List[str]) -> Dict[str, Dict]:
+        """
+        Gets what ingestion needs to know about the stored
+        findings to merge new results into them.
+        :param identities: Identities of the findings
+        :return: Dict of identity to the identity, fingerprint
+        and SEEN_FIELDS of the stored finding. Unknown
+        identities are missing
+        """
+        projection = {
+            "_id": 0,
+            IDENTITY: 1,
+            FINGERPRINT: 1,
+            **{field: 1 for field in SEEN_FIELDS},
+        }
+        # Read from the primary: a stale fingerprint would
+        # rewrite, or insert twice, what was just ingested
+        documents = (
+            await self.collection(PRIMARY)
+            .find(
+                {IDENTITY: {"$in": identities}},
+                projection,
+                batch_size=len(identities) or None,
+            )
+            .to_list()
+        )
+        return {document[IDENTITY]: document for document in documents}
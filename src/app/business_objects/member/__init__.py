@@ -1,4 +1,4 @@
-from app.business_objects.member.repository import Members
+from app.business_objects.member.repository import AsyncMembers, Members
 
 
 # =========================================================
@@ -6,3 +6,10 @@ from app.business_objects.member.repository import Members
 # =========================================================
 def inject_members() -> Members:
     return Members()
+
+
+# =========================================================
+# FUNCTION INJECT ASYNC MEMBERS
+# =========================================================
+def inject_async_members() -> AsyncMembers:
+    return AsyncMembers()
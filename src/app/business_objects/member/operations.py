@@ -1,5 +1,7 @@
+import uuid
+
 from app.business_objects.core.ops import BusinessOperation
-from app.business_objects.member import Members
+from app.business_objects.member import AsyncMembers, Members
 from app.resources.members import MemberCreationRequest
 
 
@@ -11,15 +13,11 @@ class CreateMemberOperation(BusinessOperation):
     # -----------------------------------------------------
     # CONSTRUCTOR
     # -----------------------------------------------------
-    def __init__(
-            self,
-            member_request: MemberCreationRequest,
-            members: Members
-    ):
+    def __init__(self, member_request: MemberCreationRequest, members: Members):
         self.members = members
-        self.member_request: MemberCreationRequest = \
-            member_request
+        self.member_request: MemberCreationRequest = member_request
         self.member_dict = self.member_request.dict()
+        self.member_dict["id"] = str(uuid.uuid4())
         self.perform_transaction()
 
     # -----------------------------------------------------
@@ -34,11 +32,41 @@ class CreateMemberOperation(BusinessOperation):
     # -----------------------------------------------------
     def perform_transaction(self):
 
-        mongo_id = self.members.create(
-            self.member_request.dict(),
-            self.members
-        )
-        self.member_dict['_id'] = str(
-            mongo_id
-        )
+        mongo_id = self.members.create(self.member_dict.copy())
+        self.member_dict["_id"] = str(mongo_id)
+
+
+# =========================================================
+# CLASS ASYNC CREATE MEMBER OPERATION
+# =========================================================
+class AsyncCreateMemberOperation(BusinessOperation):
+    """
+    Async counterpart of CreateMemberOperation. The
+    transaction is a coroutine, so it is not performed by the
+    constructor and must be awaited by the caller.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, member_request: MemberCreationRequest, members: AsyncMembers):
+        self.members = members
+        self.member_request: MemberCreationRequest = member_request
+        self.member_dict = self.member_request.dict()
+        self.member_dict["id"] = str(uuid.uuid4())
 
+    # -----------------------------------------------------
+    # PROPERTY OPERATION RESULT
+    # -----------------------------------------------------
+    @property
+    def operation_result(self) -> any:
+        return self.member_dict
+
+    # -----------------------------------------------------
+    # METHOD PERFORM TRANSACTION
+    # -----------------------------------------------------
+    async def perform_transaction(self):
+
+        mongo_id = await self.members.create(self.member_dict.copy())
+        self.member_dict["_id"] = str(mongo_id)
+        return self.member_dict
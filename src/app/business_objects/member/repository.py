@@ -1,5 +1,12 @@
 from typing import List
 from app.business_objects.core.dao import EntityRepository
+from app.business_objects.core.async_dao import AsyncEntityRepository
+from app.business_objects.core.cache import CachePolicy
+from app.business_objects.core.indexes import IndexSpec
+
+# Members are read far more often than they are written
+MEMBER_CACHE_POLICY = CachePolicy(keys=("id",), ttl=60)
+MEMBER_INDEX_FIELDS: tuple = ("id", "email")
 
 
 # =========================================================
@@ -16,4 +23,42 @@ class Members(EntityRepository):
     # GET INDEX FIELDS
     # -----------------------------------------------------
     def get_index_fields(self) -> List[str]:
-        return ["id", "email"]
+        return list(MEMBER_INDEX_FIELDS)
+
+    # -----------------------------------------------------
+    # GET CACHE POLICY
+    # -----------------------------------------------------
+    def get_cache_policy(self) -> CachePolicy:
+        return MEMBER_CACHE_POLICY
+
+    # -----------------------------------------------------
+    # GET INDEX SPECS
+    # -----------------------------------------------------
+    def get_index_specs(self) -> List[IndexSpec]:
+        return [
+            IndexSpec("id", unique=True, partial_filter={"id": {"$type": "string"}}),
+            IndexSpec("email"),
+        ]
+
+
+# =========================================================
+# CLASS ASYNC MEMBERS
+# =========================================================
+class AsyncMembers(AsyncEntityRepository):
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        super().__init__(collection_name="members")
+
+    # -----------------------------------------------------
+    # GET INDEX FIELDS
+    # -----------------------------------------------------
+    def get_index_fields(self) -> List[str]:
+        return list(MEMBER_INDEX_FIELDS)
+
+    # -----------------------------------------------------
+    # GET CACHE POLICY
+    # -----------------------------------------------------
+    def get_cache_policy(self) -> CachePolicy:
+        return MEMBER_CACHE_POLICY
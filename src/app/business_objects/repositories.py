@@ -0,0 +1,18 @@
+from typing import List
+
+from app.business_objects.core.dao import EntityRepository
+from app.business_objects.finding import Findings
+from app.business_objects.member import Members
+from app.business_objects.user import Users
+
+
+# =========================================================
+# FUNCTION GET INDEXED REPOSITORIES
+# =========================================================
+def get_indexed_repositories() -> List[EntityRepository]:
+    """
+    Repositories whose declared indexes are provisioned on
+    startup and by the manage_indexes command.
+    :return: List of repositories
+    """
+    return [Users(), Members(), Findings()]
@@ -1,7 +1,7 @@
 import uuid
 from typing import Optional, List
 
-from app.business_objects.user.repository import Users
+from app.business_objects.user.repository import AsyncUsers, Users
 from pydantic import BaseModel, Field
 
 
@@ -12,6 +12,13 @@ def inject_users() -> Users:
     return Users()
 
 
+# =========================================================
+# FUNCTION INJECT ASYNC USERS
+# =========================================================
+def inject_async_users() -> AsyncUsers:
+    return AsyncUsers()
+
+
 # =========================================================
 # CLASS USER
 # =========================================================
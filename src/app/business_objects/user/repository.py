@@ -1,6 +1,12 @@
 from typing import List
 from app.business_objects.core.dao import EntityRepository
-from app.business_objects.core.dao import inject_mongodb_error_handling
+from app.business_objects.core.async_dao import AsyncEntityRepository
+from app.business_objects.core.indexes import IndexSpec
+
+# Users declare no CachePolicy: their lookups fetch the
+# password hash and salt, which are kept out of the document
+# cache
+USER_INDEX_FIELDS: tuple = ("username", "id", "email")
 
 
 # =========================================================
@@ -23,17 +29,63 @@ class Users(EntityRepository):
     # GET INDEX FIELDS
     # -----------------------------------------------------
     def get_index_fields(self) -> List[str]:
-        return ["id", "email"]
+        return list(USER_INDEX_FIELDS)
+
+    # -----------------------------------------------------
+    # GET INDEX SPECS
+    # -----------------------------------------------------
+    def get_index_specs(self) -> List[IndexSpec]:
+        return [
+            IndexSpec("username", unique=True),
+            IndexSpec("id"),
+            IndexSpec("email"),
+        ]
+
+    # -----------------------------------------------------
+    # GET BY USERNAME
+    # -----------------------------------------------------
+    def get_by_username(self, username: str, projection: dict or None = None) -> dict:
+        """
+        Gets a user by its username if it exists. Otherwise,
+        it throws an exception
+        :param username: The username of the user
+        :param projection: Optional MongoDB projection
+        :return: dict
+        """
+        return self.find_one({"username": username}, projection, unique=True)
+
+
+# =========================================================
+# CLASS ASYNC USERS
+# =========================================================
+class AsyncUsers(AsyncEntityRepository):
+    """
+    Asyncio counterpart of the Users repository.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        super().__init__(collection_name="users")
+
+    # -----------------------------------------------------
+    # GET INDEX FIELDS
+    # -----------------------------------------------------
+    def get_index_fields(self) -> List[str]:
+        return list(USER_INDEX_FIELDS)
 
     # -----------------------------------------------------
     # GET BY USERNAME
     # -----------------------------------------------------
-    @inject_mongodb_error_handling
-    def get_by_username(self, username: str) -> dict or None:
+    async def get_by_username(
+        self, username: str, projection: dict or None = None
+    ) -> dict:
         """
         Gets a user by its username if it exists. Otherwise,
         it throws an exception
         :param username: The username of the user
-        :return: dict or None
+        :param projection: Optional MongoDB projection
+        :return: dict
         """
-        return self.get({"username": username}).pop()
+        return await self.find_one({"username": username}, projection, unique=True)
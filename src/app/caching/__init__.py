@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Tuple
+
+
+# =========================================================
+# CLASS TTL CACHE
+# =========================================================
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries also
+    expire after a time to live. Expired entries are dropped
+    lazily when they are read, or when they are the least
+    recently used entry of a full cache.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, max_size: int, ttl: float or None = None):
+        """
+        :param max_size: Maximum number of entries. Zero
+        disables the cache
+        :param ttl: Default time to live in seconds. None keeps
+        entries until they are evicted
+        """
+        self.max_size: int = max_size
+        self.ttl: float or None = ttl
+        self.__lock = threading.Lock()
+        self.__entries: "OrderedDict[Hashable, Tuple[object, float]]" = OrderedDict()
+        self.__counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    # -----------------------------------------------------
+    # METHOD GET
+    # -----------------------------------------------------
+    def get(self, key: Hashable, default=None):
+        """
+        :param key: Key of the entry
+        :param default: Returned when the key is not cached
+        or its entry expired
+        :return: Cached value or default
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__counters["misses"] += 1
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self.__entries[key]
+                self.__counters["expirations"] += 1
+                self.__counters["misses"] += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.__counters["hits"] += 1
+            return value
+
+    # -----------------------------------------------------
+    # METHOD SET
+    # -----------------------------------------------------
+    def set(self, key: Hashable, value, ttl: float or None = None):
+        """
+        :param key: Key of the entry
+        :param value: Value to cache
+        :param ttl: Time to live in seconds. Defaults to the
+        ttl of the cache
+        """
+        if self.max_size <= 0:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = float("inf") if ttl is None else time.monotonic() + ttl
+        with self.__lock:
+            self.__entries[key] = (value, expires_at)
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.max_size:
+                self.__evict()
+
+    # -----------------------------------------------------
+    # METHOD EVICT
+    # -----------------------------------------------------
+    def __evict(self):
+        # Pops the least recently used entries, in constant
+        # time; those already expired are counted as such
+        now = time.monotonic()
+        while len(self.__entries) > self.max_size:
+            _, (_, expires_at) = self.__entries.popitem(last=False)
+            if expires_at <= now:
+                self.__counters["expirations"] += 1
+            else:
+                self.__counters["evictions"] += 1
+
+    # -----------------------------------------------------
+    # METHOD DELETE
+    # -----------------------------------------------------
+    def delete(self, key: Hashable) -> bool:
+        with self.__lock:
+            return self.__entries.pop(key, None) is not None
+
+    # -----------------------------------------------------
+    # METHOD DELETE WHERE
+    # -----------------------------------------------------
+    def delete_where(self, predicate) -> int:
+        """
+        Removes every entry whose value matches the predicate
+        :param predicate: Callable receiving a cached value
+        :return: Number of removed entries
+        """
+        with self.__lock:
+            keys = [
+                key for key, (value, _) in self.__entries.items() if predicate(value)
+            ]
+            for key in keys:
+                del self.__entries[key]
+            return len(keys)
+
+    # -----------------------------------------------------
+    # METHOD CLEAR
+    # -----------------------------------------------------
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    # -----------------------------------------------------
+    # METHOD CONTAINS
+    # -----------------------------------------------------
+    def __contains__(self, key: Hashable) -> bool:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    # -----------------------------------------------------
+    # METHOD LEN
+    # -----------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    # -----------------------------------------------------
+    # PROPERTY STATISTICS
+    # -----------------------------------------------------
+    @property
+    def statistics(self) -> dict:
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "max_size": self.max_size,
+                **self.__counters,
+            }
@@ -1,13 +1,139 @@
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Callable, Mapping, Tuple
+
 from confite import Confite
 from dotenv import load_dotenv
-from pymongo import MongoClient, database
-from app.logging import AbstractLogger, StandardOutputLogger
+from pymongo import database
+from pymongo.asynchronous.database import AsyncDatabase
+from app.database import get_client_registry
+from app.logging import AbstractLogger, configure_logging, get_logger
 from urllib3.exceptions import InsecureRequestWarning
 from urllib3 import disable_warnings
 import logging
+import os
+import signal
+import threading
 
 disable_warnings(InsecureRequestWarning)
 
+ENV_VARIABLE_NAMES: list = [
+    "MONGO_USER",
+    "MONGO_PASSWORD",
+    "MONGO_SERVER",
+    "MONGO_DB",
+    "MONGO_PORT",
+    "MONGO_TLS_CONNECTION",
+    "MONGO_REPLICA_SET",
+    "MONGO_CLUSTER",
+    "MONGO_SRV",
+    "OIDC_DISCOVERY_ENDPOINT",
+    "OIDC_CLIENT_ID",
+    "OIDC_CLIENT_SECRET",
+    "SESSION_MIDDLEWARE_KEY",
+    "API_VERSION",
+    "QUERY_LIMIT",
+    "LOG_LEVEL",
+    "JWT_SECRET_KEY",
+    "JWT_SIGN_ALGORITHM",
+    "JWT_TOKEN_DURATION_IN_MINUTES",
+]
+# Settings that fall back to a default when they are not set
+OPTIONAL_ENV_VARIABLE_NAMES: list = [
+    "MONGO_MAX_POOL_SIZE",
+    "MONGO_MIN_POOL_SIZE",
+    "MONGO_MAX_IDLE_TIME_MS",
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS",
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS",
+    "MONGO_AUTO_INDEX",
+    "QUERY_BATCH_SIZE",
+    "MONGO_BULK_CHUNK_SIZE",
+    "INGESTION_MAX_IN_FLIGHT",
+    "INGESTION_MAX_RECORD_BYTES",
+    "MONGO_RETRY_ATTEMPTS",
+    "MONGO_RETRY_BASE_DELAY_MS",
+    "MONGO_RETRY_MAX_DELAY_MS",
+    "MONGO_OPERATION_TIMEOUT_MS",
+    "MONGO_BREAKER_FAILURE_THRESHOLD",
+    "MONGO_BREAKER_RESET_SECONDS",
+    "MONGO_READ_PREFERENCE",
+    "MONGO_MAX_STALENESS_SECONDS",
+    "MONGO_READ_CONCERN",
+    "MONGO_WRITE_CONCERN",
+    "PASSWORD_HASHING_WORKERS",
+    "PASSWORD_HASHING_QUEUE_SIZE",
+    "PASSWORD_HASHING_EXECUTOR",
+    "PASSWORD_HASHING_PROFILE",
+    "TOKEN_CACHE_SIZE",
+    "DOCUMENT_CACHE_ENABLED",
+    "JWT_KEYS_DIRECTORY",
+    "JWT_ACTIVE_KEY_ID",
+    "OIDC_METADATA_TTL_SECONDS",
+    "OIDC_HTTP_TIMEOUT_SECONDS",
+    "LOG_MODULE_LEVELS",
+    "LOG_SAMPLE_RATES",
+]
+
+
+# ---------------------------------------------------------
+# CLASS SETTINGS
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class Settings:
+    """
+    Immutable snapshot of every setting, parsed and converted
+    once when the context is built or reloaded so reading a
+    setting on the request path is a plain attribute access.
+    Every field can be read from the ServerContext as well,
+    e.g. get_context().query_limit.
+    """
+
+    mongo_db: str
+    mongo_uri_with_tls: str
+    mongo_uri_without_tls: str
+    mongo_tls_required: bool
+    mongo_cluster: bool
+    mongo_replica_set: str
+    mongo_pool_options: Mapping[str, int]
+    mongo_auto_index: bool
+    oidc_discovery_endpoint: str
+    oidc_client_id: str
+    oidc_client_secret: str
+    middleware_key: str
+    api_version: str
+    query_limit: int
+    query_batch_size: int
+    bulk_chunk_size: int
+    ingestion_max_in_flight: int
+    ingestion_max_record_bytes: int
+    mongo_retry_attempts: int
+    mongo_retry_base_delay_ms: int
+    mongo_retry_max_delay_ms: int
+    mongo_operation_timeout_ms: int
+    mongo_breaker_failure_threshold: int
+    mongo_breaker_reset_seconds: int
+    mongo_read_preference: str
+    mongo_max_staleness_seconds: int
+    mongo_read_concern: str
+    mongo_write_concern: str
+    password_hashing_workers: int
+    password_hashing_queue_size: int
+    password_hashing_executor: str
+    password_hashing_profile: str
+    token_cache_size: int
+    document_cache_enabled: bool
+    jwt_keys_directory: str
+    jwt_active_key_id: str
+    oidc_metadata_ttl: int
+    oidc_http_timeout: int
+    log_module_levels: Mapping[str, int]
+    log_sample_rates: Mapping[int, float]
+    log_level: int
+    jwt_key: str
+    jwt_signing_algorithm: str
+    jwt_token_duration: int
+
 
 # ---------------------------------------------------------
 # CLASS HEIMDALL SERVER SETTINGS
@@ -28,6 +154,133 @@ class ServerContext(Confite):
     # -----------------------------------------------------
     def __init__(self, env_variable_names: list):
         super().__init__(env_variable_names)
+        self.__env_variable_names: list = env_variable_names
+        self.__load_optional_variables()
+        self.__settings: Settings = self.__build_settings()
+        self.__configure_logging()
+
+    # -----------------------------------------------------
+    # PROPERTY SETTINGS
+    # -----------------------------------------------------
+    @property
+    def settings(self) -> Settings:
+        return self.__settings
+
+    # -----------------------------------------------------
+    # METHOD RELOAD
+    # -----------------------------------------------------
+    def reload(self) -> Settings:
+        """
+        Re-reads the environment and atomically swaps the
+        settings snapshot. Objects that keep a reference to
+        this context observe the new values immediately;
+        objects built from the previous values are rebuilt by
+        their reload listeners, see reload_context.
+        :return: The new settings snapshot
+        """
+        self.config_map = Confite(self.__env_variable_names).config_map
+        self.__load_optional_variables()
+        self.__settings = self.__build_settings()
+        self.__configure_logging()
+        return self.__settings
+
+    # -----------------------------------------------------
+    # METHOD LOAD OPTIONAL VARIABLES
+    # -----------------------------------------------------
+    def __load_optional_variables(self):
+        for variable in OPTIONAL_ENV_VARIABLE_NAMES:
+            try:
+                self.config_map[variable] = self.load_env_variable(variable)
+            except ValueError:
+                # Not set: the default of the setting applies
+                pass
+
+    # -----------------------------------------------------
+    # METHOD BUILD SETTINGS
+    # -----------------------------------------------------
+    def __build_settings(self) -> Settings:
+        return Settings(
+            mongo_db=self.as_str("MONGO_DB"),
+            mongo_uri_with_tls=self.connection_uri(tls=True),
+            mongo_uri_without_tls=self.connection_uri(tls=False),
+            mongo_tls_required=self.as_int("MONGO_TLS_CONNECTION") == 1,
+            mongo_cluster=self.as_int("MONGO_CLUSTER") == 1,
+            mongo_replica_set=self.as_str("MONGO_REPLICA_SET"),
+            mongo_pool_options=MappingProxyType(self.__read_pool_options()),
+            mongo_auto_index=self.as_int_or_default("MONGO_AUTO_INDEX", 1) == 1,
+            oidc_discovery_endpoint=self.as_str("OIDC_DISCOVERY_ENDPOINT"),
+            oidc_client_id=self.as_str("OIDC_CLIENT_ID"),
+            oidc_client_secret=self.as_str("OIDC_CLIENT_SECRET"),
+            middleware_key=self.as_str("SESSION_MIDDLEWARE_KEY"),
+            api_version=self.as_str("API_VERSION"),
+            query_limit=self.as_int("QUERY_LIMIT"),
+            query_batch_size=self.as_int_or_default("QUERY_BATCH_SIZE", 500),
+            bulk_chunk_size=self.as_int_or_default("MONGO_BULK_CHUNK_SIZE", 1000),
+            ingestion_max_in_flight=self.as_int_or_default(
+                "INGESTION_MAX_IN_FLIGHT", 4
+            ),
+            ingestion_max_record_bytes=self.as_int_or_default(
+                "INGESTION_MAX_RECORD_BYTES", 1024 * 1024
+            ),
+            mongo_retry_attempts=self.as_int_or_default("MONGO_RETRY_ATTEMPTS", 3),
+            mongo_retry_base_delay_ms=self.as_int_or_default(
+                "MONGO_RETRY_BASE_DELAY_MS", 50
+            ),
+            mongo_retry_max_delay_ms=self.as_int_or_default(
+                "MONGO_RETRY_MAX_DELAY_MS", 1000
+            ),
+            mongo_operation_timeout_ms=self.as_int_or_default(
+                "MONGO_OPERATION_TIMEOUT_MS", 10000
+            ),
+            mongo_breaker_failure_threshold=self.as_int_or_default(
+                "MONGO_BREAKER_FAILURE_THRESHOLD", 5
+            ),
+            mongo_breaker_reset_seconds=self.as_int_or_default(
+                "MONGO_BREAKER_RESET_SECONDS", 30
+            ),
+            mongo_read_preference=self.as_str_or_default("MONGO_READ_PREFERENCE", None),
+            mongo_max_staleness_seconds=self.as_int_or_default(
+                "MONGO_MAX_STALENESS_SECONDS", None
+            ),
+            mongo_read_concern=self.as_str_or_default("MONGO_READ_CONCERN", None),
+            mongo_write_concern=self.as_str_or_default("MONGO_WRITE_CONCERN", None),
+            password_hashing_workers=self.as_int_or_default(
+                "PASSWORD_HASHING_WORKERS", min(os.cpu_count() or 1, 4)
+            ),
+            password_hashing_queue_size=self.as_int_or_default(
+                "PASSWORD_HASHING_QUEUE_SIZE", 32
+            ),
+            password_hashing_executor=self.as_str_or_default(
+                "PASSWORD_HASHING_EXECUTOR", "thread"
+            ),
+            password_hashing_profile=self.as_str_or_default(
+                "PASSWORD_HASHING_PROFILE", "interactive"
+            ),
+            token_cache_size=self.as_int_or_default("TOKEN_CACHE_SIZE", 10000),
+            document_cache_enabled=bool(
+                self.as_int_or_default("DOCUMENT_CACHE_ENABLED", 0) == 1
+            ),
+            jwt_keys_directory=self.as_str_or_default("JWT_KEYS_DIRECTORY", None),
+            jwt_active_key_id=self.as_str_or_default("JWT_ACTIVE_KEY_ID", None),
+            oidc_metadata_ttl=self.as_int_or_default("OIDC_METADATA_TTL_SECONDS", 3600),
+            oidc_http_timeout=self.as_int_or_default("OIDC_HTTP_TIMEOUT_SECONDS", 5),
+            log_level=self.__parse_log_level(self.as_str("LOG_LEVEL")),
+            log_module_levels=MappingProxyType(
+                {
+                    name: self.__parse_log_level(level)
+                    for name, level in self.__read_pairs("LOG_MODULE_LEVELS").items()
+                }
+            ),
+            log_sample_rates=MappingProxyType(
+                {
+                    self.__parse_log_level(level): float(rate)
+                    for level, rate in self.__read_pairs("LOG_SAMPLE_RATES").items()
+                }
+            ),
+            jwt_key=self.as_str("JWT_SECRET_KEY"),
+            jwt_signing_algorithm=self.as_str("JWT_SIGN_ALGORITHM"),
+            jwt_token_duration=self.as_int("JWT_TOKEN_DURATION_IN_MINUTES"),
+        )
 
     # -----------------------------------------------------
     # BUILD CONNECTION STRING
@@ -42,18 +295,97 @@ class ServerContext(Confite):
             return f"mongodb+srv://{user}:{pwd}@{host}/{db}"
         return f"mongodb://{user}:{pwd}@{host}:{port}/{db}"
 
+    # -----------------------------------------------------
+    # AS INT OR DEFAULT
+    # -----------------------------------------------------
+    def as_int_or_default(self, key: str, default: int or None) -> int or None:
+        """
+        Reads an optional integer setting, one of the
+        OPTIONAL_ENV_VARIABLE_NAMES.
+        :param key: Name of the environment variable
+        :param default: Value used when the variable is not set
+        :return: int or the default value
+        """
+        return self.as_int(key) if self.has_value(key) else default
+
+    # -----------------------------------------------------
+    # METHOD CONFIGURE LOGGING
+    # -----------------------------------------------------
+    def __configure_logging(self):
+        configure_logging(
+            self.__settings.log_level,
+            self.__settings.log_module_levels,
+            self.__settings.log_sample_rates,
+        )
+
+    # -----------------------------------------------------
+    # READ PAIRS
+    # -----------------------------------------------------
+    def __read_pairs(self, key: str) -> dict:
+        """
+        Reads an optional setting made of comma separated
+        name=value pairs, e.g. "pymongo=WARNING,app.security=DEBUG"
+        :param key: Name of the environment variable
+        :return: Dict of name to value
+        """
+        value = self.as_str_or_default(key, "")
+        return dict(
+            pair.strip().split("=", 1) for pair in value.split(",") if "=" in pair
+        )
+
+    # -----------------------------------------------------
+    # AS STR OR DEFAULT
+    # -----------------------------------------------------
+    def as_str_or_default(self, key: str, default: str or None) -> str or None:
+        """
+        Reads an optional string setting, one of the
+        OPTIONAL_ENV_VARIABLE_NAMES.
+        :param key: Name of the environment variable
+        :param default: Value used when the variable is not set
+        :return: str or the default value
+        """
+        return self.as_str(key) if self.has_value(key) else default
+
     # -----------------------------------------------------
     # TLS_REQUIRED
     # -----------------------------------------------------
     def tls_required(self) -> bool:
-        return self.as_int("MONGO_TLS_CONNECTION") == 1
+        return self.__settings.mongo_tls_required
+
+    # -----------------------------------------------------
+    # METHOD READ POOL OPTIONS
+    # -----------------------------------------------------
+    def __read_pool_options(self) -> dict:
+        return {
+            "maxPoolSize": self.as_int_or_default("MONGO_MAX_POOL_SIZE", 100),
+            "minPoolSize": self.as_int_or_default("MONGO_MIN_POOL_SIZE", 0),
+            "maxIdleTimeMS": self.as_int_or_default("MONGO_MAX_IDLE_TIME_MS", 300000),
+            "waitQueueTimeoutMS": self.as_int_or_default(
+                "MONGO_WAIT_QUEUE_TIMEOUT_MS", 5000
+            ),
+            "serverSelectionTimeoutMS": self.as_int_or_default(
+                "MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000
+            ),
+        }
+
+    # -----------------------------------------------------
+    # METHOD CONNECTION URI
+    # -----------------------------------------------------
+    def connection_uri(self, tls: bool) -> str:
+        replica_set = ""
+        if self.as_int("MONGO_CLUSTER") == 1:
+            replica_set = f"&replicaSet={self.as_str('MONGO_REPLICA_SET')}"
+        uri = self.build_connection_string() + f"?authSource=admin{replica_set}"
+        if tls:
+            uri += "&tls=true"
+        return uri
 
     # -----------------------------------------------------
     # DATABASE
     # -----------------------------------------------------
     @property
     def database(self) -> database:
-        if self.tls_required:
+        if self.__settings.mongo_tls_required:
             return self.database_with_tls
         return self.database_without_tls
 
@@ -62,31 +394,49 @@ class ServerContext(Confite):
     # -----------------------------------------------------
     @property
     def database_without_tls(self) -> database:
-        print("Connecting without database encryption...")
-        return MongoClient(
-            self.build_connection_string() + f"?authSource=admin{self.replica_set}"
-        )[self.as_str("MONGO_DB")]
+        return get_client_registry().get_database(
+            self.__settings.mongo_uri_without_tls,
+            self.__settings.mongo_db,
+            **self.__settings.mongo_pool_options,
+        )
 
     # -----------------------------------------------------
     # DATABASE WITH TLS
     # -----------------------------------------------------
     @property
     def database_with_tls(self) -> database:
-        print(
-            self.build_connection_string()
-            + f"?authSource=admin{self.replica_set}&tls=true"
+        return get_client_registry().get_database(
+            self.__settings.mongo_uri_with_tls,
+            self.__settings.mongo_db,
+            **self.__settings.mongo_pool_options,
+        )
+
+    # -----------------------------------------------------
+    # ASYNC DATABASE
+    # -----------------------------------------------------
+    @property
+    def async_database(self) -> AsyncDatabase:
+        """
+        Database handle backed by the asyncio client of the
+        registry, for repositories used from async endpoints.
+        :return: AsyncDatabase
+        """
+        if self.__settings.mongo_tls_required:
+            uri = self.__settings.mongo_uri_with_tls
+        else:
+            uri = self.__settings.mongo_uri_without_tls
+        return get_client_registry().get_async_database(
+            uri,
+            self.__settings.mongo_db,
+            **self.__settings.mongo_pool_options,
         )
-        return MongoClient(
-            self.build_connection_string()
-            + f"?authSource=admin{self.replica_set}&tls=true"
-        )[self.as_str("MONGO_DB")]
 
     # -----------------------------------------------------
     # PROPERTY IS_CLUSTER
     # -----------------------------------------------------
     @property
     def is_cluster(self) -> bool:
-        return self.as_int("MONGO_CLUSTER") == 1
+        return self.__settings.mongo_cluster
 
     # -----------------------------------------------------
     # PROPERTY REPLICA SET
@@ -95,7 +445,7 @@ class ServerContext(Confite):
     def replica_set(self) -> str:
         replica_set_str = ""
         if self.is_cluster:
-            replica_set_str = f"&replicaSet={self.as_str('MONGO_REPLICA_SET')}"
+            replica_set_str = f"&replicaSet={self.__settings.mongo_replica_set}"
         return replica_set_str
 
     # -----------------------------------------------------
@@ -103,56 +453,25 @@ class ServerContext(Confite):
     # -----------------------------------------------------
     @property
     def logging(self) -> AbstractLogger:
-        return StandardOutputLogger()
-
-    # -----------------------------------------------------
-    # PROPERTY MIDDLEWARE KEY
-    # -----------------------------------------------------
-    @property
-    def middleware_key(self) -> str:
-        return self.as_str("SESSION_MIDDLEWARE_KEY")
-
-    # -----------------------------------------------------
-    # PROPERTY API_VERSION
-    # -----------------------------------------------------
-    @property
-    def api_version(self) -> str:
-        return self.as_str("API_VERSION")
+        return get_logger()
 
     # -----------------------------------------------------
-    # PROPERTY OIDC_CLIENT_ID
+    # METHOD LOGGER
     # -----------------------------------------------------
-    @property
-    def oidc_client_id(self) -> str:
-        return self.as_str("OIDC_CLIENT_ID")
-
-    # -----------------------------------------------------
-    # PROPERTY OIDC_CLIENT_SECRET
-    # -----------------------------------------------------
-    @property
-    def oidc_client_secret(self) -> str:
-        return self.as_str("OIDC_CLIENT_SECRET")
+    def logger(self, name: str) -> AbstractLogger:
+        """
+        :param name: Dotted name of the module, i.e. __name__,
+        so the levels of LOG_MODULE_LEVELS apply to it
+        :return: Logger of the module
+        """
+        return get_logger(name)
 
     # -----------------------------------------------------
-    # PROPERTY OIDC_DISCOVERY_ENDPOINT
+    # METHOD PARSE LOG LEVEL
     # -----------------------------------------------------
-    @property
-    def oidc_discovery_endpoint(self) -> str:
-        return self.as_str("OIDC_DISCOVERY_ENDPOINT")
-
-    # -----------------------------------------------------
-    # PROPERTY QUERY LIMIT
-    # -----------------------------------------------------
-    @property
-    def query_limit(self) -> int:
-        return self.as_int("QUERY_LIMIT")
-
-    # -----------------------------------------------------
-    # PROPERTY LOG LEVEL
-    # -----------------------------------------------------
-    @property
-    def log_level(self):
-        match self.as_str("LOG_LEVEL").upper():
+    @staticmethod
+    def __parse_log_level(level: str) -> int:
+        match level.upper():
             case "DEBUG":
                 return logging.DEBUG
             case "ERROR":
@@ -164,53 +483,132 @@ class ServerContext(Confite):
             case _:
                 return logging.INFO
 
-    # -----------------------------------------------------
-    # PROPERTY JWT KEY
-    # -----------------------------------------------------
-    @property
-    def jwt_key(self) -> str:
-        return self.as_str("JWT_SECRET_KEY")
 
-    # -----------------------------------------------------
-    # PROPERTY JWT SIGNING ALGORITHM
-    # -----------------------------------------------------
-    @property
-    def jwt_signing_algorithm(self) -> str:
-        return self.as_str("JWT_SIGN_ALGORITHM")
+# ---------------------------------------------------------
+# FUNCTION SETTING PROPERTY
+# ---------------------------------------------------------
+def _setting_property(name: str) -> property:
+    return property(attrgetter(f"settings.{name}"), doc=f"See Settings.{name}")
 
-    # -----------------------------------------------------
-    # PROPERTY JWT TOKEN DURATION
-    # -----------------------------------------------------
-    @property
-    def jwt_token_duration(self) -> int:
-        return self.as_int("JWT_TOKEN_DURATION_IN_MINUTES")
+
+# Every field of the settings snapshot is exposed as a read-only
+# property of the context, e.g. get_context().query_limit
+for _field in fields(Settings):
+    if not hasattr(ServerContext, _field.name):
+        setattr(ServerContext, _field.name, _setting_property(_field.name))
+
+
+_context: dict = {}
+_context_lock = threading.Lock()
+_reload_listeners: list = []
 
 
 # ---------------------------------------------------------
 # METHOD GET SETTINGS
 # ---------------------------------------------------------
 def get_context() -> ServerContext:
-    load_dotenv()
-    return ServerContext(
-        [
-            "MONGO_USER",
-            "MONGO_PASSWORD",
-            "MONGO_SERVER",
-            "MONGO_DB",
-            "MONGO_PORT",
-            "MONGO_TLS_CONNECTION",
-            "MONGO_REPLICA_SET",
-            "MONGO_CLUSTER",
-            "MONGO_SRV",
-            "OIDC_DISCOVERY_ENDPOINT",
-            "OIDC_CLIENT_ID",
-            "OIDC_CLIENT_SECRET",
-            "SESSION_MIDDLEWARE_KEY",
-            "API_VERSION",
-            "QUERY_LIMIT",
-            "LOG_LEVEL",
-            "JWT_SECRET_KEY",
-            "JWT_SIGN_ALGORITHM",
-            "JWT_TOKEN_DURATION_IN_MINUTES",
-        ]
-    )
+    """
+    Returns the process-wide server context. The environment
+    is only read the first time; later calls return the same
+    instance.
+    :return: ServerContext
+    """
+    context = _context.get("instance")
+    if context is not None:
+        return context
+    with _context_lock:
+        if "instance" not in _context:
+            load_dotenv()
+            _context["instance"] = ServerContext(ENV_VARIABLE_NAMES)
+    return _context["instance"]
+
+
+# ---------------------------------------------------------
+# METHOD RELOAD CONTEXT
+# ---------------------------------------------------------
+def reload_context() -> ServerContext:
+    """
+    Re-reads the dotenv file and the environment, swaps the
+    settings snapshot of the shared context in place and
+    notifies the reload listeners.
+    :return: ServerContext
+    """
+    context = get_context()
+    with _context_lock:
+        previous = context.settings
+        load_dotenv(override=True)
+        current = context.reload()
+    for listener in list(_reload_listeners):
+        try:
+            listener(previous, current)
+        except Exception as error:
+            context.logger(__name__).error(
+                "Reload listener %s failed: %s", listener.__qualname__, error
+            )
+    return context
+
+
+# ---------------------------------------------------------
+# METHOD ON RELOAD
+# ---------------------------------------------------------
+def on_reload(listener: Callable[[Settings, Settings], None]) -> Callable:
+    """
+    Registers a function called with the previous and the new
+    settings after every reload of the shared context, so
+    process-wide objects built from the previous settings can
+    be rebuilt. Can be used as a decorator.
+    :param listener: Function of (previous, current)
+    :return: The listener
+    """
+    _reload_listeners.append(listener)
+    return listener
+
+
+# ---------------------------------------------------------
+# METHOD SETTINGS CHANGED
+# ---------------------------------------------------------
+def settings_changed(
+    previous: Settings, current: Settings, names: Tuple[str, ...]
+) -> bool:
+    """
+    :param previous: Settings before the reload
+    :param current: Settings after the reload
+    :param names: Names of the Settings fields to compare
+    :return: True if any of the fields changed
+    """
+    return any(getattr(previous, name) != getattr(current, name) for name in names)
+
+
+# ---------------------------------------------------------
+# METHOD RELOAD ON SIGNAL
+# ---------------------------------------------------------
+def reload_on_signal(signum, frame) -> threading.Thread:
+    """
+    SIGHUP handler. The handler runs on the main thread
+    between two instructions, possibly while that thread
+    holds _context_lock, so the reload itself runs on its
+    own thread, which waits for the lock to be released.
+    :return: Thread reloading the settings
+    """
+    thread = threading.Thread(target=reload_context, name="context-reload", daemon=True)
+    thread.start()
+    return thread
+
+
+# ---------------------------------------------------------
+# METHOD INSTALL RELOAD SIGNAL HANDLER
+# ---------------------------------------------------------
+def install_reload_signal_handler() -> bool:
+    """
+    Reloads the settings when the process receives SIGHUP.
+    Signal handlers can only be installed from the main
+    thread of platforms that support SIGHUP.
+    :return: True if the handler was installed
+    """
+    if not hasattr(signal, "SIGHUP"):
+        return False
+    try:
+        signal.signal(signal.SIGHUP, reload_on_signal)
+    except ValueError:
+        return False
+    return True
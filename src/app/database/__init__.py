@@ -0,0 +1,295 @@
+import os
+import threading
+from typing import Dict, List, Tuple
+
+from pymongo import AsyncMongoClient, MongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.database import Database
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+    ConnectionReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+    PoolReadyEvent,
+)
+
+from app.metrics.mongodb import CommandMetrics, record_pool_wait
+
+
+# =========================================================
+# CLASS POOL STATISTICS
+# =========================================================
+class PoolStatistics(ConnectionPoolListener):
+    """
+    Connection pool listener that keeps running counters
+    of the pool activity of a single MongoClient so they can
+    be exposed for monitoring without touching the driver
+    internals.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__counters: Dict[str, int] = {
+            "pools": 0,
+            "connections_open": 0,
+            "connections_created": 0,
+            "connections_closed": 0,
+            "connections_checked_out": 0,
+            "checkouts_started": 0,
+            "checkouts_failed": 0,
+            "pool_clears": 0,
+        }
+
+    # -----------------------------------------------------
+    # METHOD INCREMENT
+    # -----------------------------------------------------
+    def __increment(self, counter: str, value: int = 1):
+        with self.__lock:
+            self.__counters[counter] += value
+
+    # -----------------------------------------------------
+    # METHOD SNAPSHOT
+    # -----------------------------------------------------
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Consistent copy of the current counters
+        :return: Dict with the name and value of every counter
+        """
+        with self.__lock:
+            return self.__counters.copy()
+
+    # -----------------------------------------------------
+    # POOL EVENTS
+    # -----------------------------------------------------
+    def pool_created(self, event: PoolCreatedEvent):
+        self.__increment("pools")
+
+    def pool_ready(self, event: PoolReadyEvent):
+        pass
+
+    def pool_cleared(self, event: PoolClearedEvent):
+        self.__increment("pool_clears")
+
+    def pool_closed(self, event: PoolClosedEvent):
+        self.__increment("pools", -1)
+
+    # -----------------------------------------------------
+    # CONNECTION EVENTS
+    # -----------------------------------------------------
+    def connection_created(self, event: ConnectionCreatedEvent):
+        self.__increment("connections_created")
+        self.__increment("connections_open")
+
+    def connection_ready(self, event: ConnectionReadyEvent):
+        pass
+
+    def connection_closed(self, event: ConnectionClosedEvent):
+        self.__increment("connections_closed")
+        self.__increment("connections_open", -1)
+
+    def connection_check_out_started(self, event: ConnectionCheckOutStartedEvent):
+        self.__increment("checkouts_started")
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent):
+        self.__increment("checkouts_failed")
+        record_pool_wait(event)
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent):
+        self.__increment("connections_checked_out")
+        record_pool_wait(event)
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent):
+        self.__increment("connections_checked_out", -1)
+
+
+# =========================================================
+# CLASS MONGO CLIENT REGISTRY
+# =========================================================
+class MongoClientRegistry:
+    """
+    Process-wide registry of MongoClient instances. A
+    MongoClient owns a connection pool and a set of monitor
+    threads, so it must be created once per process and
+    shared by every repository instead of being created per
+    request. Clients are keyed by connection string and pool
+    options, which allows several configurations to coexist.
+
+    The registry is fork-safe: a child process (e.g. a
+    gunicorn worker) never reuses the clients inherited from
+    its parent and lazily creates its own.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__pid: int = os.getpid()
+        self.__clients: Dict[Tuple, MongoClient] = {}
+        self.__statistics: Dict[Tuple, PoolStatistics] = {}
+        self.__command_metrics: CommandMetrics = CommandMetrics()
+
+    # -----------------------------------------------------
+    # METHOD RESET AFTER FORK
+    # -----------------------------------------------------
+    def reset_after_fork(self):
+        """
+        Forgets every client inherited from the parent
+        process. Inherited clients are not closed because
+        their sockets and threads belong to the parent.
+        :return: None
+        """
+        self.__lock = threading.Lock()
+        self.__pid = os.getpid()
+        self.__clients = {}
+        self.__statistics = {}
+
+    # -----------------------------------------------------
+    # METHOD GET OR CREATE CLIENT
+    # -----------------------------------------------------
+    def __get_or_create_client(self, client_class, uri: str, pool_options: dict):
+        if self.__pid != os.getpid():
+            self.reset_after_fork()
+        key = (client_class.__name__, uri, tuple(sorted(pool_options.items())))
+        client = self.__clients.get(key)
+        if client is not None:
+            return client
+        with self.__lock:
+            client = self.__clients.get(key)
+            if client is None:
+                statistics = PoolStatistics()
+                client = client_class(
+                    uri,
+                    event_listeners=[statistics, self.__command_metrics],
+                    **pool_options,
+                )
+                self.__statistics[key] = statistics
+                self.__clients[key] = client
+        return client
+
+    # -----------------------------------------------------
+    # METHOD GET CLIENT
+    # -----------------------------------------------------
+    def get_client(self, uri: str, **pool_options) -> MongoClient:
+        """
+        Returns the shared client for the given connection
+        string and pool options, creating it on first use.
+        :param uri: MongoDB connection string
+        :param pool_options: Keyword arguments passed to
+        MongoClient (pool size, timeouts, etc.)
+        :return: Shared MongoClient
+        """
+        return self.__get_or_create_client(MongoClient, uri, pool_options)
+
+    # -----------------------------------------------------
+    # METHOD GET ASYNC CLIENT
+    # -----------------------------------------------------
+    def get_async_client(self, uri: str, **pool_options) -> AsyncMongoClient:
+        """
+        Returns the shared asyncio client for the given
+        connection string and pool options. The client binds
+        to the event loop of the worker on first use.
+        :param uri: MongoDB connection string
+        :param pool_options: Keyword arguments passed to
+        AsyncMongoClient (pool size, timeouts, etc.)
+        :return: Shared AsyncMongoClient
+        """
+        return self.__get_or_create_client(AsyncMongoClient, uri, pool_options)
+
+    # -----------------------------------------------------
+    # METHOD GET DATABASE
+    # -----------------------------------------------------
+    def get_database(self, uri: str, name: str, **pool_options) -> Database:
+        return self.get_client(uri, **pool_options)[name]
+
+    # -----------------------------------------------------
+    # METHOD GET ASYNC DATABASE
+    # -----------------------------------------------------
+    def get_async_database(self, uri: str, name: str, **pool_options) -> AsyncDatabase:
+        return self.get_async_client(uri, **pool_options)[name]
+
+    # -----------------------------------------------------
+    # PROPERTY STATISTICS
+    # -----------------------------------------------------
+    @property
+    def statistics(self) -> List[dict]:
+        """
+        Pool counters of every registered client along with
+        its pool options. Only the server addresses are
+        reported, so credentials are never exposed.
+        :return: List of counters per client
+        """
+        output: list = []
+        for key, client in list(self.__clients.items()):
+            addresses = client.topology_description.server_descriptions()
+            output.append(
+                {
+                    "client": key[0],
+                    "hosts": [f"{host}:{port}" for host, port in addresses],
+                    "options": dict(key[2]),
+                    **self.__statistics[key].snapshot(),
+                }
+            )
+        return output
+
+    # -----------------------------------------------------
+    # METHOD RELEASE CLIENTS
+    # -----------------------------------------------------
+    def __release_clients(self) -> list:
+        with self.__lock:
+            clients = []
+            if self.__pid == os.getpid():
+                clients = list(self.__clients.values())
+            self.__clients = {}
+            self.__statistics = {}
+        return clients
+
+    # -----------------------------------------------------
+    # METHOD CLOSE
+    # -----------------------------------------------------
+    def close(self):
+        """
+        Closes every synchronous client owned by the current
+        process. Asyncio clients must be closed with
+        close_async from the event loop that owns them.
+        :return: None
+        """
+        for client in self.__release_clients():
+            if isinstance(client, MongoClient):
+                client.close()
+
+    # -----------------------------------------------------
+    # METHOD CLOSE ASYNC
+    # -----------------------------------------------------
+    async def close_async(self):
+        """
+        Closes every client owned by the current process,
+        including asyncio clients.
+        :return: None
+        """
+        for client in self.__release_clients():
+            if isinstance(client, AsyncMongoClient):
+                await client.close()
+            else:
+                client.close()
+
+
+_registry = MongoClientRegistry()
+os.register_at_fork(after_in_child=_registry.reset_after_fork)
+
+
+# ---------------------------------------------------------
+# FUNCTION GET CLIENT REGISTRY
+# ---------------------------------------------------------
+def get_client_registry() -> MongoClientRegistry:
+    return _registry
@@ -1,7 +1,17 @@
 from abc import ABCMeta, abstractmethod
+from logging.handlers import QueueHandler
+from typing import Dict, List, Mapping
+import atexit
+import datetime
 import enum
+import json
 import logging
-import datetime
+import os
+import queue
+import random
+import sys
+import threading
+import time
 
 
 # -----------------------------------------------------------------------------
@@ -29,19 +39,19 @@ class AbstractLogger:
     """
 
     @abstractmethod
-    def debug(self, message: str, **kwargs) -> dict:
+    def debug(self, message: str, *args, **kwargs):
         pass
 
     @abstractmethod
-    def info(self, message: str, **kwargs) -> dict:
+    def info(self, message: str, *args, **kwargs):
         pass
 
     @abstractmethod
-    def warning(self, message: str, **kwargs) -> dict:
+    def warning(self, message: str, *args, **kwargs):
         pass
 
     @abstractmethod
-    def error(self, message: str, **kwargs) -> dict:
+    def error(self, message: str, *args, **kwargs):
         pass
 
 
@@ -49,74 +59,390 @@ class AbstractLogger:
 # CLASS LOG EVENT
 # -----------------------------------------------------------------------------
 class LogEvent:
+    """
+    Structured log event. The message is a %-style template that is only
+    merged with its arguments when the event is written, on the log
+    pipeline thread.
+    """
 
     # -------------------------------------------------------------------------
     # CONSTRUCTOR
     # -------------------------------------------------------------------------
-    def __init__(self, message, level: LogLevel):
+    def __init__(self, message, level: LogLevel, args: tuple = (), fields: dict = None):
         self._message: str = message
+        self._args: tuple = args
         self._level: LogLevel = level
-        self._utc_datetime = datetime.datetime.utcnow()
+        self._fields: dict = fields or {}
+        self._created: float = time.time()
 
     # -------------------------------------------------------------------------
     # METHOD UTC TIMESTAMP
     # -------------------------------------------------------------------------
     @property
     def utc_timestamp(self) -> datetime.datetime:
-        return self._utc_datetime
+        return datetime.datetime.fromtimestamp(self._created, datetime.timezone.utc)
+
+    # -------------------------------------------------------------------------
+    # PROPERTY MESSAGE
+    # -------------------------------------------------------------------------
+    @property
+    def message(self) -> str:
+        if not self._args:
+            return str(self._message)
+        return str(self._message) % self._args
 
     # -------------------------------------------------------------------------
     # METHOD DICT
     # -------------------------------------------------------------------------
     def dict(self) -> dict:
         return {
-            "message": self._message,
+            **self._fields,
+            "message": self.message,
             "level": self._level.name,
-            "utc_datetime": self._utc_datetime,
+            "utc_datetime": self.utc_timestamp.isoformat(),
         }
 
     # -------------------------------------------------------------------------
     # METHOD STR
     # -------------------------------------------------------------------------
     def __str__(self) -> str:
-        return f"[{self._level.name}: " f"{str(self._utc_datetime)}]: {self._message}"
+        return (
+            f"[{self._level.name}: "
+            f"{self.utc_timestamp.isoformat()}]: {self.message}"
+        )
+
+
+# -----------------------------------------------------------------------------
+# CLASS JSON LINE FORMATTER
+# -----------------------------------------------------------------------------
+class JsonLineFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line. Records logged through
+    StandardOutputLogger carry a LogEvent with structured fields; records
+    of other libraries are formatted from the record itself.
+    """
+
+    # -------------------------------------------------------------------------
+    # METHOD FORMAT
+    # -------------------------------------------------------------------------
+    def format(self, record: logging.LogRecord) -> str:
+        event: LogEvent = getattr(record, "event", None)
+        if event is not None:
+            line = event.dict()
+        else:
+            line = {
+                "message": record.getMessage(),
+                "level": record.levelname,
+                "utc_datetime": datetime.datetime.fromtimestamp(
+                    record.created, datetime.timezone.utc
+                ).isoformat(),
+            }
+        line["logger"] = record.name
+        if record.exc_info:
+            line["exception"] = self.formatException(record.exc_info)
+        return json.dumps(line, default=str)
+
+
+# -----------------------------------------------------------------------------
+# CLASS NON BLOCKING QUEUE HANDLER
+# -----------------------------------------------------------------------------
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks nor formats on the calling thread.
+    Records are enqueued as they are, so formatting happens on the
+    pipeline thread, and records are dropped (and counted) when the queue
+    is full instead of waiting for the writer.
+    """
+
+    # -------------------------------------------------------------------------
+    # CONSTRUCTOR
+    # -------------------------------------------------------------------------
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped: int = 0
+
+    # -------------------------------------------------------------------------
+    # METHOD PREPARE
+    # -------------------------------------------------------------------------
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    # -------------------------------------------------------------------------
+    # METHOD ENQUEUE
+    # -------------------------------------------------------------------------
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+# -----------------------------------------------------------------------------
+# CLASS LOG PIPELINE
+# -----------------------------------------------------------------------------
+class LogPipeline:
+    """
+    Writes log records from a background thread. Request handlers only
+    append the record to a bounded queue; the pipeline thread formats the
+    records as JSON lines and writes every record that is waiting in the
+    queue, up to batch_size, with a single write and flush.
+    """
+
+    _STOP = object()
+
+    # -------------------------------------------------------------------------
+    # CONSTRUCTOR
+    # -------------------------------------------------------------------------
+    def __init__(self, stream=None, queue_size: int = 10000, batch_size: int = 256):
+        """
+        :param stream: Stream the lines are written to. Defaults to stdout
+        :param queue_size: Records waiting to be written before new records
+        are dropped
+        :param batch_size: Maximum records written per flush
+        """
+        self.stream = stream
+        self.queue_size: int = queue_size
+        self.batch_size: int = batch_size
+        self.formatter: JsonLineFormatter = JsonLineFormatter()
+        self.queue: queue.Queue = queue.Queue(queue_size)
+        self.handler: NonBlockingQueueHandler = NonBlockingQueueHandler(self.queue)
+        self.__thread: threading.Thread or None = None
+
+    # -------------------------------------------------------------------------
+    # METHOD START
+    # -------------------------------------------------------------------------
+    def start(self):
+        self.__thread = threading.Thread(
+            target=self.__run, name="log-pipeline", daemon=True
+        )
+        self.__thread.start()
+
+    # -------------------------------------------------------------------------
+    # METHOD STOP
+    # -------------------------------------------------------------------------
+    def stop(self):
+        """
+        Writes the pending records and stops the pipeline thread
+        """
+        if self.__thread is None or not self.__thread.is_alive():
+            return
+        self.queue.put(self._STOP)
+        self.__thread.join()
+        self.__thread = None
+
+    # -------------------------------------------------------------------------
+    # METHOD RUN
+    # -------------------------------------------------------------------------
+    def __run(self):
+        while True:
+            batch: list = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(record is self._STOP for record in batch)
+            self.__write([record for record in batch if record is not self._STOP])
+            if stop:
+                return
+
+    # -------------------------------------------------------------------------
+    # METHOD WRITE
+    # -------------------------------------------------------------------------
+    def __write(self, records: List[logging.LogRecord]):
+        lines: list = []
+        for record in records:
+            try:
+                lines.append(self.formatter.format(record))
+            except Exception:
+                self.handler.handleError(record)
+        if not lines:
+            return
+        stream = self.stream or sys.stdout
+        try:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+
+    # -------------------------------------------------------------------------
+    # METHOD RESET AFTER FORK
+    # -------------------------------------------------------------------------
+    def reset_after_fork(self):
+        """
+        The pipeline thread is not inherited by a forked child. The child
+        gets a new queue, since the inherited one may be locked, and its own
+        thread.
+        """
+        self.queue = queue.Queue(self.queue_size)
+        self.handler.queue = self.queue
+        self.start()
+
+
+ROOT_LOGGER_NAME: str = "app"
+
+_pipeline: dict = {}
+_pipeline_lock = threading.Lock()
+
+
+# -----------------------------------------------------------------------------
+# FUNCTION INSTALL LOG PIPELINE
+# -----------------------------------------------------------------------------
+def install_log_pipeline(stream=None) -> LogPipeline:
+    """
+    Routes the root logger through the log pipeline. Only the first call
+    installs it; later calls return the installed pipeline.
+    :param stream: Stream the lines are written to. Defaults to stdout
+    :return: LogPipeline
+    """
+    pipeline = _pipeline.get("instance")
+    if pipeline is not None:
+        return pipeline
+    with _pipeline_lock:
+        if "instance" not in _pipeline:
+            pipeline = LogPipeline(stream)
+            pipeline.start()
+            logging.getLogger().addHandler(pipeline.handler)
+            atexit.register(pipeline.stop)
+            _pipeline["instance"] = pipeline
+    return _pipeline["instance"]
+
+
+# -----------------------------------------------------------------------------
+# FUNCTION RESET PIPELINE AFTER FORK
+# -----------------------------------------------------------------------------
+def _reset_pipeline_after_fork():
+    pipeline = _pipeline.get("instance")
+    if pipeline is not None:
+        pipeline.reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pipeline_after_fork)
 
 
 # -----------------------------------------------------------------------------
 # CLASS SIMPLE LOGGER
 # -----------------------------------------------------------------------------
 class StandardOutputLogger(AbstractLogger):
-    def __init__(self):
-        logging.getLogger().setLevel(logging.DEBUG)
+    """
+    Logger that writes structured JSON lines to the standard output
+    through the log pipeline. Messages are %-style templates:
+
+        logger.debug("User %s authenticated", session)
+
+    The level, and then the sampling rate of the level, are checked before
+    anything is built, and the arguments are only formatted on the pipeline
+    thread, so a filtered call costs a couple of comparisons. Keyword
+    arguments are added as fields of the line.
+
+    Instances are shared; use get_logger() instead of the constructor.
+    """
+
+    def __init__(self, name: str = ROOT_LOGGER_NAME):
+        install_log_pipeline()
+        self._logger: logging.Logger = logging.getLogger(name)
+
+    # -------------------------------------------------------------------------
+    # METHOD LOG
+    # -------------------------------------------------------------------------
+    def _log(
+        self, level: int, log_level: LogLevel, message: str, args: tuple, fields: dict
+    ):
+        # Callers check that the level is enabled
+        rate = _sample_rates.get(level)
+        if rate is not None and random.random() >= rate:
+            return None
+        event = LogEvent(message=message, level=log_level, args=args, fields=fields)
+        self._logger.log(level, message, *args, extra={"event": event})
+        return event
 
     # -------------------------------------------------------------------------
     # METHOD DEBUG
     # -------------------------------------------------------------------------
-    def debug(self, message: str, **kwargs) -> dict:
-        event = LogEvent(message=message, level=LogLevel.DEBUG)
-        logging.debug(str(event))
-        return event.dict()
+    def debug(self, message: str, *args, **kwargs) -> LogEvent or None:
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return None
+        return self._log(logging.DEBUG, LogLevel.DEBUG, message, args, kwargs)
 
     # -------------------------------------------------------------------------
     # METHOD INFO
     # -------------------------------------------------------------------------
-    def info(self, message: str, **kwargs) -> dict:
-        event = LogEvent(message=message, level=LogLevel.INFO)
-        logging.info(str(event))
-        return event.dict()
+    def info(self, message: str, *args, **kwargs) -> LogEvent or None:
+        if not self._logger.isEnabledFor(logging.INFO):
+            return None
+        return self._log(logging.INFO, LogLevel.INFO, message, args, kwargs)
 
     # -------------------------------------------------------------------------
     # METHOD WARNING
     # -------------------------------------------------------------------------
-    def warning(self, message: str, **kwargs) -> dict:
-        event = LogEvent(message=message, level=LogLevel.WARNING)
-        logging.warning(str(event))
-        return event.dict()
+    def warning(self, message: str, *args, **kwargs) -> LogEvent or None:
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return None
+        return self._log(logging.WARNING, LogLevel.WARNING, message, args, kwargs)
 
     # -------------------------------------------------------------------------
     # METHOD ERROR
     # -------------------------------------------------------------------------
-    def error(self, message: str, **kwargs) -> dict:
-        event = LogEvent(message=message, level=LogLevel.ERROR)
-        logging.error(str(event))
-        return event.dict()
+    def error(self, message: str, *args, **kwargs) -> LogEvent or None:
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return None
+        return self._log(logging.ERROR, LogLevel.ERROR, message, args, kwargs)
+
+
+_loggers: Dict[str, StandardOutputLogger] = {}
+_loggers_lock = threading.Lock()
+_sample_rates: Dict[int, float] = {}
+_module_levels: Dict[str, int] = {}
+
+
+# -----------------------------------------------------------------------------
+# FUNCTION GET LOGGER
+# -----------------------------------------------------------------------------
+def get_logger(name: str = ROOT_LOGGER_NAME) -> StandardOutputLogger:
+    """
+    Returns the shared logger of a module, created on first use.
+    :param name: Dotted name of the logger, e.g. __name__. Levels set for
+    a module also apply to its submodules
+    :return: StandardOutputLogger
+    """
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+    with _loggers_lock:
+        if name not in _loggers:
+            _loggers[name] = StandardOutputLogger(name)
+    return _loggers[name]
+
+
+# -----------------------------------------------------------------------------
+# FUNCTION CONFIGURE LOGGING
+# -----------------------------------------------------------------------------
+def configure_logging(
+    level: int,
+    module_levels: Mapping[str, int] = None,
+    sample_rates: Mapping[int, float] = None,
+):
+    """
+    Applies the log settings. Can be called again to apply new settings;
+    module levels that are no longer configured are reset.
+    :param level: Level of the root logger
+    :param module_levels: Levels of specific loggers, by logger name
+    :param sample_rates: Fraction of the events of a level that are kept,
+    from 0 to 1. Levels without a rate are not sampled
+    """
+    install_log_pipeline()
+    logging.getLogger().setLevel(level)
+    module_levels = dict(module_levels or {})
+    for name in set(_module_levels) - set(module_levels):
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    for name, module_level in module_levels.items():
+        logging.getLogger(name).setLevel(module_level)
+    _module_levels.clear()
+    _module_levels.update(module_levels)
+    rates = {
+        sampled_level: min(max(rate, 0.0), 1.0)
+        for sampled_level, rate in (sample_rates or {}).items()
+    }
+    _sample_rates.clear()
+    _sample_rates.update(rates)
@@ -1,8 +1,54 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
-from app.context import get_context
+from app.business_objects.core.indexes import IndexManager
+from app.business_objects.core.invalidation import (
+    get_change_stream_invalidator,
+    install_change_stream_invalidator,
+)
+from app.business_objects.repositories import get_indexed_repositories
+from app.context import get_context, install_reload_signal_handler
+from app.database import get_client_registry
+from app.security.hashing import get_password_hashing_pool
+from app.resources.findings.endpoints import router as findings_router
+from app.resources.keys.endpoints import router as keys_router
+from app.metrics.http import MetricsMiddleware
 from app.resources.members.endpoints import router as members_router
+from app.resources.metrics.endpoints import router as metrics_router
+from app.resources.monitoring.endpoints import router as monitoring_router
+from app.resources.users.endpoints import router as users_router
+
+
+# -----------------------------------------------------------------------------
+# Application Lifespan
+# -----------------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    # Every worker process opens its own connection pool on startup and
+    # releases it on shutdown.
+    get_context().database
+    # Missing indexes are built in the background so boot is not blocked.
+    if get_context().mongo_auto_index:
+        IndexManager(get_indexed_repositories()).reconcile_in_background()
+    # Writes of the other workers invalidate the local document caches.
+    if get_context().document_cache_enabled:
+        install_change_stream_invalidator(
+            get_context(),
+            [
+                repository.collection_name
+                for repository in get_indexed_repositories()
+                if repository.document_cache is not None
+            ],
+        )
+    # SIGHUP refreshes the settings snapshot without restarting the worker.
+    install_reload_signal_handler()
+    yield
+    if get_change_stream_invalidator() is not None:
+        get_change_stream_invalidator().stop()
+    await get_client_registry().close_async()
+    get_password_hashing_pool().shutdown()
 
 
 # -----------------------------------------------------------------------------
@@ -15,6 +61,7 @@ app = FastAPI(
     openapi_url="/openapi.json",
     docs_url="/",
     redoc_url=None,
+    lifespan=lifespan,
 )
 
 # -----------------------------------------------------------------------------
@@ -36,5 +83,23 @@ app.add_middleware(
 # during authorization with w3id
 app.add_middleware(SessionMiddleware, secret_key=get_context().middleware_key)
 
+# Outermost middleware, so the recorded latency covers the whole stack
+app.add_middleware(MetricsMiddleware)
+
 # Members Router Inclusion
 app.include_router(members_router, prefix=f"/api/{get_context().api_version}")
+
+# Users Router Inclusion
+app.include_router(users_router, prefix=f"/api/{get_context().api_version}")
+
+# Findings Router Inclusion
+app.include_router(findings_router, prefix=f"/api/{get_context().api_version}")
+
+# Monitoring Router Inclusion
+app.include_router(monitoring_router, prefix=f"/api/{get_context().api_version}")
+
+# Keys Router Inclusion. Published at the root, where JWKS clients look for it
+app.include_router(keys_router)
+
+# Metrics Router Inclusion. Published at the root, where Prometheus scrapes it
+app.include_router(metrics_router)
@@ -0,0 +1,273 @@
+import bisect
+import threading
+from typing import Dict, List, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+# ---------------------------------------------------------
+# FUNCTION ESCAPE
+# ---------------------------------------------------------
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# ---------------------------------------------------------
+# FUNCTION FORMAT LABELS
+# ---------------------------------------------------------
+def _format_labels(
+    names: Tuple[str, ...], values: Tuple[str, ...], extra: str = ""
+) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+# ---------------------------------------------------------
+# FUNCTION FORMAT VALUE
+# ---------------------------------------------------------
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# =========================================================
+# CLASS METRIC
+# =========================================================
+class Metric:
+    """
+    Base of the metrics. Values are kept per combination of
+    label values and updated under a lock, which is cheaper
+    than any I/O on the request path.
+    """
+
+    TYPE: str = "untyped"
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self, name: str, documentation: str, label_names: Tuple[str, ...] = ()
+    ):
+        """
+        :param name: Metric name in Prometheus format
+        :param documentation: Help text
+        :param label_names: Names of the labels, in the order
+        their values are given
+        """
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------
+    # METHOD SAMPLES
+    # -----------------------------------------------------
+    def samples(self) -> List[str]:
+        raise NotImplementedError()
+
+    # -----------------------------------------------------
+    # METHOD RENDER
+    # -----------------------------------------------------
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+# =========================================================
+# CLASS COUNTER
+# =========================================================
+class Counter(Metric):
+    TYPE: str = "counter"
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self, name: str, documentation: str, label_names: Tuple[str, ...] = ()
+    ):
+        super().__init__(name, documentation, label_names)
+        self.__values: Dict[Tuple[str, ...], float] = {}
+
+    # -----------------------------------------------------
+    # METHOD INCREMENT
+    # -----------------------------------------------------
+    def increment(self, *label_values: str, amount: float = 1):
+        with self._lock:
+            self.__values[label_values] = self.__values.get(label_values, 0) + amount
+
+    # -----------------------------------------------------
+    # METHOD VALUE
+    # -----------------------------------------------------
+    def value(self, *label_values: str) -> float:
+        return self.__values.get(label_values, 0)
+
+    # -----------------------------------------------------
+    # METHOD SAMPLES
+    # -----------------------------------------------------
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self.__values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in values
+        ]
+
+
+# =========================================================
+# CLASS HISTOGRAM
+# =========================================================
+class Histogram(Metric):
+    TYPE: str = "histogram"
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        """
+        :param buckets: Upper bounds of the buckets, in
+        ascending order. +Inf is added automatically
+        """
+        super().__init__(name, documentation, label_names)
+        self.buckets: Tuple[float, ...] = tuple(buckets) + (float("inf"),)
+        # Per label values: [count per bucket (not cumulative), sum]
+        self.__values: Dict[Tuple[str, ...], list] = {}
+
+    # -----------------------------------------------------
+    # METHOD OBSERVE
+    # -----------------------------------------------------
+    def observe(self, value: float, *label_values: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self.__values.get(label_values)
+            if entry is None:
+                entry = self.__values[label_values] = [[0] * len(self.buckets), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    # -----------------------------------------------------
+    # METHOD COUNT
+    # -----------------------------------------------------
+    def count(self, *label_values: str) -> int:
+        entry = self.__values.get(label_values)
+        return sum(entry[0]) if entry else 0
+
+    # -----------------------------------------------------
+    # METHOD SAMPLES
+    # -----------------------------------------------------
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(
+                (labels, (list(counts), total))
+                for labels, (counts, total) in self.__values.items()
+            )
+        lines: List[str] = []
+        for labels, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    self.label_names, labels, f'le="{_format_value(bound)}"'
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            formatted = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{formatted} {_format_value(total)}")
+            lines.append(f"{self.name}_count{formatted} {cumulative}")
+        return lines
+
+
+# =========================================================
+# CLASS METRICS REGISTRY
+# =========================================================
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together in the Prometheus
+    text exposition format.
+    """
+
+    CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        self.__metrics: Dict[str, Metric] = {}
+        self.__lock = threading.Lock()
+
+    # -----------------------------------------------------
+    # METHOD REGISTER
+    # -----------------------------------------------------
+    def register(self, metric: Metric) -> Metric:
+        """
+        Registers a metric. Registering a name twice returns
+        the metric registered first.
+        :param metric: Metric to register
+        :return: The registered metric
+        """
+        with self.__lock:
+            return self.__metrics.setdefault(metric.name, metric)
+
+    # -----------------------------------------------------
+    # METHOD COUNTER
+    # -----------------------------------------------------
+    def counter(
+        self, name: str, documentation: str, label_names: Tuple[str, ...] = ()
+    ) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    # -----------------------------------------------------
+    # METHOD HISTOGRAM
+    # -----------------------------------------------------
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    # -----------------------------------------------------
+    # METHOD RENDER
+    # -----------------------------------------------------
+    def render(self) -> str:
+        with self.__lock:
+            metrics = list(self.__metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+# ---------------------------------------------------------
+# FUNCTION GET METRICS REGISTRY
+# ---------------------------------------------------------
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
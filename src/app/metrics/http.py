@@ -0,0 +1,74 @@
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import get_metrics_registry
+
+HTTP_REQUESTS = get_metrics_registry().counter(
+    "http_requests_total",
+    "HTTP requests by method, route and status code",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = get_metrics_registry().histogram(
+    "http_request_duration_seconds",
+    "Latency of HTTP requests until the response is sent",
+    ("method", "route"),
+)
+
+
+# =========================================================
+# CLASS METRICS MIDDLEWARE
+# =========================================================
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware that records the latency and status
+    of every HTTP request. Requests are labelled with the
+    path template of their route (e.g. /member/{member_id}),
+    not the raw path, to keep the number of series bounded.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    # -----------------------------------------------------
+    # METHOD ROUTE OF
+    # -----------------------------------------------------
+    @staticmethod
+    def route_of(scope: Scope) -> str:
+        router = scope.get("router")
+        if router is None:
+            return "unmatched"
+        for route in router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return getattr(route, "path", "unmatched")
+        return "unmatched"
+
+    # -----------------------------------------------------
+    # METHOD CALL
+    # -----------------------------------------------------
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = self.route_of(scope)
+            HTTP_REQUESTS.increment(scope["method"], route, str(status_code))
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started, scope["method"], route
+            )
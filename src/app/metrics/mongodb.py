@@ -0,0 +1,111 @@
+import threading
+from typing import Dict, Tuple
+
+from pymongo.monitoring import (
+    CommandFailedEvent,
+    CommandListener,
+    CommandStartedEvent,
+    CommandSucceededEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+)
+
+from app.metrics import get_metrics_registry
+
+# Commands whose first field is not the name of a collection
+COLLECTION_FIELDS: Dict[str, str] = {"getMore": "collection"}
+
+MONGODB_COMMANDS = get_metrics_registry().counter(
+    "mongodb_commands_total",
+    "MongoDB commands by collection, command and outcome",
+    ("collection", "command", "outcome"),
+)
+MONGODB_COMMAND_DURATION = get_metrics_registry().histogram(
+    "mongodb_command_duration_seconds",
+    "Latency of MongoDB commands as measured by the driver",
+    ("collection", "command"),
+)
+MONGODB_POOL_WAIT = get_metrics_registry().histogram(
+    "mongodb_pool_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    ("outcome",),
+)
+REPOSITORY_ERRORS = get_metrics_registry().counter(
+    "repository_errors_total",
+    "Errors handled by the repositories, by exception type",
+    ("error",),
+)
+REPOSITORY_RETRIES = get_metrics_registry().counter(
+    "repository_retries_total",
+    "Repository operations retried after a transient error, by operation",
+    ("operation",),
+)
+CIRCUIT_BREAKER_REJECTIONS = get_metrics_registry().counter(
+    "mongodb_circuit_breaker_rejections_total",
+    "Repository operations rejected while the circuit breaker is open",
+)
+
+
+# =========================================================
+# CLASS COMMAND METRICS
+# =========================================================
+class CommandMetrics(CommandListener):
+    """
+    Records the latency and outcome of every command sent by
+    a MongoClient. The collection is only known when the
+    command starts, so it is kept by request id until the
+    command finishes.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__collections: Dict[Tuple, str] = {}
+
+    # -----------------------------------------------------
+    # METHOD COLLECTION OF
+    # -----------------------------------------------------
+    @staticmethod
+    def collection_of(event: CommandStartedEvent) -> str:
+        value = event.command.get(
+            COLLECTION_FIELDS.get(event.command_name, event.command_name)
+        )
+        return value if isinstance(value, str) else ""
+
+    # -----------------------------------------------------
+    # COMMAND EVENTS
+    # -----------------------------------------------------
+    def started(self, event: CommandStartedEvent):
+        with self.__lock:
+            self.__collections[(event.connection_id, event.request_id)] = (
+                self.collection_of(event)
+            )
+
+    def succeeded(self, event: CommandSucceededEvent):
+        self.__record(event, "success")
+
+    def failed(self, event: CommandFailedEvent):
+        self.__record(event, "failure")
+
+    # -----------------------------------------------------
+    # METHOD RECORD
+    # -----------------------------------------------------
+    def __record(self, event, outcome: str):
+        with self.__lock:
+            collection = self.__collections.pop(
+                (event.connection_id, event.request_id), ""
+            )
+        MONGODB_COMMANDS.increment(collection, event.command_name, outcome)
+        MONGODB_COMMAND_DURATION.observe(
+            event.duration_micros / 1e6, collection, event.command_name
+        )
+
+
+# ---------------------------------------------------------
+# FUNCTION RECORD POOL WAIT
+# ---------------------------------------------------------
+def record_pool_wait(event: ConnectionCheckedOutEvent or ConnectionCheckOutFailedEvent):
+    outcome = "success" if isinstance(event, ConnectionCheckedOutEvent) else "failure"
+    MONGODB_POOL_WAIT.observe(event.duration, outcome)
@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+# =========================================================
+# CLASS INGESTION ERROR
+# =========================================================
+class IngestionError(BaseModel):
+
+    index: Optional[int] = Field(None, title="Position of the record in the body")
+
+    code: Optional[int] = Field(None, title="MongoDB error code")
+
+    message: Optional[str] = Field(None, title="Error message")
+
+
+# =========================================================
+# CLASS FINDING INGESTION REPORT
+# =========================================================
+class FindingIngestionReport(BaseModel):
+
+    received: int = Field(0, title="Records read from the body")
+
+    accepted: int = Field(
+        0, title="Findings stored, i.e. inserted, updated or unchanged"
+    )
+
+    inserted: int = Field(0, title="New findings")
+
+    updated: int = Field(0, title="Known findings whose content or last_seen changed")
+
+    unchanged: int = Field(0, title="Known findings that were not written")
+
+    rejected: int = Field(0, title="Records that are invalid or could not be written")
+
+    errors: List[IngestionError] = Field(
+        [], title="First errors, in the order they happened"
+    )
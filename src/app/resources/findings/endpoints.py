@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.business_objects.finding import AsyncFindings, inject_async_findings
+from app.business_objects.finding.ingestion import FindingIngestion, IngestionWriteError
+from app.resources.findings import FindingIngestionReport
+from app.resources.ingestion import MalformedBodyError, parse_records
+
+router = APIRouter()
+
+INGESTION_BODY: dict = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/x-ndjson": {"schema": {"type": "string"}},
+            "application/json": {
+                "schema": {"type": "array", "items": {"type": "object"}}
+            },
+        },
+    }
+}
+
+
+# =========================================================
+# INGEST FINDINGS
+# =========================================================
+@router.post(
+    "/findings:ingest",
+    tags=["Findings"],
+    response_model=FindingIngestionReport,
+    openapi_extra=INGESTION_BODY,
+)
+async def ingest_findings(
+    request: Request, findings: AsyncFindings = Depends(inject_async_findings)
+):
+    """
+    Ingests findings exported by a scanner, as NDJSON
+    (fastest) or as a JSON array. The body is parsed and
+    written while it is uploaded; invalid records are
+    rejected and reported without stopping the ingestion.
+    """
+    ingestion = FindingIngestion(findings)
+    records = parse_records(
+        request.stream(),
+        request.headers.get("content-type"),
+        findings.context.ingestion_max_record_bytes,
+    )
+    try:
+        return (await ingestion.ingest(records)).dict()
+    except MalformedBodyError as error:
+        # The records before the error were written
+        raise HTTPException(
+            status_code=400, detail={"message": str(error), **ingestion.report.dict()}
+        )
+    except IngestionWriteError as error:
+        # Ingesting the body again is safe: findings already
+        # written are left unchanged
+        raise HTTPException(
+            status_code=503,
+            detail={"message": str(error), **ingestion.report.dict()},
+            headers={"Retry-After": "1"},
+        )
@@ -0,0 +1,236 @@
+import codecs
+import json
+import re
+from typing import AsyncIterator, List, Tuple
+
+from app.resources.serialization import loads
+
+NDJSON_MEDIA_TYPES: tuple = (
+    "application/x-ndjson",
+    "application/jsonl",
+    "application/x-jsonlines",
+)
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+# =========================================================
+# CLASS MALFORMED BODY ERROR
+# =========================================================
+class MalformedBodyError(ValueError):
+    """
+    Raised when the rest of a body cannot be parsed, e.g. a
+    syntax error in a JSON array. Records parsed before it
+    are valid.
+    """
+
+
+# ---------------------------------------------------------
+# FUNCTION RECORD TOO LARGE
+# ---------------------------------------------------------
+def record_too_large(max_record_size: int) -> ValueError:
+    return ValueError(f"Record is larger than {max_record_size} bytes")
+
+
+# ---------------------------------------------------------
+# FUNCTION DECODE LINE
+# ---------------------------------------------------------
+def decode_line(line: bytes):
+    try:
+        return loads(line)
+    except ValueError as error:
+        return ValueError(f"Invalid JSON: {error}")
+
+
+# ---------------------------------------------------------
+# FUNCTION PARSE NDJSON
+# ---------------------------------------------------------
+async def parse_ndjson(
+    chunks: AsyncIterator[bytes], max_record_size: int
+) -> AsyncIterator[Tuple[int, object]]:
+    """
+    Incrementally parses newline delimited JSON. Only the
+    last, incomplete line of the body read so far is
+    buffered. A line that is not valid JSON, or longer than
+    max_record_size, is given as a ValueError and parsing
+    resumes on the next line.
+    :param chunks: Async iterator of the chunks of the body
+    :param max_record_size: Longest line kept in memory
+    :return: Async iterator of (position, record)
+    """
+    buffer: bytes = b""
+    skipping: bool = False
+    position: int = 0
+    async for chunk in chunks:
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if skipping:
+                skipping = False
+                yield position, record_too_large(max_record_size)
+                position += 1
+            elif line.strip():
+                if len(line) > max_record_size:
+                    yield position, record_too_large(max_record_size)
+                else:
+                    yield position, decode_line(line)
+                position += 1
+        if len(buffer) > max_record_size:
+            # Dropped up to the end of the line
+            skipping, buffer = True, b""
+    if skipping:
+        yield position, record_too_large(max_record_size)
+    elif buffer.strip():
+        yield position, decode_line(buffer)
+
+
+# =========================================================
+# CLASS JSON RECORD PARSER
+# =========================================================
+class JSONRecordParser:
+    """
+    Incremental parser of a JSON array of records, or of
+    records simply written one after the other, e.g. a
+    single object. Only the record being received is
+    buffered. Unlike NDJSON, a syntax error cannot be
+    skipped, since the end of the faulty record is unknown.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, max_record_size: int):
+        """
+        :param max_record_size: Largest record kept in memory
+        """
+        self.max_record_size: int = max_record_size
+        self.position: int = 0
+        self.__text: str = ""
+        self.__decoder = json.JSONDecoder()
+        self.__in_array: bool or None = None
+        self.__expect_value: bool = True
+        self.__closed: bool = False
+        self.__retry_size: int = 0
+
+    # -----------------------------------------------------
+    # METHOD FEED
+    # -----------------------------------------------------
+    def feed(self, data: str, final: bool = False) -> List[Tuple[int, object]]:
+        """
+        :param data: Next part of the body
+        :param final: Whether it is the end of the body
+        :return: Records completed by data, with their
+        position
+        :raise MalformedBodyError: When the body is not valid
+        """
+        text = self.__text + data
+        length = len(text)
+        index = 0
+        records = []
+        while True:
+            index = WHITESPACE.match(text, index).end()
+            if index == length:
+                break
+            if self.__closed:
+                raise MalformedBodyError("Unexpected data after the end of the array")
+            if self.__in_array is None:
+                self.__in_array = text[index] == "["
+                if self.__in_array:
+                    index += 1
+                    continue
+            if self.__in_array and (not self.__expect_value or self.position == 0):
+                if text[index] == "]":
+                    self.__closed = True
+                    index += 1
+                    continue
+                if not self.__expect_value:
+                    if text[index] != ",":
+                        raise MalformedBodyError(
+                            f"Expected ',' or ']' after record {self.position - 1}"
+                        )
+                    self.__expect_value = True
+                    index += 1
+                    continue
+            if not final and length - index < self.__retry_size:
+                break
+            try:
+                value, end = self.__decoder.raw_decode(text, index)
+            except json.JSONDecodeError as error:
+                if final:
+                    raise MalformedBodyError(
+                        f"Invalid JSON in record {self.position}: {error}"
+                    ) from error
+                if length - index > self.max_record_size:
+                    raise MalformedBodyError(
+                        f"Record {self.position} is not valid JSON or is larger "
+                        f"than {self.max_record_size} bytes"
+                    ) from error
+                # The record is incomplete. Decoding starts over
+                # from its beginning, so wait for it to double
+                # before trying again rather than on every chunk
+                self.__retry_size = 2 * (length - index)
+                break
+            if end == length and not final:
+                # A number may continue in the next chunk
+                break
+            if end - index > self.max_record_size:
+                value = record_too_large(self.max_record_size)
+            records.append((self.position, value))
+            self.position += 1
+            self.__retry_size = 0
+            self.__expect_value = not self.__in_array
+            index = end
+        self.__text = text[index:]
+        if final and self.__in_array and not self.__closed:
+            raise MalformedBodyError("The array is not terminated")
+        return records
+
+
+# ---------------------------------------------------------
+# FUNCTION PARSE JSON
+# ---------------------------------------------------------
+async def parse_json(
+    chunks: AsyncIterator[bytes], max_record_size: int
+) -> AsyncIterator[Tuple[int, object]]:
+    """
+    Incrementally parses a JSON array of records, see
+    JSONRecordParser.
+    :param chunks: Async iterator of the chunks of the body
+    :param max_record_size: Largest record kept in memory
+    :return: Async iterator of (position, record)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = JSONRecordParser(max_record_size)
+    try:
+        async for chunk in chunks:
+            for record in parser.feed(decoder.decode(chunk)):
+                yield record
+        for record in parser.feed(decoder.decode(b"", final=True), final=True):
+            yield record
+    except UnicodeDecodeError as error:
+        raise MalformedBodyError(f"The body is not UTF-8: {error.reason}") from error
+
+
+# ---------------------------------------------------------
+# FUNCTION PARSE RECORDS
+# ---------------------------------------------------------
+def parse_records(
+    chunks: AsyncIterator[bytes], media_type: str or None, max_record_size: int
+) -> AsyncIterator[Tuple[int, object]]:
+    """
+    Parses the records of a request body while it is
+    received, without buffering the whole body. NDJSON is
+    the fastest format: lines are decoded with orjson and a
+    malformed line only rejects that record.
+    :param chunks: Async iterator of the chunks of the body,
+    e.g. Request.stream()
+    :param media_type: Content type of the body. NDJSON for
+    application/x-ndjson, JSON for anything else
+    :param max_record_size: Largest record kept in memory
+    :return: Async iterator of (position, record), where
+    record is a ValueError for a record that cannot be
+    decoded. MalformedBodyError is raised when the rest of
+    the body cannot be parsed
+    """
+    if (media_type or "").split(";")[0].strip().lower() in NDJSON_MEDIA_TYPES:
+        return parse_ndjson(chunks, max_record_size)
+    return parse_json(chunks, max_record_size)
@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+from app.security.keys import get_key_ring
+
+router = APIRouter()
+
+
+# =========================================================
+# GET JSON WEB KEY SET
+# =========================================================
+@router.get("/.well-known/jwks.json", tags=["Keys"])
+def get_json_web_key_set():
+    return get_key_ring().jwks
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 # =========================================================
@@ -24,3 +24,49 @@ class MemberBase(BaseModel):
 class MemberCreationRequest(MemberBase):
 
     phone: str = Field(None, title="The Phone Number")
+
+
+# =========================================================
+# CLASS MEMBER
+# =========================================================
+class Member(MemberCreationRequest):
+
+    id: str = Field(None, title="Unique identifier of the member")
+
+
+# =========================================================
+# CLASS MEMBER PAGE
+# =========================================================
+class MemberPage(BaseModel):
+
+    items: List[Member] = Field([], title="Members in the page")
+
+    next_page_token: Optional[str] = Field(None, title="Token of the next page")
+
+    previous_page_token: Optional[str] = Field(None, title="Token of the previous page")
+
+
+# =========================================================
+# CLASS BULK ERROR
+# =========================================================
+class BulkError(BaseModel):
+
+    index: Optional[int] = Field(None, title="Position of the item in the request")
+
+    code: Optional[int] = Field(None, title="MongoDB error code")
+
+    message: Optional[str] = Field(None, title="Error message")
+
+
+# =========================================================
+# CLASS MEMBER BATCH RESULT
+# =========================================================
+class MemberBatchResult(BaseModel):
+
+    ids: List[Optional[str]] = Field(
+        [], title="Ids of the created members, in request order. None when it failed"
+    )
+
+    inserted: int = Field(0, title="Inserted members")
+
+    errors: List[BulkError] = Field([], title="Members that could not be inserted")
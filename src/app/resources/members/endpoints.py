@@ -1,9 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
-from app.business_objects.member import inject_members, Members
-from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.business_objects.member import inject_async_members, AsyncMembers
+from app.business_objects.core.routing import SECONDARY_PREFERRED
+from typing import List, Mapping, Optional
+from uuid import UUID, uuid4
 
-from app.business_objects.member.operations import CreateMemberOperation
-from app.resources.members import MemberCreationRequest
+from app.business_objects.member.operations import AsyncCreateMemberOperation
+from app.resources.members import (
+    Member,
+    MemberBatchResult,
+    MemberCreationRequest,
+    MemberPage,
+)
+from app.resources.projection import response_projection
+from app.resources.serialization import TrustedJSONResponse
 
 router = APIRouter()
 
@@ -11,35 +20,85 @@ router = APIRouter()
 # =========================================================
 # GET MEMBER BY ID
 # =========================================================
-@router.get("/member/{member_id}", tags=["Members"])
-def get_member_by_id(member_id: UUID, members: Members = Depends(inject_members)):
+@router.get("/member/{member_id}", tags=["Members"], response_model=Member)
+async def get_member_by_id(
+    member_id: UUID,
+    members: AsyncMembers = Depends(inject_async_members),
+    projection: Mapping[str, int] = Depends(response_projection),
+):
     if not member_id:
         raise HTTPException(
             status_code=400, detail="You must provide a valid member_id"
         )
+    return await members.get_by_id(str(member_id), projection)
 
 
 # =========================================================
 # LIST MEMBERS
 # =========================================================
-@router.get("/members", tags=["Members"])
-def list_members(members: Members = Depends(inject_members)):
-    return []
+@router.get("/members", tags=["Members"], response_model=MemberPage)
+async def list_members(
+    page_size: int = Query(50, ge=1, title="Members per page"),
+    page_token: Optional[str] = Query(None, title="Token of the page to fetch"),
+    members: AsyncMembers = Depends(inject_async_members),
+    projection: Mapping[str, int] = Depends(response_projection),
+):
+    # Listings tolerate a slightly stale view: they are
+    # spread across the secondaries
+    page = await members.paginate(
+        {},
+        page_size=page_size,
+        token=page_token,
+        projection=projection,
+        routing=SECONDARY_PREFERRED,
+    )
+    if page is False:
+        raise HTTPException(status_code=500, detail="Unable to list the members")
+    # Items were fetched with the projection of Member, so
+    # they are encoded as they are instead of re-validated
+    return TrustedJSONResponse(page.dict())
 
 
 # =========================================================
 # CREATE MEMBER
 # =========================================================
-@router.post("/member", tags=["Members"], response_model=MemberCreationRequest)
-def create_member(
-    member: MemberCreationRequest, members: Members = Depends(inject_members)
+@router.post("/member", tags=["Members"], response_model=Member)
+async def create_member(
+    member: MemberCreationRequest,
+    members: AsyncMembers = Depends(inject_async_members),
+):
+    return await AsyncCreateMemberOperation(
+        member_request=member, members=members
+    ).perform_transaction()
+
+
+# =========================================================
+# CREATE MEMBERS IN BATCH
+# =========================================================
+@router.post("/members:batch", tags=["Members"], response_model=MemberBatchResult)
+async def create_members(
+    member_requests: List[MemberCreationRequest],
+    members: AsyncMembers = Depends(inject_async_members),
 ):
-    return CreateMemberOperation(member=member, members=members).operation_result
+    documents = [{**member.dict(), "id": str(uuid4())} for member in member_requests]
+    result = await members.create_many(documents)
+    if result is False:
+        raise HTTPException(status_code=500, detail="Unable to create the members")
+    # Members that failed are reported in errors, by their
+    # index in the request, and get no id
+    failed = {error["index"] for error in result.errors}
+    ids = [
+        None if index in failed else document["id"]
+        for index, document in enumerate(documents)
+    ]
+    return {"ids": ids, **result.dict()}
 
 
 # =========================================================
 # UPDATE MEMBER
 # =========================================================
 @router.put("/member/{member_id}", tags=["Members"])
-def update_member_by_id(member_id: UUID, members: Members = Depends(inject_members)):
+async def update_member_by_id(
+    member_id: UUID, members: AsyncMembers = Depends(inject_async_members)
+):
     return None
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from starlette.responses import Response
+
+from app.metrics import get_metrics_registry, MetricsRegistry
+
+router = APIRouter()
+
+
+# =========================================================
+# GET METRICS
+# =========================================================
+@router.get("/metrics", tags=["Monitoring"], include_in_schema=False)
+def get_metrics():
+    return Response(
+        get_metrics_registry().render(), media_type=MetricsRegistry.CONTENT_TYPE
+    )
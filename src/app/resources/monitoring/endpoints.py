@@ -0,0 +1,59 @@
+from fastapi import APIRouter
+
+from app.business_objects.core.cache import get_document_caches
+from app.business_objects.core.invalidation import get_change_stream_invalidator
+from app.business_objects.core.resilience import get_retry_policy
+from app.database import get_client_registry
+from app.security.hashing import get_password_hashing_pool
+from app.security.token_cache import get_token_cache
+
+router = APIRouter()
+
+
+# =========================================================
+# GET CONNECTION POOL STATISTICS
+# =========================================================
+@router.get("/monitoring/pool", tags=["Monitoring"])
+def get_connection_pool_statistics():
+    return get_client_registry().statistics
+
+
+# =========================================================
+# GET PASSWORD HASHING STATISTICS
+# =========================================================
+@router.get("/monitoring/password-hashing", tags=["Monitoring"])
+def get_password_hashing_statistics():
+    return get_password_hashing_pool().statistics
+
+
+# =========================================================
+# GET TOKEN CACHE STATISTICS
+# =========================================================
+@router.get("/monitoring/token-cache", tags=["Monitoring"])
+def get_token_cache_statistics():
+    return get_token_cache().statistics
+
+
+# =========================================================
+# GET CIRCUIT BREAKER STATE
+# =========================================================
+@router.get("/monitoring/circuit-breaker", tags=["Monitoring"])
+def get_circuit_breaker_state():
+    return get_retry_policy().breaker.statistics
+
+
+# =========================================================
+# GET DOCUMENT CACHE STATISTICS
+# =========================================================
+@router.get("/monitoring/document-cache", tags=["Monitoring"])
+def get_document_cache_statistics():
+    return {name: cache.statistics for name, cache in get_document_caches().items()}
+
+
+# =========================================================
+# GET CHANGE STREAM INVALIDATION STATE
+# =========================================================
+@router.get("/monitoring/change-stream", tags=["Monitoring"])
+def get_change_stream_state():
+    invalidator = get_change_stream_invalidator()
+    return invalidator.statistics if invalidator is not None else {"state": "disabled"}
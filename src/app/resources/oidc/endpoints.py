@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 from starlette.requests import Request
 
-from app.security.oidc import get_oauth
+from app.security.oidc import get_oidc_registry
 
 router = APIRouter()
 
@@ -12,8 +12,8 @@ router = APIRouter()
 @router.get("/oidc/authorize")
 async def authorize_through_oidc(request: Request):
     redirect_uri = request.url_for("oidc_callback").replace("http://", "https://")
-    oauth = get_oauth()
-    return await oauth.oidc_provider.authorize_redirect(request, redirect_uri)
+    provider = await get_oidc_registry().get_provider()
+    return await provider.authorize_redirect(request, redirect_uri)
 
 
 # ---------------------------------------------------------
@@ -0,0 +1,124 @@
+import functools
+import typing
+from types import MappingProxyType
+from typing import Mapping
+
+from fastapi import Request
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Extra
+from pydantic.fields import SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_SET, SHAPE_SINGLETON
+
+# Page models (see Page.dict) wrap the documents in this field
+PAGE_ITEMS_FIELD: str = "items"
+# Shapes of the fields whose sub-documents can be projected
+# with dotted paths (a sub-document or an array of them)
+DOCUMENT_SHAPES = (SHAPE_SINGLETON, SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_SET)
+
+
+# ---------------------------------------------------------
+# FUNCTION DOCUMENT MODEL
+# ---------------------------------------------------------
+def document_model(response_model) -> type or None:
+    """
+    Finds the model of the documents returned by an endpoint:
+    the response model itself, the item type of a List or
+    Optional, or the item model of a page.
+    :param response_model: Response model of an endpoint
+    :return: Pydantic model or None when there is none
+    """
+    for argument in typing.get_args(response_model):
+        if argument is not type(None):
+            return document_model(argument)
+    if not (isinstance(response_model, type) and issubclass(response_model, BaseModel)):
+        return None
+    items = response_model.__fields__.get(PAGE_ITEMS_FIELD)
+    if items is not None and items.shape != SHAPE_SINGLETON and _is_model(items.type_):
+        return items.type_
+    return response_model
+
+
+# ---------------------------------------------------------
+# FUNCTION IS MODEL
+# ---------------------------------------------------------
+def _is_model(annotation) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+# ---------------------------------------------------------
+# FUNCTION IS PROJECTED DOCUMENT
+# ---------------------------------------------------------
+def _is_projected_document(field) -> bool:
+    # Models allowing extra fields are fetched whole
+    if field.shape not in DOCUMENT_SHAPES:
+        return False
+    return field.type_.__config__.extra != Extra.allow
+
+
+# ---------------------------------------------------------
+# FUNCTION FIELD PATHS
+# ---------------------------------------------------------
+def _field_paths(model, prefix: str = "") -> dict:
+    paths: dict = {}
+    for field in model.__fields__.values():
+        path = f"{prefix}{field.alias}"
+        if _is_model(field.type_) and _is_projected_document(field):
+            # Sub-documents and arrays of sub-documents are
+            # projected down to the fields of their model
+            paths.update(_field_paths(field.type_, f"{path}."))
+        else:
+            paths[path] = 1
+    return paths
+
+
+# ---------------------------------------------------------
+# FUNCTION PROJECTION FOR
+# ---------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def projection_for(model, include_id: bool = False) -> Mapping[str, int] or None:
+    """
+    Builds the MongoDB projection that fetches only the
+    fields a model returns, so large fields the response
+    drops are neither transferred nor decoded. Models that
+    accept extra fields return whole documents.
+    :param model: Pydantic model, or a response model
+    accepted by document_model
+    :param include_id: Whether _id is fetched
+    :return: Read-only projection, or None to fetch whole
+    documents
+    """
+    model = document_model(model)
+    if model is None or model.__config__.extra == Extra.allow:
+        return None
+    projection = _field_paths(model)
+    if "_id" not in projection and not include_id:
+        projection["_id"] = 0
+    return MappingProxyType(projection)
+
+
+_route_projections: dict = {}
+
+
+# ---------------------------------------------------------
+# FUNCTION RESPONSE PROJECTION
+# ---------------------------------------------------------
+def response_projection(request: Request) -> Mapping[str, int] or None:
+    """
+    Dependency that provides the projection of the
+    response_model of the endpoint being served, so
+    endpoints push it down into the repository query instead
+    of filtering whole documents through the response model.
+    :param request: Current request
+    :return: Projection, or None to fetch whole documents
+    """
+    endpoint = request.scope.get("endpoint")
+    if endpoint not in _route_projections:
+        response_model = next(
+            (
+                route.response_model
+                for route in request.app.routes
+                if isinstance(route, APIRoute) and route.endpoint is endpoint
+            ),
+            None,
+        )
+        _route_projections[endpoint] = projection_for(response_model)
+    return _route_projections[endpoint]
@@ -0,0 +1,103 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from bson import Decimal128, ObjectId
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+
+# ---------------------------------------------------------
+# FUNCTION ENCODE BSON VALUE
+# ---------------------------------------------------------
+def encode_bson_value(value):
+    """
+    Fallback encoder for BSON types that JSON encoders do not
+    know about. Registered as the default of every encoder so
+    ObjectId and the other BSON types never need to be
+    converted by hand before a document is returned.
+    :param value: Value that could not be encoded
+    :return: JSON compatible representation of the value
+    """
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, Decimal128):
+        return str(value.to_decimal())
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# ---------------------------------------------------------
+# FUNCTION DUMPS
+# ---------------------------------------------------------
+def dumps(value, sort_keys: bool = False) -> bytes:
+    """
+    Encodes a value as compact JSON. orjson is used when it
+    is installed, the json module otherwise; both produce the
+    same output for documents read from MongoDB.
+    :param value: Document, list of documents or any JSON
+    compatible value
+    :param sort_keys: Sort the keys of objects, so equal
+    documents are encoded the same way whatever their order
+    :return: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(value, default=encode_bson_value, option=option)
+    return json.dumps(
+        value,
+        default=encode_bson_value,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+    ).encode()
+
+
+# ---------------------------------------------------------
+# FUNCTION LOADS
+# ---------------------------------------------------------
+def loads(data: bytes or str):
+    """
+    Decodes JSON with orjson when it is installed, the json
+    module otherwise.
+    :param data: UTF-8 encoded JSON
+    :return: Decoded value
+    :raise ValueError: When data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# =========================================================
+# CLASS TRUSTED JSON RESPONSE
+# =========================================================
+class TrustedJSONResponse(Response):
+    """
+    JSON response for content that is already in the shape of
+    the response model, e.g. documents fetched with the
+    projection of that model. FastAPI does not validate
+    responses returned as Response instances, so the content
+    is encoded straight from the documents instead of being
+    re-validated field by field through the model, which is
+    the dominant cost of list endpoints.
+
+    The response_model of the endpoint still documents the
+    response in the OpenAPI schema.
+    """
+
+    media_type: str = "application/json"
+
+    # -----------------------------------------------------
+    # METHOD RENDER
+    # -----------------------------------------------------
+    def render(self, content) -> bytes:
+        return dumps(content)
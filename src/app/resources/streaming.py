@@ -0,0 +1,50 @@
+from typing import AsyncIterator
+
+from starlette.responses import StreamingResponse
+
+from app.resources.serialization import dumps
+
+CHUNK_SIZE: int = 64 * 1024
+
+
+# ---------------------------------------------------------
+# FUNCTION ENCODE JSON ARRAY
+# ---------------------------------------------------------
+async def encode_json_array(documents: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """
+    Incrementally encodes the documents as a JSON array.
+    Encoded documents are grouped into chunks of roughly
+    CHUNK_SIZE bytes so the response is written in a few
+    large writes instead of one per document.
+    :param documents: Async iterator of documents
+    :return: Async iterator of encoded chunks
+    """
+    buffer: list = [b"["]
+    buffered: int = 1
+    separator: bytes = b""
+    async for document in documents:
+        encoded = dumps(document)
+        buffer.append(separator)
+        buffer.append(encoded)
+        buffered += len(encoded) + 1
+        separator = b","
+        if buffered >= CHUNK_SIZE:
+            yield b"".join(buffer)
+            buffer, buffered = [], 0
+    buffer.append(b"]")
+    yield b"".join(buffer)
+
+
+# ---------------------------------------------------------
+# FUNCTION STREAM JSON ARRAY
+# ---------------------------------------------------------
+def stream_json_array(documents: AsyncIterator[dict]) -> StreamingResponse:
+    """
+    Builds a response that streams the documents as a JSON
+    array while they are read from the database.
+    :param documents: Async iterator of documents
+    :return: StreamingResponse
+    """
+    return StreamingResponse(
+        encode_json_array(documents), media_type="application/json"
+    )
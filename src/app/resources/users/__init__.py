@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+# =========================================================
+# CLASS USER PROFILE
+# =========================================================
+class UserProfile(BaseModel):
+    """
+    Public representation of a user. It never includes the
+    password hash or the salt.
+    """
+
+    uid: str = Field(None, title="Unique identifier of the user")
+
+    username: str = Field(None, title="Username")
+
+    name: str = Field(None, title="Name of the user")
+
+    last_name: str = Field(None, title="Last name of the user")
+
+    email: str = Field(None, title="Email of the user")
+
+    disabled: bool = Field(None, title="Weather the user is disabled or not")
+
+    claims: Optional[List[str]] = Field(None, title="User claims")
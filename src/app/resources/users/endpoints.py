@@ -0,0 +1,34 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+
+from app.business_objects.core.routing import SECONDARY_PREFERRED
+from app.business_objects.user import AsyncUsers, UserSession, inject_async_users
+from app.resources.projection import projection_for
+from app.resources.streaming import stream_json_array
+from app.resources.users import UserProfile
+from app.security.authentication import get_user_session
+
+router = APIRouter()
+
+# Users are streamed without going through the response model,
+# so the projection is what keeps the password hash out
+USER_PROFILE_PROJECTION = projection_for(UserProfile)
+
+
+# =========================================================
+# LIST USERS
+# =========================================================
+@router.get("/users", tags=["Users"], response_model=List[UserProfile])
+async def list_users(
+    users: AsyncUsers = Depends(inject_async_users),
+    session: UserSession = Depends(get_user_session),
+):
+    return stream_json_array(
+        users.stream(
+            {},
+            projection=USER_PROFILE_PROJECTION,
+            limit=users.context.query_limit,
+            routing=SECONDARY_PREFERRED,
+        )
+    )
@@ -3,14 +3,20 @@ from abc import ABCMeta, abstractmethod
 
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import HTTPException, Depends, status
+from starlette.concurrency import run_in_threadpool
 
 from app.business_objects.user import Users, UserSession, User
-from app.security import IdentityCredential
-from app.security.cryptography import Password
+from app.security.token_cache import VerifiedTokenCache, get_token_cache
+from app.security.keys import get_key_ring
+from app.security.hashing import (
+    HashingPoolSaturatedError,
+    get_password_hashing_pool,
+    verify_and_rehash_password,
+)
 from app.context import get_context, ServerContext
 from app.business_objects.user import inject_users
 
-from jose import jwt, JWTError
+from jose import JWTError
 
 oauth2_schema = OAuth2PasswordBearer(
     tokenUrl=f"/api/{get_context().api_version}/auth/token"
@@ -78,16 +84,16 @@ class UserAuthentication:
         username: str,
         password: str,
         users: Users = inject_users(),
-        token_expiration_provider: TokenExpirationProvider = InternalTokenExpirationProvider(),
+        token_expiration_provider: TokenExpirationProvider or None = None,
         context: ServerContext = get_context(),
     ):
         self.username: str = username
         self.password: str = password
         self.users: Users = users
-        self.user_data: User = User(**self.__user_data)
+        self.__user: User or None = None
         self.context: ServerContext = context
         self.token_expiration_provider: TokenExpirationProvider = (
-            token_expiration_provider
+            token_expiration_provider or InternalTokenExpirationProvider(context)
         )
 
     # -----------------------------------------------------
@@ -101,13 +107,12 @@ class UserAuthentication:
         """
         self.password = 0000000000000000000000000000000000
         self.username = 0000000000000000000000000000000000
-        self.user_data = 000000000000000000000000000000000
+        self.__user = 0000000000000000000000000000000000000
 
     # -----------------------------------------------------
     # METHOD RETRIEVE USER DATA
     # -----------------------------------------------------
-    @property
-    def __user_data(self) -> dict:
+    def __retrieve_user_data(self) -> dict:
         """
         Retrieves the user data from the database using the
         users' repository.
@@ -118,48 +123,121 @@ class UserAuthentication:
         return user_data
 
     # -----------------------------------------------------
-    # VERIFY PASSWORD
+    # PROPERTY USER DATA
     # -----------------------------------------------------
-    @staticmethod
-    def __verify_password(password: str, password_hash: str, salt: str) -> bool:
+    @property
+    def user_data(self) -> User:
         """
-        Verifies if a given password is valid
-        :param password: The password to be verified
-        :param password_hash: The hash of the password stored
-        in the internal user database
-        :param salt: salt to link password to this specific
-        context and prevent rainbow table attacks
-        :return: True if password is valid / False if password
-        is not valid
+        User being authenticated, retrieved on first use.
+        Async callers load it with load_user_data instead, so
+        the lookup does not block the event loop.
+        :return: User
         """
-        credential: IdentityCredential = Password(
-            plain_text_password=password, salt=salt
-        )
-        return credential.verify(stored_hash=password_hash)
+        if self.__user is None:
+            self.__user = User(**self.__retrieve_user_data())
+        return self.__user
+
+    # -----------------------------------------------------
+    # METHOD LOAD USER DATA
+    # -----------------------------------------------------
+    async def load_user_data(self) -> User:
+        """
+        Retrieves the user being authenticated on the thread
+        pool, see user_data.
+        :return: User
+        """
+        if self.__user is None:
+            self.__user = User(**await run_in_threadpool(self.__retrieve_user_data))
+        return self.__user
 
     # -----------------------------------------------------
     # PROPERTY IS VALID
     # -----------------------------------------------------
     @property
     def is_valid(self) -> bool:
-        return self.__verify_password(
-            password=self.password,
-            password_hash=self.user_data.phash,
-            salt=self.user_data.salt,
+        """
+        Blocking counterpart of verify for synchronous
+        callers. Argon2 runs on the password hashing pool as
+        well, so logins are bounded by its queue either way.
+        :return: True if password is valid
+        :raises HTTPException: 503 when the hashing pool is
+        saturated
+        """
+        user_data: User = self.user_data
+        try:
+            valid, new_hash = get_password_hashing_pool().call(
+                verify_and_rehash_password,
+                self.password,
+                user_data.salt,
+                user_data.phash,
+                self.context.password_hashing_profile,
+            )
+        except HashingPoolSaturatedError as error:
+            raise self.__saturated(error)
+        if new_hash is not None:
+            self.__rehash(new_hash)
+        return valid
+
+    # -----------------------------------------------------
+    # METHOD VERIFY
+    # -----------------------------------------------------
+    async def verify(self) -> bool:
+        """
+        Verifies the password on the password hashing pool
+        so the event loop keeps serving other requests while
+        Argon2 runs. Hashes derived with outdated cost
+        parameters are transparently upgraded.
+        :return: True if password is valid
+        :raises HTTPException: 503 when the hashing pool is
+        saturated
+        """
+        user_data: User = await self.load_user_data()
+        try:
+            valid, new_hash = await get_password_hashing_pool().verify_and_rehash(
+                self.password,
+                user_data.salt,
+                user_data.phash,
+                self.context.password_hashing_profile,
+            )
+        except HashingPoolSaturatedError as error:
+            raise self.__saturated(error)
+        if new_hash is not None:
+            # The driver is synchronous: the write runs on the
+            # thread pool so the event loop keeps serving
+            await run_in_threadpool(self.__rehash, new_hash)
+        return valid
+
+    # -----------------------------------------------------
+    # METHOD SATURATED
+    # -----------------------------------------------------
+    def __saturated(self, error: HashingPoolSaturatedError) -> HTTPException:
+        self.context.logger(__name__).warning(str(error))
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent authentications, try again later",
+            headers={"Retry-After": "1"},
         )
 
     # -----------------------------------------------------
-    # METHOD SERIALIZE SESSION TO DICT
+    # METHOD REHASH
     # -----------------------------------------------------
-    def __serialize_session_to_dict(self) -> dict:
-        return self.user_data.session.dict().copy()
+    def __rehash(self, new_hash: str):
+        """
+        Replaces a stored hash derived with outdated cost
+        parameters. Failing to store it does not fail the
+        login; it is retried on the next one.
+        :param new_hash: Hash derived with the current profile
+        """
+        if self.users.update_many({"username": self.username}, {"phash": new_hash}):
+            self.context.logger(__name__).info(
+                "Password hash of %s upgraded", self.username
+            )
 
     # -----------------------------------------------------
-    # METHOD APPEND EXPIRATION
+    # METHOD SERIALIZE SESSION TO DICT
     # -----------------------------------------------------
-    @staticmethod
-    def __append_expiration(session_dict: dict) -> dict:
-        output: dict = session_dict.copy()
+    def __serialize_session_to_dict(self) -> dict:
+        return self.user_data.session.dict().copy()
 
     # -----------------------------------------------------
     # PROPERTY JWT ACCESS TOKEN
@@ -169,11 +247,22 @@ class UserAuthentication:
         if self.is_valid:
             to_encode: dict = self.__serialize_session_to_dict()
             to_encode["exp"] = self.token_expiration_provider.get_expiration_time()
-            return jwt.encode(
-                claims=to_encode,
-                key=self.context.jwt_key,
-                algorithm=self.context.jwt_signing_algorithm,
-            )
+            return get_key_ring().sign(to_encode)
+        raise get_credentials_exception()
+
+    # -----------------------------------------------------
+    # METHOD CREATE ACCESS TOKEN
+    # -----------------------------------------------------
+    async def create_access_token(self) -> str:
+        """
+        Async counterpart of jwt_access_token that verifies
+        the password on the password hashing pool.
+        :return: Encoded JWT access token
+        """
+        if await self.verify():
+            to_encode: dict = self.__serialize_session_to_dict()
+            to_encode["exp"] = self.token_expiration_provider.get_expiration_time()
+            return get_key_ring().sign(to_encode)
         raise get_credentials_exception()
 
 
@@ -196,25 +285,32 @@ async def get_user_session(
 ) -> UserSession:
     """
     Given a valid JWT access token, this functions decodes
-    the token and validates its digital signature
+    the token and validates its digital signature. Sessions
+    of tokens that were already verified are served from the
+    verified token cache.
     :param token: The encoded JWT access token fetched from
     the Authorization header in the HTTP Request
     :param context: Server context to securely access
     the signing keys
     :return:
     """
+    token_cache: VerifiedTokenCache = get_token_cache()
+    session: UserSession = token_cache.get(token)
+    if session is not None:
+        return session
+    if token_cache.is_revoked(token):
+        raise get_credentials_exception()
     try:
-        payload = jwt.decode(
-            token=token, key=context.jwt_key, algorithms=[context.jwt_signing_algorithm]
-        )
+        payload = get_key_ring().decode(token)
         key_id: str = payload.get("sub")
         if key_id is None:
             raise get_credentials_exception()
     except JWTError:
         raise get_credentials_exception()
 
-    session: UserSession = UserSession(**payload)
+    session = UserSession(**payload)
     if session is None:
         raise get_credentials_exception()
-    context.logging.debug(f"User: {session.dict()} successfully authenticated")
+    token_cache.put(token, session)
+    context.logger(__name__).debug("User: %s successfully authenticated", session)
     return session
@@ -1,39 +1,65 @@
+import re
+from typing import Dict, Tuple
+
 import nacl.pwhash.argon2id
 from app.security import IdentityCredential
 
+# Argon2 cost profiles as (opslimit, memlimit in bytes)
+HASHING_PROFILES: Dict[str, Tuple[int, int]] = {
+    "interactive": (
+        nacl.pwhash.argon2id.OPSLIMIT_INTERACTIVE,
+        nacl.pwhash.argon2id.MEMLIMIT_INTERACTIVE,
+    ),
+    "moderate": (
+        nacl.pwhash.argon2id.OPSLIMIT_MODERATE,
+        nacl.pwhash.argon2id.MEMLIMIT_MODERATE,
+    ),
+    "sensitive": (
+        nacl.pwhash.argon2id.OPSLIMIT_SENSITIVE,
+        nacl.pwhash.argon2id.MEMLIMIT_SENSITIVE,
+    ),
+}
+DEFAULT_HASHING_PROFILE: str = "interactive"
+
+ARGON2_PARAMETERS = re.compile(r"^\$argon2id\$v=\d+\$m=(\d+),t=(\d+),p=\d+\$")
+
 
 # ---------------------------------------------------------------------------------------
 # CLASS PASSWORD
 # ---------------------------------------------------------------------------------------
 class Password(IdentityCredential):
-
     """
-        Provides an abstractions on top of NaCl to provide a secure mechanism
-        to store and verify passwords using Argon2 Key Derivation Function.
+    Provides an abstractions on top of NaCl to provide a secure mechanism
+    to store and verify passwords using Argon2 Key Derivation Function.
     """
 
     # -----------------------------------------------------------------------------------
     # CONSTRUCTOR
     # -----------------------------------------------------------------------------------
-    def __init__(self, plain_text_password, salt):
+    def __init__(
+        self, plain_text_password, salt, profile: str = DEFAULT_HASHING_PROFILE
+    ):
         """
-
-            :param plain_text_password:
-            :param salt:
+        The hash is only derived when password_hash is read, so
+        a Password built to verify a login costs a single Argon2
+        run.
+
+        :param plain_text_password:
+        :param salt:
+        :param profile: Name of the Argon2 cost profile used to
+        derive new hashes. One of HASHING_PROFILES
         """
+        if profile not in HASHING_PROFILES:
+            raise ValueError(f"Invalid hashing profile: {profile}")
+        self.__opslimit, self.__memlimit = HASHING_PROFILES[profile]
 
         self.__verify_salt_is_valid(salt=salt)
         self.__salt = salt
 
-        self.__verify_plain_text_password_is_valid(
-            password=plain_text_password
-        )
-        self.__pwd: bytes = self.__salt_password(
-            plain_text_password,
-            self.__salt
-        )
+        self.__verify_plain_text_password_is_valid(password=plain_text_password)
+        self.__pwd: bytes = self.__salt_password(plain_text_password, self.__salt)
 
-        self.__hash = self.__compute_hash()
+        self.__hash: bytes or None = None
 
     # -----------------------------------------------------------------------------------
     # METHOD VERIFY SALT IS VALID
@@ -41,9 +67,7 @@ class Password(IdentityCredential):
     @staticmethod
     def __verify_salt_is_valid(salt: str):
         if salt is None or salt == "":
-            raise ValueError(
-                "Invalid salt provided"
-            )
+            raise ValueError("Invalid salt provided")
 
     # -----------------------------------------------------------------------------------
     # METHOD VERIFY PLAIN TEXT PASSWORD IS VALID
@@ -51,15 +75,15 @@ class Password(IdentityCredential):
     @staticmethod
     def __verify_plain_text_password_is_valid(password: str):
         if password is None or password == "":
-            raise ValueError(
-                "Invalid password provided"
-            )
+            raise ValueError("Invalid password provided")
 
     # -----------------------------------------------------------------------------------
     # METHOD COMPUTE HASH
     # -----------------------------------------------------------------------------------
     def __compute_hash(self):
-        return nacl.pwhash.argon2id.str(self.__pwd)
+        return nacl.pwhash.argon2id.str(
+            self.__pwd, opslimit=self.__opslimit, memlimit=self.__memlimit
+        )
 
     # -----------------------------------------------------------------------------------
     # METHOD SALT PASSWORD
@@ -67,11 +91,11 @@ class Password(IdentityCredential):
     @staticmethod
     def __salt_password(password: str, salt: str):
         """
-            Concatenates a given salt value at the end of the password and
-            convert the resulting string into bytes
-            :param password: the password in plain text
-            :param salt: the salt byte generated for this password
-            :return:
+        Concatenates a given salt value at the end of the password and
+        convert the resulting string into bytes
+        :param password: the password in plain text
+        :param salt: the salt byte generated for this password
+        :return:
         """
         return (password + salt).encode()
 
@@ -81,8 +105,8 @@ class Password(IdentityCredential):
     @property
     def salt(self):
         """
-            String representation of the salt bytes
-            :return: A string representation of the salt bytes encoded in UFT-8
+        String representation of the salt bytes
+        :return: A string representation of the salt bytes encoded in UFT-8
         """
         return self.__salt
 
@@ -92,30 +116,46 @@ class Password(IdentityCredential):
     @property
     def password_hash(self) -> str:
         """
-            String representation
-            :return:
+        String representation of the hash, derived on first access
+        :return:
         """
+        if self.__hash is None:
+            self.__hash = self.__compute_hash()
         return self.__hash.decode()
 
+    # -----------------------------------------------------------------------------------
+    # METHOD NEEDS REHASH
+    # -----------------------------------------------------------------------------------
+    def needs_rehash(self, stored_hash: str) -> bool:
+        """
+        Checks whether a stored hash was derived with cost
+        parameters other than the ones of this password's profile.
+
+        :param stored_hash: the stored hash in modular crypt format
+        :return: True if the hash should be derived again
+        """
+        parameters = ARGON2_PARAMETERS.match(stored_hash or "")
+        if parameters is None:
+            return True
+        memory_kib, iterations = (int(value) for value in parameters.groups())
+        return (memory_kib, iterations) != (self.__memlimit // 1024, self.__opslimit)
+
     # -----------------------------------------------------------------------------------
     # METHOD VERIFY
     # -----------------------------------------------------------------------------------
     def verify(self, **kwargs):
         """
-            Requires a keyword argument called stored_hash that
-            contains the value of the stored hash from the original
-            password. This allows verifying a given password
-            without having to know the original value of the password.
-
-            :param kwargs: key-word arguments as enforced by abstract class.
-            :return: True is password is valid and false if password
-            is not valid.
+        Requires a keyword argument called stored_hash that
+        contains the value of the stored hash from the original
+        password. This allows verifying a given password
+        without having to know the original value of the password.
+
+        :param kwargs: key-word arguments as enforced by abstract class.
+        :return: True is password is valid and false if password
+        is not valid.
         """
         stored_hash = self.__get_stored_hash_from_arguments(kwargs).encode()
-        return nacl.pwhash.argon2id.verify(
-            stored_hash,
-            self.__pwd
-        )
+        return nacl.pwhash.argon2id.verify(stored_hash, self.__pwd)
 
     # -----------------------------------------------------------------------------------
     # METHOD GET STORED HASH FROM ARGUMENTS
@@ -123,14 +163,14 @@ class Password(IdentityCredential):
     @staticmethod
     def __get_stored_hash_from_arguments(arguments: dict) -> str:
         """
-            Checks if the required key stored_has is present in the
-            dictionary and return its value if found.
+        Checks if the required key stored_has is present in the
+        dictionary and return its value if found.
 
-            :param arguments: a dictionary that contains the key stored_hash
-            :return: the value of the key stored_hash
+        :param arguments: a dictionary that contains the key stored_hash
+        :return: the value of the key stored_hash
         """
-        if 'stored_hash' not in arguments.keys():
-            raise ValueError('stored_hash is required')
-        if not arguments['stored_hash']:
-            raise ValueError('stored_hash cannot be an empty string')
-        return arguments['stored_hash']
+        if "stored_hash" not in arguments.keys():
+            raise ValueError("stored_hash is required")
+        if not arguments["stored_hash"]:
+            raise ValueError("stored_hash cannot be an empty string")
+        return arguments["stored_hash"]
@@ -0,0 +1,369 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from nacl.exceptions import InvalidkeyError
+
+from app.context import get_context, on_reload, settings_changed, Settings
+from app.security.cryptography import DEFAULT_HASHING_PROFILE, Password
+
+THREAD: str = "thread"
+PROCESS: str = "process"
+# Settings the password hashing pool is sized from
+HASHING_POOL_SETTINGS: tuple = (
+    "password_hashing_workers",
+    "password_hashing_queue_size",
+    "password_hashing_executor",
+)
+
+
+# =========================================================
+# CLASS HASHING POOL SATURATED ERROR
+# =========================================================
+class HashingPoolSaturatedError(RuntimeError):
+    """
+    Raised when the password hashing pool already has as many
+    pending jobs as its queue allows.
+    """
+
+
+# ---------------------------------------------------------
+# FUNCTION TIMED
+# ---------------------------------------------------------
+def _timed(function: Callable, *args) -> Tuple[object, float, float]:
+    """
+    Runs the function in the worker and reports when it
+    started and how long it took. time.monotonic is system
+    wide on Linux, so the start time can be compared with the
+    submission time even in a worker process.
+    :return: (result, start time, elapsed seconds)
+    """
+    started = time.monotonic()
+    result = function(*args)
+    return result, started, time.monotonic() - started
+
+
+# ---------------------------------------------------------
+# FUNCTION VERIFY PASSWORD
+# ---------------------------------------------------------
+def verify_password(password: str, salt: str, stored_hash: str) -> bool:
+    """
+    Module level so it can be sent to a process pool. A
+    mismatch is reported as False instead of the exception
+    raised by NaCl.
+    """
+    try:
+        return Password(plain_text_password=password, salt=salt).verify(
+            stored_hash=stored_hash
+        )
+    except InvalidkeyError:
+        return False
+
+
+# ---------------------------------------------------------
+# FUNCTION VERIFY AND REHASH PASSWORD
+# ---------------------------------------------------------
+def verify_and_rehash_password(
+    password: str, salt: str, stored_hash: str, profile: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies the password and, when it is valid but the
+    stored hash was derived with outdated cost parameters,
+    derives a new hash with the given profile. The second
+    derivation only happens once per outdated hash.
+    :return: (valid, new hash or None)
+    """
+    credential = Password(plain_text_password=password, salt=salt, profile=profile)
+    try:
+        credential.verify(stored_hash=stored_hash)
+    except InvalidkeyError:
+        return False, None
+    if credential.needs_rehash(stored_hash):
+        return True, credential.password_hash
+    return True, None
+
+
+# ---------------------------------------------------------
+# FUNCTION HASH PASSWORD
+# ---------------------------------------------------------
+def hash_password(password: str, salt: str, profile: str) -> str:
+    return Password(
+        plain_text_password=password, salt=salt, profile=profile
+    ).password_hash
+
+
+# =========================================================
+# CLASS PASSWORD HASHING POOL
+# =========================================================
+class PasswordHashingPool:
+    """
+    Size-limited executor for Argon2 hashing and verification.
+    Argon2 is deliberately CPU and memory heavy; running it on
+    the event loop, or on the default threadpool shared with
+    every other blocking call, lets a burst of logins stall
+    the whole worker. Jobs run on a dedicated pool of workers
+    and at most queue_size jobs may be pending at once; any
+    job beyond that is rejected immediately instead of
+    queueing without bound.
+
+    PyNaCl releases the GIL while deriving keys, so threads
+    are enough to use several cores; a process pool can be
+    selected to isolate the memory used by Argon2.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, workers: int, queue_size: int, executor_type: str = THREAD):
+        """
+        :param workers: Number of hashing workers
+        :param queue_size: Maximum pending jobs, including
+        the ones being executed
+        :param executor_type: "thread" or "process"
+        """
+        if executor_type not in (THREAD, PROCESS):
+            raise ValueError(f"Invalid executor type: {executor_type}")
+        self.workers: int = workers
+        self.queue_size: int = max(queue_size, workers)
+        self.executor_type: str = executor_type
+        self.__executor: Executor or None = None
+        self.__lock = threading.Lock()
+        self.__pending: int = 0
+        self.__counters: Dict[str, float] = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "queue_wait_seconds_total": 0.0,
+            "queue_wait_seconds_max": 0.0,
+            "hash_seconds_total": 0.0,
+            "hash_seconds_max": 0.0,
+        }
+
+    # -----------------------------------------------------
+    # PROPERTY EXECUTOR
+    # -----------------------------------------------------
+    @property
+    def __pool(self) -> Executor:
+        with self.__lock:
+            if self.__executor is None:
+                if self.executor_type == PROCESS:
+                    self.__executor = ProcessPoolExecutor(max_workers=self.workers)
+                else:
+                    self.__executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="password-hashing"
+                    )
+            return self.__executor
+
+    # -----------------------------------------------------
+    # METHOD ACQUIRE
+    # -----------------------------------------------------
+    def __acquire(self):
+        with self.__lock:
+            if self.__pending >= self.queue_size:
+                self.__counters["rejected"] += 1
+                raise HashingPoolSaturatedError(
+                    f"Password hashing queue is full ({self.queue_size} pending jobs)"
+                )
+            self.__pending += 1
+            self.__counters["submitted"] += 1
+
+    # -----------------------------------------------------
+    # METHOD RELEASE
+    # -----------------------------------------------------
+    def __release(
+        self, submitted: float, started: float or None, elapsed: float or None
+    ):
+        with self.__lock:
+            self.__pending -= 1
+            if started is None:
+                self.__counters["failed"] += 1
+                return
+            waited = max(started - submitted, 0.0)
+            self.__counters["completed"] += 1
+            self.__counters["queue_wait_seconds_total"] += waited
+            self.__counters["queue_wait_seconds_max"] = max(
+                self.__counters["queue_wait_seconds_max"], waited
+            )
+            self.__counters["hash_seconds_total"] += elapsed
+            self.__counters["hash_seconds_max"] = max(
+                self.__counters["hash_seconds_max"], elapsed
+            )
+
+    # -----------------------------------------------------
+    # METHOD RUN
+    # -----------------------------------------------------
+    async def run(self, function: Callable, *args):
+        """
+        Runs the function on the pool without blocking the
+        event loop.
+        :param function: Hashing function. Must be a module
+        level function when a process pool is used
+        :param args: Positional arguments of the function
+        :return: The value returned by the function
+        :raises HashingPoolSaturatedError: When the queue is
+        full
+        """
+        self.__acquire()
+        submitted = time.monotonic()
+        started, elapsed = None, None
+        try:
+            result, started, elapsed = await asyncio.get_running_loop().run_in_executor(
+                self.__pool, _timed, function, *args
+            )
+            return result
+        finally:
+            self.__release(submitted, started, elapsed)
+
+    # -----------------------------------------------------
+    # METHOD CALL
+    # -----------------------------------------------------
+    def call(self, function: Callable, *args):
+        """
+        Blocking counterpart of run for synchronous callers.
+        The calling thread waits for the result, but the job
+        still runs on the pool and counts against its queue.
+        :param function: Hashing function. Must be a module
+        level function when a process pool is used
+        :param args: Positional arguments of the function
+        :return: The value returned by the function
+        :raises HashingPoolSaturatedError: When the queue is
+        full
+        """
+        self.__acquire()
+        submitted = time.monotonic()
+        started, elapsed = None, None
+        try:
+            result, started, elapsed = self.__pool.submit(
+                _timed, function, *args
+            ).result()
+            return result
+        finally:
+            self.__release(submitted, started, elapsed)
+
+    # -----------------------------------------------------
+    # METHOD VERIFY
+    # -----------------------------------------------------
+    async def verify(self, password: str, salt: str, stored_hash: str) -> bool:
+        return await self.run(verify_password, password, salt, stored_hash)
+
+    # -----------------------------------------------------
+    # METHOD VERIFY AND REHASH
+    # -----------------------------------------------------
+    async def verify_and_rehash(
+        self,
+        password: str,
+        salt: str,
+        stored_hash: str,
+        profile: str = DEFAULT_HASHING_PROFILE,
+    ) -> Tuple[bool, Optional[str]]:
+        return await self.run(
+            verify_and_rehash_password, password, salt, stored_hash, profile
+        )
+
+    # -----------------------------------------------------
+    # METHOD HASH
+    # -----------------------------------------------------
+    async def hash(
+        self, password: str, salt: str, profile: str = DEFAULT_HASHING_PROFILE
+    ) -> str:
+        return await self.run(hash_password, password, salt, profile)
+
+    # -----------------------------------------------------
+    # PROPERTY STATISTICS
+    # -----------------------------------------------------
+    @property
+    def statistics(self) -> dict:
+        with self.__lock:
+            return {
+                "executor": self.executor_type,
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "pending": self.__pending,
+                **self.__counters,
+            }
+
+    # -----------------------------------------------------
+    # METHOD SHUTDOWN
+    # -----------------------------------------------------
+    def shutdown(self, cancel_pending: bool = True):
+        """
+        :param cancel_pending: Whether the jobs waiting in the
+        queue are cancelled, or still run before the workers
+        exit
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=cancel_pending)
+
+    # -----------------------------------------------------
+    # METHOD RESET AFTER FORK
+    # -----------------------------------------------------
+    def reset_after_fork(self):
+        """
+        Worker threads and processes are not inherited by a
+        forked child; the child lazily starts its own pool.
+        """
+        self.__lock = threading.Lock()
+        self.__executor = None
+        self.__pending = 0
+
+
+_pool: dict = {}
+_pool_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# FUNCTION GET PASSWORD HASHING POOL
+# ---------------------------------------------------------
+def get_password_hashing_pool() -> PasswordHashingPool:
+    """
+    Returns the process-wide password hashing pool, sized
+    from the server context the first time it is used.
+    :return: PasswordHashingPool
+    """
+    pool = _pool.get("instance")
+    if pool is not None:
+        return pool
+    with _pool_lock:
+        if "instance" not in _pool:
+            context = get_context()
+            _pool["instance"] = PasswordHashingPool(
+                workers=context.password_hashing_workers,
+                queue_size=context.password_hashing_queue_size,
+                executor_type=context.password_hashing_executor,
+            )
+    return _pool["instance"]
+
+
+# ---------------------------------------------------------
+# FUNCTION RESIZE POOL
+# ---------------------------------------------------------
+@on_reload
+def _resize_pool(previous: Settings, current: Settings):
+    """
+    Replaces the pool when a reload resizes it. Jobs already
+    submitted to the previous pool still complete.
+    """
+    if settings_changed(previous, current, HASHING_POOL_SETTINGS):
+        with _pool_lock:
+            pool = _pool.pop("instance", None)
+        if pool is not None:
+            pool.shutdown(cancel_pending=False)
+
+
+# ---------------------------------------------------------
+# FUNCTION RESET POOL AFTER FORK
+# ---------------------------------------------------------
+def _reset_pool_after_fork():
+    pool = _pool.get("instance")
+    if pool is not None:
+        pool.reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
@@ -0,0 +1,213 @@
+import glob
+import os
+import threading
+from typing import Dict, List, Tuple
+
+from jose import jwk, jwt, JWTError
+from jose.backends.base import Key
+from jose.constants import ALGORITHMS
+
+from app.context import get_context, ServerContext
+
+PRIVATE_KEY_SUFFIX: str = ".pem"
+PUBLIC_KEY_SUFFIX: str = ".pub.pem"
+
+
+# =========================================================
+# CLASS SIGNING KEY
+# =========================================================
+class SigningKey:
+    """
+    A key of the key ring, parsed once into a jose Key so
+    signing and verifying tokens never parse PEM or JWK data
+    on the request path. Keys loaded from a public key only
+    verify tokens; they are kept after a rotation until the
+    tokens they signed expire.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(
+        self,
+        kid: str or None,
+        algorithm: str,
+        private_key: Key or None,
+        public_key: Key,
+    ):
+        """
+        :param kid: Key identifier, sent in the token header
+        :param algorithm: JWS algorithm of the key
+        :param private_key: Parsed key used to sign tokens.
+        None for verification-only keys
+        :param public_key: Parsed key used to verify tokens
+        """
+        self.kid: str or None = kid
+        self.algorithm: str = algorithm
+        self.private_key: Key or None = private_key
+        self.public_key: Key = public_key
+
+    # -----------------------------------------------------
+    # PROPERTY IS ASYMMETRIC
+    # -----------------------------------------------------
+    @property
+    def is_asymmetric(self) -> bool:
+        return self.algorithm not in ALGORITHMS.HMAC
+
+    # -----------------------------------------------------
+    # METHOD FROM PEM
+    # -----------------------------------------------------
+    @staticmethod
+    def from_pem(kid: str, algorithm: str, pem: str, private: bool) -> "SigningKey":
+        key: Key = jwk.construct(pem, algorithm)
+        if private:
+            return SigningKey(kid, algorithm, key, key.public_key())
+        return SigningKey(kid, algorithm, None, key)
+
+    # -----------------------------------------------------
+    # METHOD FROM SECRET
+    # -----------------------------------------------------
+    @staticmethod
+    def from_secret(secret: str, algorithm: str) -> "SigningKey":
+        key: Key = jwk.construct(secret, algorithm)
+        return SigningKey(None, algorithm, key, key)
+
+    # -----------------------------------------------------
+    # METHOD TO JWK
+    # -----------------------------------------------------
+    def to_jwk(self) -> dict:
+        return {
+            **self.public_key.to_dict(),
+            "kid": self.kid,
+            "alg": self.algorithm,
+            "use": "sig",
+        }
+
+
+# =========================================================
+# CLASS KEY RING
+# =========================================================
+class KeyRing:
+    """
+    Set of keys that verify tokens, one of which signs new
+    tokens. Tokens carry the kid of their signing key, so
+    keys can be rotated by adding a new key, making it the
+    active one and removing the previous one once the tokens
+    it signed have expired. The public part of asymmetric
+    keys is published as a JWKS so other services verify
+    tokens without calling this API.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, keys: List[SigningKey], active_kid: str or None):
+        """
+        :param keys: Keys of the ring
+        :param active_kid: kid of the key that signs tokens
+        """
+        self.keys: Dict[str or None, SigningKey] = {key.kid: key for key in keys}
+        if active_kid not in self.keys or self.keys[active_kid].private_key is None:
+            raise ValueError(
+                f"No private key found for the active key id: {active_kid}"
+            )
+        self.active: SigningKey = self.keys[active_kid]
+        self.jwks: dict = {"keys": [key.to_jwk() for key in keys if key.is_asymmetric]}
+
+    # -----------------------------------------------------
+    # METHOD SIGN
+    # -----------------------------------------------------
+    def sign(self, claims: dict) -> str:
+        """
+        :param claims: Claims of the token
+        :return: Encoded token signed with the active key
+        """
+        headers = {"kid": self.active.kid} if self.active.kid else None
+        return jwt.encode(
+            claims=claims,
+            key=self.active.private_key,
+            algorithm=self.active.algorithm,
+            headers=headers,
+        )
+
+    # -----------------------------------------------------
+    # METHOD DECODE
+    # -----------------------------------------------------
+    def decode(self, token: str) -> dict:
+        """
+        Verifies the token with the key named by its kid and
+        returns its claims.
+        :param token: Encoded token
+        :return: Claims of the token
+        :raises JWTError: When the token is invalid or its
+        key is unknown
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self.keys.get(kid)
+        if key is None:
+            raise JWTError(f"Unknown key id: {kid}")
+        return jwt.decode(token=token, key=key.public_key, algorithms=[key.algorithm])
+
+
+# ---------------------------------------------------------
+# FUNCTION LOAD KEY RING
+# ---------------------------------------------------------
+def load_key_ring(context: ServerContext) -> KeyRing:
+    """
+    Builds the key ring from the server context. When
+    JWT_KEYS_DIRECTORY is set, every <kid>.pem file in it is
+    a private key and every <kid>.pub.pem file a
+    verification-only key, all of them using
+    JWT_SIGN_ALGORITHM. Otherwise the ring holds the shared
+    JWT_SECRET_KEY only.
+    :param context: Server context
+    :return: KeyRing
+    """
+    algorithm = context.jwt_signing_algorithm
+    directory = context.jwt_keys_directory
+    if not directory:
+        return KeyRing([SigningKey.from_secret(context.jwt_key, algorithm)], None)
+    keys: List[SigningKey] = []
+    for path in sorted(glob.glob(os.path.join(directory, f"*{PRIVATE_KEY_SUFFIX}"))):
+        name = os.path.basename(path)
+        private = not name.endswith(PUBLIC_KEY_SUFFIX)
+        suffix = PRIVATE_KEY_SUFFIX if private else PUBLIC_KEY_SUFFIX
+        with open(path, encoding="utf-8") as key_file:
+            keys.append(
+                SigningKey.from_pem(
+                    name[: -len(suffix)], algorithm, key_file.read(), private
+                )
+            )
+    return KeyRing(keys, context.jwt_active_key_id)
+
+
+_key_ring: Dict[str, Tuple] = {}
+_key_ring_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# FUNCTION GET KEY RING
+# ---------------------------------------------------------
+def get_key_ring() -> KeyRing:
+    """
+    Returns the process-wide key ring. It is loaded once and
+    loaded again only when the key settings change, e.g.
+    after a settings reload that rotates the active key.
+    :return: KeyRing
+    """
+    context = get_context()
+    version = (
+        context.jwt_keys_directory,
+        context.jwt_active_key_id,
+        context.jwt_signing_algorithm,
+        context.jwt_key,
+    )
+    cached = _key_ring.get("instance")
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _key_ring_lock:
+        cached = _key_ring.get("instance")
+        if cached is None or cached[0] != version:
+            cached = (version, load_key_ring(context))
+            _key_ring["instance"] = cached
+    return cached[1]
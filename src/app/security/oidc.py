@@ -1,8 +1,20 @@
-from typing import List
+import datetime
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Tuple
 
+import requests
 from authlib.integrations.starlette_client import OAuth
 from authlib.oidc.core import UserInfo
-from app.context import get_context
+from starlette.concurrency import run_in_threadpool
+from app.context import (
+    get_context,
+    on_reload,
+    ServerContext,
+    settings_changed,
+    Settings,
+)
 import uuid
 
 
@@ -37,17 +49,251 @@ class Identity:
         return value
 
 
+# --------------------------------------------------------
+# FUNCTION PARSE CACHE LIFETIME
+# --------------------------------------------------------
+def parse_cache_lifetime(headers: Mapping[str, str]) -> float or None:
+    """
+    Freshness lifetime of an HTTP response in seconds, from
+    Cache-Control (max-age minus Age) or Expires minus Date.
+    :param headers: Response headers
+    :return: Seconds, 0 when the response must not be reused
+    or None when the headers do not say
+    """
+    directives = {
+        directive.strip().split("=", 1)[0].lower(): directive.strip().split("=", 1)[-1]
+        for directive in headers.get("Cache-Control", "").split(",")
+        if directive.strip()
+    }
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+    age = float(headers.get("Age", 0) or 0)
+    if "max-age" in directives:
+        try:
+            return max(float(directives["max-age"]) - age, 0)
+        except ValueError:
+            return None
+    if "Expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["Expires"])
+            date = (
+                parsedate_to_datetime(headers["Date"])
+                if "Date" in headers
+                else datetime.datetime.now(datetime.timezone.utc)
+            )
+            return max((expires - date).total_seconds(), 0)
+        except (TypeError, ValueError):
+            return 0
+    return None
+
+
+# =========================================================
+# CLASS PROVIDER METADATA CACHE
+# =========================================================
+class ProviderMetadataCache:
+    """
+    Process-wide copy of the discovery document of an OIDC
+    provider together with its JSON Web Key Set. Both are
+    fetched once and kept for the lifetime announced by the
+    provider cache headers, bounded by MIN_TTL and MAX_TTL.
+    Once stale, the copy keeps being served while a single
+    background thread refreshes it; when the provider is slow
+    or down, the last good copy is kept and the refresh is
+    retried after RETRY_AFTER seconds.
+    """
+
+    MIN_TTL: float = 60
+    MAX_TTL: float = 86400
+    RETRY_AFTER: float = 30
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, discovery_url: str, default_ttl: float, timeout: float):
+        """
+        :param discovery_url: URL of the discovery document
+        :param default_ttl: Lifetime when the provider does not
+        send cache headers
+        :param timeout: Timeout in seconds of every request to
+        the provider
+        """
+        self.discovery_url: str = discovery_url
+        self.default_ttl: float = default_ttl
+        self.timeout: float = timeout
+        self.logging = get_context().logger(__name__)
+        self.__lock = threading.Lock()
+        self.__refreshing: bool = False
+        self.__metadata: dict or None = None
+        self.__expires_at: float = 0
+        self.fetches: int = 0
+
+    # -----------------------------------------------------
+    # PROPERTY LOADED
+    # -----------------------------------------------------
+    @property
+    def loaded(self) -> bool:
+        return self.__metadata is not None
+
+    # -----------------------------------------------------
+    # METHOD FETCH
+    # -----------------------------------------------------
+    def __fetch(self, url: str) -> Tuple[dict, float]:
+        response = requests.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        lifetime = parse_cache_lifetime(response.headers)
+        if lifetime is None:
+            lifetime = self.default_ttl
+        return response.json(), min(max(lifetime, self.MIN_TTL), self.MAX_TTL)
+
+    # -----------------------------------------------------
+    # METHOD REFRESH
+    # -----------------------------------------------------
+    def refresh(self) -> dict:
+        """
+        Fetches the discovery document and the key set.
+        :return: Metadata, including the key set as "jwks"
+        :raises requests.RequestException: When the provider
+        cannot be reached and there is no previous copy
+        """
+        try:
+            metadata, lifetime = self.__fetch(self.discovery_url)
+            if metadata.get("jwks_uri"):
+                metadata["jwks"], jwks_lifetime = self.__fetch(metadata["jwks_uri"])
+                lifetime = min(lifetime, jwks_lifetime)
+            metadata["_loaded_at"] = time.time()
+            self.fetches += 1
+        except (requests.RequestException, ValueError) as error:
+            if self.__metadata is None:
+                raise
+            self.logging.warning(
+                "Unable to refresh OIDC metadata, using the last good copy: %s", error
+            )
+            self.__expires_at = time.monotonic() + self.RETRY_AFTER
+            return self.__metadata
+        finally:
+            self.__refreshing = False
+        self.__metadata = metadata
+        self.__expires_at = time.monotonic() + lifetime
+        return metadata
+
+    # -----------------------------------------------------
+    # METHOD REFRESH IN BACKGROUND
+    # -----------------------------------------------------
+    def __refresh_in_background(self):
+        with self.__lock:
+            if self.__refreshing:
+                return
+            self.__refreshing = True
+        threading.Thread(target=self.refresh, name="oidc-metadata", daemon=True).start()
+
+    # -----------------------------------------------------
+    # METHOD GET
+    # -----------------------------------------------------
+    def get(self) -> dict:
+        """
+        Returns the cached metadata. Only the first call waits
+        for the provider; a stale copy is returned at once and
+        refreshed in the background.
+        :return: Metadata, including the key set as "jwks"
+        """
+        metadata = self.__metadata
+        if metadata is None:
+            with self.__lock:
+                if self.__metadata is None:
+                    return self.refresh()
+                metadata = self.__metadata
+        if time.monotonic() >= self.__expires_at:
+            self.__refresh_in_background()
+        return metadata
+
+
+# =========================================================
+# CLASS OIDC PROVIDER REGISTRY
+# =========================================================
+class OIDCProviderRegistry:
+    """
+    Process-wide Authlib registry with the OIDC provider
+    registered once. The provider metadata is served from a
+    ProviderMetadataCache instead of letting Authlib download
+    it, so logins never wait for the discovery endpoint.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, context: ServerContext):
+        self.oauth: OAuth = OAuth()
+        self.oauth.register(
+            name="oidc_provider",
+            client_id=context.oidc_client_id,
+            client_secret=context.oidc_client_secret,
+            client_kwargs={"scope": "openid email profile"},
+        )
+        self.metadata_cache: ProviderMetadataCache = ProviderMetadataCache(
+            discovery_url=context.oidc_discovery_endpoint,
+            default_ttl=context.oidc_metadata_ttl,
+            timeout=context.oidc_http_timeout,
+        )
+
+    # -----------------------------------------------------
+    # METHOD GET PROVIDER
+    # -----------------------------------------------------
+    async def get_provider(self):
+        """
+        :return: The registered Authlib client with up to date
+        server metadata
+        """
+        if self.metadata_cache.loaded:
+            metadata = self.metadata_cache.get()
+        else:
+            metadata = await run_in_threadpool(self.metadata_cache.get)
+        provider = self.oauth.oidc_provider
+        if provider.server_metadata is not metadata:
+            provider.server_metadata = metadata
+        return provider
+
+
+# Settings the OIDC provider registry is built from
+OIDC_SETTINGS: tuple = (
+    "oidc_discovery_endpoint",
+    "oidc_client_id",
+    "oidc_client_secret",
+    "oidc_metadata_ttl",
+    "oidc_http_timeout",
+)
+_registry: dict = {}
+_registry_lock = threading.Lock()
+
+
 # --------------------------------------------------------
 # REGISTER AND GET OAUTH PROVIDER
 # --------------------------------------------------------
+def get_oidc_registry() -> OIDCProviderRegistry:
+    registry = _registry.get("instance")
+    if registry is not None:
+        return registry
+    with _registry_lock:
+        if "instance" not in _registry:
+            _registry["instance"] = OIDCProviderRegistry(get_context())
+    return _registry["instance"]
+
+
+# --------------------------------------------------------
+# REBUILD OIDC REGISTRY
+# --------------------------------------------------------
+@on_reload
+def _rebuild_oidc_registry(previous: Settings, current: Settings):
+    """
+    Drops the registry when a reload changes the provider
+    settings; the next login registers the provider again.
+    """
+    if settings_changed(previous, current, OIDC_SETTINGS):
+        with _registry_lock:
+            _registry.pop("instance", None)
+
+
+# --------------------------------------------------------
+# GET OAUTH
+# --------------------------------------------------------
 def get_oauth() -> OAuth:
-    provider = OAuth()
-    config = get_context()
-    provider.register(
-        name="oidc_provider",
-        server_metadata_url=get_context().oidc_discovery_endpoint,
-        client_id=get_context().oidc_client_id,
-        client_secret=get_context().oidc_client_secret,
-        client_kwargs={"scope": "openid email profile"},
-    )
-    return provider
+    return get_oidc_registry().oauth
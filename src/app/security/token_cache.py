@@ -0,0 +1,231 @@
+import hashlib
+import heapq
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from jose import jwt, JWTError
+
+from app.business_objects.user import UserSession
+from app.caching import TTLCache
+from app.context import get_context, on_reload, settings_changed, Settings
+
+
+# =========================================================
+# CLASS REVOCATION LIST
+# =========================================================
+class RevocationList:
+    """
+    Digests of revoked tokens, each kept until the token
+    expires. Unlike a cache, it is not bounded: dropping a
+    revocation before the expiration would admit the token
+    again. Expired revocations are purged in expiration
+    order as new ones are checked or added.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__expirations: Dict[bytes, float] = {}
+        self.__heap: List[Tuple[float, bytes]] = []
+
+    # -----------------------------------------------------
+    # METHOD ADD
+    # -----------------------------------------------------
+    def add(self, key: bytes, expires_at: float or None):
+        """
+        :param key: Digest of the token
+        :param expires_at: Expiration of the token, in seconds
+        since the epoch. None keeps the revocation forever
+        """
+        expires_at = float("inf") if expires_at is None else float(expires_at)
+        with self.__lock:
+            self.__purge_expired()
+            if expires_at <= self.__expirations.get(key, float("-inf")):
+                return
+            self.__expirations[key] = expires_at
+            heapq.heappush(self.__heap, (expires_at, key))
+
+    # -----------------------------------------------------
+    # METHOD PURGE EXPIRED
+    # -----------------------------------------------------
+    def __purge_expired(self):
+        now = time.time()
+        while self.__heap and self.__heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self.__heap)
+            if self.__expirations.get(key) == expires_at:
+                del self.__expirations[key]
+
+    # -----------------------------------------------------
+    # METHOD CONTAINS
+    # -----------------------------------------------------
+    def __contains__(self, key: bytes) -> bool:
+        with self.__lock:
+            self.__purge_expired()
+            return key in self.__expirations
+
+    # -----------------------------------------------------
+    # METHOD LEN
+    # -----------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.__expirations)
+
+
+# =========================================================
+# CLASS VERIFIED TOKEN CACHE
+# =========================================================
+class VerifiedTokenCache:
+    """
+    Cache of the sessions of bearer tokens whose signature
+    and claims were already verified. Clients reuse the same
+    token for many requests; a hit skips the signature check
+    and the construction of the UserSession. Entries are keyed
+    by the SHA-256 digest of the token, so raw tokens are
+    never kept in memory, and live until the token expires.
+
+    Revoked tokens are dropped from the cache and remembered
+    until their expiration so they are not admitted again,
+    whatever the size of the cache.
+    """
+
+    # -----------------------------------------------------
+    # CONSTRUCTOR
+    # -----------------------------------------------------
+    def __init__(self, max_size: int):
+        """
+        :param max_size: Maximum number of cached sessions.
+        Zero disables the cache, not the revocations
+        """
+        self.sessions: TTLCache = TTLCache(max_size)
+        self.revoked: RevocationList = RevocationList()
+
+    # -----------------------------------------------------
+    # METHOD DIGEST
+    # -----------------------------------------------------
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    # -----------------------------------------------------
+    # METHOD GET
+    # -----------------------------------------------------
+    def get(self, token: str) -> UserSession or None:
+        """
+        :param token: Encoded bearer token
+        :return: Copy of the cached session or None
+        """
+        session = self.sessions.get(self.digest(token))
+        return session.copy() if session is not None else None
+
+    # -----------------------------------------------------
+    # METHOD PUT
+    # -----------------------------------------------------
+    def put(self, token: str, session: UserSession):
+        """
+        Caches the session of a verified token until the
+        token expires. Tokens without expiration are not
+        cached.
+        :param token: Encoded bearer token
+        :param session: Session built from the verified claims
+        """
+        if session.exp is None:
+            return
+        ttl = session.exp - time.time()
+        if ttl > 0:
+            self.sessions.set(self.digest(token), session, ttl)
+
+    # -----------------------------------------------------
+    # METHOD IS REVOKED
+    # -----------------------------------------------------
+    def is_revoked(self, token: str) -> bool:
+        return self.digest(token) in self.revoked
+
+    # -----------------------------------------------------
+    # METHOD REVOKE
+    # -----------------------------------------------------
+    def revoke(self, token: str):
+        """
+        Rejects a token before its expiration.
+        :param token: Encoded bearer token
+        """
+        key = self.digest(token)
+        self.sessions.delete(key)
+        try:
+            expiration = jwt.get_unverified_claims(token).get("exp")
+        except JWTError:
+            # Cannot be verified, so it is never admitted
+            return
+        if not isinstance(expiration, (int, float)) or isinstance(expiration, bool):
+            # Kept forever rather than trusting a malformed claim
+            expiration = None
+        self.revoked.add(key, expiration)
+
+    # -----------------------------------------------------
+    # METHOD EVICT SUBJECT
+    # -----------------------------------------------------
+    def evict_subject(self, subject: str) -> int:
+        """
+        Drops the cached sessions of a user, e.g. after its
+        claims change or it is disabled, so its next request
+        is verified again.
+        :param subject: Unique identifier of the user
+        :return: Number of evicted sessions
+        """
+        return self.sessions.delete_where(lambda session: session.sub == subject)
+
+    # -----------------------------------------------------
+    # METHOD CLEAR
+    # -----------------------------------------------------
+    def clear(self):
+        self.sessions.clear()
+
+    # -----------------------------------------------------
+    # PROPERTY STATISTICS
+    # -----------------------------------------------------
+    @property
+    def statistics(self) -> dict:
+        return {**self.sessions.statistics, "revoked": len(self.revoked)}
+
+
+_token_cache: dict = {}
+_token_cache_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# FUNCTION GET TOKEN CACHE
+# ---------------------------------------------------------
+def get_token_cache() -> VerifiedTokenCache:
+    """
+    Returns the process-wide verified token cache, sized
+    from the server context the first time it is used.
+    :return: VerifiedTokenCache
+    """
+    cache = _token_cache.get("instance")
+    if cache is not None:
+        return cache
+    with _token_cache_lock:
+        if "instance" not in _token_cache:
+            _token_cache["instance"] = VerifiedTokenCache(
+                get_context().token_cache_size
+            )
+    return _token_cache["instance"]
+
+
+# ---------------------------------------------------------
+# FUNCTION RESIZE TOKEN CACHE
+# ---------------------------------------------------------
+@on_reload
+def _resize_token_cache(previous: Settings, current: Settings):
+    """
+    Replaces the cache when a reload changes TOKEN_CACHE_SIZE.
+    Revocations are kept; cached sessions are verified again.
+    """
+    if settings_changed(previous, current, ("token_cache_size",)):
+        with _token_cache_lock:
+            cache = _token_cache.get("instance")
+            if cache is not None:
+                resized = VerifiedTokenCache(current.token_cache_size)
+                resized.revoked = cache.revoked
+                _token_cache["instance"] = resized
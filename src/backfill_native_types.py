@@ -0,0 +1,60 @@
+import argparse
+import sys
+
+from rich import print
+
+from app.business_objects.core.migration import SchemaBackfill
+from app.business_objects.repositories import get_indexed_repositories
+
+
+def main() -> int:
+    repositories = {
+        repository.collection_name: repository
+        for repository in get_indexed_repositories()
+        if repository.schema is not None
+    }
+    parser = argparse.ArgumentParser(
+        description="Convert stored string values to the native types "
+        "of the repository schemas"
+    )
+    parser.add_argument(
+        "collection", choices=sorted(repositories), help="collection to convert"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="documents per batch (MONGO_BULK_CHUNK_SIZE)",
+    )
+    parser.add_argument(
+        "--max-batches", type=int, default=None, help="stop after this many batches"
+    )
+    parser.add_argument(
+        "--pause-ms", type=int, default=0, help="wait between batches to limit the load"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only count the documents to convert, write nothing",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="forget the checkpoint and scan the whole collection again",
+    )
+    arguments = parser.parse_args()
+
+    backfill = SchemaBackfill(
+        repositories[arguments.collection],
+        batch_size=arguments.batch_size,
+        pause=arguments.pause_ms / 1000,
+    )
+    if arguments.restart and not arguments.dry_run:
+        backfill.reset()
+    print(backfill.run(max_batches=arguments.max_batches, dry_run=arguments.dry_run))
+    print(backfill.checkpoint)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
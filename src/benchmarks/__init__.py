@@ -0,0 +1,31 @@
+import os
+
+from app.context import ENV_VARIABLE_NAMES
+
+PLACEHOLDER_SETTINGS: dict = {
+    "MONGO_SERVER": "localhost",
+    "MONGO_PORT": "27017",
+    "MONGO_TLS_CONNECTION": "0",
+    "MONGO_CLUSTER": "0",
+    "MONGO_SRV": "0",
+    "QUERY_LIMIT": "100",
+    "LOG_LEVEL": "INFO",
+    "JWT_SIGN_ALGORITHM": "HS256",
+    "JWT_TOKEN_DURATION_IN_MINUTES": "30",
+    "MONGO_AUTO_INDEX": "0",
+}
+
+
+# ---------------------------------------------------------
+# METHOD PREPARE ENVIRONMENT
+# ---------------------------------------------------------
+def prepare_environment():
+    """
+    Fills in placeholder settings so the benchmarks run
+    without a .env file. Values already present in the
+    environment are kept.
+    """
+    for name in ENV_VARIABLE_NAMES:
+        os.environ.setdefault(name, PLACEHOLDER_SETTINGS.get(name, "placeholder"))
+    for name, value in PLACEHOLDER_SETTINGS.items():
+        os.environ.setdefault(name, value)
@@ -0,0 +1,84 @@
+"""
+Benchmark of the CPU side of finding ingestion.
+
+Measures the records per second a worker parses and normalizes for the
+body formats accepted by POST /findings:ingest, i.e. the ceiling of
+ingestion before the bulk writes, which run concurrently with parsing.
+Records alternate between samples/vulnerability,.json and
+samples/benchmark.json with unique ids, and the body is fed in chunks
+of 64 KiB as uvicorn does.
+
+Usage (from the src folder):
+    python -m benchmarks.ingestion
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import time
+
+from benchmarks import prepare_environment
+
+RECORDS = 20000
+CHUNK_SIZE = 64 * 1024
+SAMPLES = [
+    os.path.join(os.path.dirname(__file__), "..", "..", "samples", name)
+    for name in ("vulnerability,.json", "benchmark.json")
+]
+
+
+# ---------------------------------------------------------
+# METHOD LOAD RECORDS
+# ---------------------------------------------------------
+def load_records() -> list:
+    samples = []
+    for sample in SAMPLES:
+        with open(sample, encoding="utf-8") as sample_file:
+            samples.append(json.load(sample_file))
+    return [
+        {**samples[index % len(samples)], "id": f"finding-{index}"}
+        for index in range(RECORDS)
+    ]
+
+
+# ---------------------------------------------------------
+# METHOD MAIN
+# ---------------------------------------------------------
+def main():
+    prepare_environment()
+    from app.business_objects.finding.normalization import normalize_finding
+    from app.resources.ingestion import parse_records
+
+    records = load_records()
+    bodies = {
+        "application/x-ndjson": "\n".join(
+            json.dumps(record) for record in records
+        ).encode(),
+        "application/json": json.dumps(records).encode(),
+    }
+
+    async def get_chunks(body: bytes):
+        for start in range(0, len(body), CHUNK_SIZE):
+            yield body[start : start + CHUNK_SIZE]
+
+    async def ingest(body: bytes, media_type: str) -> int:
+        count = 0
+        now = datetime.datetime.utcnow()
+        async for _, record in parse_records(get_chunks(body), media_type, 1024 * 1024):
+            normalize_finding(record, now)
+            count += 1
+        return count
+
+    for media_type, body in bodies.items():
+        started = time.perf_counter()
+        count = asyncio.run(ingest(body, media_type))
+        elapsed = time.perf_counter() - started
+        print(
+            f"{media_type:<22} {count / elapsed:12,.0f} records/s "
+            f"{len(body) / elapsed / 1e6:8.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
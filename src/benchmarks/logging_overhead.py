@@ -0,0 +1,86 @@
+"""
+Micro-benchmark of the cost of log calls at disabled levels.
+
+Compares the previous logger, which was constructed on every access to
+ServerContext.logging and built and formatted a LogEvent before the
+level was checked, against the shared loggers of get_logger(), which
+check the level (and the sampling rate) before doing any work. The
+root level is INFO, so debug calls are disabled; info calls are also
+measured with a sampling rate of 0.
+
+Usage (from the src folder):
+    python -m benchmarks.logging_overhead
+"""
+
+import datetime
+import logging
+import timeit
+
+from benchmarks import prepare_environment
+
+ITERATIONS = 100000
+SESSION = {"sub": "7d3c", "desc": "Jane Doe", "claims": ["authenticate"]}
+
+
+# =========================================================
+# CLASS PREVIOUS LOGGER
+# =========================================================
+class PreviousLogger:
+    # Equivalent of the former StandardOutputLogger, without the
+    # root level override so the call is filtered by the level
+    def debug(self, message: str) -> dict:
+        utc_datetime = datetime.datetime.now(datetime.timezone.utc)
+        event = f"[DEBUG: {str(utc_datetime)}]: {message}"
+        logging.debug(event)
+        return {"message": message, "level": "DEBUG", "utc_datetime": utc_datetime}
+
+
+# ---------------------------------------------------------
+# METHOD MAIN
+# ---------------------------------------------------------
+def main():
+    prepare_environment()
+    from app.logging import configure_logging, get_logger
+
+    configure_logging(logging.INFO)
+    logger = get_logger("benchmarks")
+    sampled_logger = get_logger("benchmarks.sampled")
+    standard_logger = logging.getLogger("benchmarks.standard")
+
+    def sampled_info():
+        configure_logging(logging.INFO, sample_rates={logging.INFO: 0.0})
+        try:
+            return min(
+                timeit.repeat(
+                    lambda: sampled_logger.info("User: %s authenticated", SESSION),
+                    number=ITERATIONS,
+                    repeat=3,
+                )
+            )
+        finally:
+            configure_logging(logging.INFO)
+
+    for name, function in (
+        (
+            "previous logger per call (debug, f-string)",
+            lambda: PreviousLogger().debug(f"User: {SESSION} authenticated"),
+        ),
+        (
+            "get_logger() debug with arguments",
+            lambda: logger.debug("User: %s authenticated", SESSION),
+        ),
+        (
+            "logging.Logger.debug (baseline)",
+            lambda: standard_logger.debug("User: %s authenticated", SESSION),
+        ),
+    ):
+        elapsed = min(timeit.repeat(function, number=ITERATIONS, repeat=3))
+        print(f"{name:<45} {elapsed / ITERATIONS * 1e9:10.0f} ns/call")
+    print(
+        f"{'get_logger() info sampled out (rate 0)':<45} "
+        f"{sampled_info() / ITERATIONS * 1e9:10.0f} ns/call"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark of point lookups (get_by_id / get_by_username).
+
+Compares the former lookup path, find(query).limit(QUERY_LIMIT) copied
+into a list and popped, against EntityRepository.find_one on a seeded
+in-process Mongo stand-in (mongomock). Bytes are the BSON size of the
+documents returned by the server, i.e. what would travel over the wire.
+
+Two scenarios are measured: a unique key (one match) and a key that
+matches many documents, which is what happens on fields that are not
+protected by a unique index.
+
+Usage (from the src folder, requires `pip install mongomock`):
+    python -m benchmarks.point_lookup
+"""
+
+import json
+import os
+import sys
+import timeit
+
+import bson
+
+from benchmarks import prepare_environment
+
+ITERATIONS = 500
+QUERY_LIMIT = 100
+SAMPLE_DOCUMENT = os.path.join(
+    os.path.dirname(__file__), "..", "..", "samples", "vulnerability,.json"
+)
+
+
+# ---------------------------------------------------------
+# METHOD SEED COLLECTION
+# ---------------------------------------------------------
+def seed_collection(collection):
+    with open(SAMPLE_DOCUMENT, encoding="utf-8") as sample_file:
+        sample: dict = json.load(sample_file)
+    documents = []
+    for index in range(1000):
+        document = dict(sample)
+        document["id"] = f"finding-{index}"
+        # 50 documents share the same owner to model a non-unique key
+        document["ownership"] = "shared" if index < 50 else f"owner-{index}"
+        documents.append(document)
+    collection.insert_many(documents)
+
+
+# ---------------------------------------------------------
+# METHOD PREVIOUS LOOKUP
+# ---------------------------------------------------------
+def previous_lookup(collection, query: dict) -> dict:
+    result_set: list = []
+    for result in collection.find(query).limit(QUERY_LIMIT):
+        result_set.append(result.copy())
+    previous_lookup.bytes += sum(len(bson.encode(result)) for result in result_set)
+    return result_set.pop()
+
+
+# ---------------------------------------------------------
+# METHOD POINT LOOKUP
+# ---------------------------------------------------------
+def point_lookup(repository, query: dict) -> dict:
+    document = repository.find_one(query)
+    point_lookup.bytes += len(bson.encode(document))
+    return document
+
+
+# ---------------------------------------------------------
+# METHOD MAIN
+# ---------------------------------------------------------
+def main():
+    try:
+        import mongomock
+    except ImportError:
+        print("mongomock is required: pip install mongomock")
+        sys.exit(1)
+    os.environ["QUERY_LIMIT"] = str(QUERY_LIMIT)
+    prepare_environment()
+    from app.business_objects.member import Members
+
+    repository = Members()
+    repository.entities = mongomock.MongoClient().benchmark.findings
+    seed_collection(repository.entities)
+
+    for scenario, query in (
+        ("unique key", {"id": "finding-500"}),
+        ("key with 50 matches", {"ownership": "shared"}),
+    ):
+        for name, function, target in (
+            ("find().limit() + copy + pop", previous_lookup, repository.entities),
+            ("find_one", point_lookup, repository),
+        ):
+            function.bytes = 0
+            elapsed = min(
+                timeit.repeat(
+                    lambda: function(target, query), number=ITERATIONS, repeat=3
+                )
+            )
+            print(
+                f"{scenario:<22} {name:<30} "
+                f"{elapsed / ITERATIONS * 1e6:10.2f} us/lookup "
+                f"{function.bytes / (ITERATIONS * 3):10.0f} bytes/lookup"
+            )
+
+
+if __name__ == "__main__":
+    main()
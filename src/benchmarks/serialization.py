@@ -0,0 +1,92 @@
+"""
+Micro-benchmark of the per-document cost of encoding a response.
+
+Compares the path FastAPI takes for a response_model, i.e. validating
+the document into the model, converting it with jsonable_encoder and
+encoding it with json.dumps, against encoding the document straight
+from MongoDB with TrustedJSONResponse (orjson when installed) and with
+the json module fallback. Documents are findings as in
+samples/benchmark.json with an ObjectId and datetimes, as returned by
+the driver.
+
+Usage (from the src folder):
+    python -m benchmarks.serialization
+"""
+
+import datetime
+import json
+import os
+import timeit
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+
+from benchmarks import prepare_environment
+
+ITERATIONS = 2000
+SAMPLE_DOCUMENT = os.path.join(
+    os.path.dirname(__file__), "..", "..", "samples", "benchmark.json"
+)
+
+
+# ---------------------------------------------------------
+# METHOD LOAD DOCUMENT
+# ---------------------------------------------------------
+def load_document() -> dict:
+    with open(SAMPLE_DOCUMENT, encoding="utf-8") as sample_file:
+        document: dict = json.load(sample_file)
+    document["_id"] = ObjectId()
+    document["db_creation_datetime"] = datetime.datetime(2022, 10, 21, 21, 40, 57)
+    document["db_update_datetime"] = datetime.datetime(2022, 11, 21, 19, 26, 38)
+    return document
+
+
+# ---------------------------------------------------------
+# METHOD MAIN
+# ---------------------------------------------------------
+def main():
+    prepare_environment()
+    from fastapi.encoders import jsonable_encoder
+    from pydantic import create_model
+
+    from app.resources import serialization
+
+    document = load_document()
+    fields: Dict[str, Any] = {
+        name: (Optional[str], None)
+        for name, value in document.items()
+        if isinstance(value, str) and name.isidentifier()
+    }
+    fields["plugin_output"] = (Optional[Dict[str, Any]], None)
+    fields["db_creation_datetime"] = (Optional[datetime.datetime], None)
+    fields["db_update_datetime"] = (Optional[datetime.datetime], None)
+    Finding = create_model("Finding", **fields)
+    fast_encoder = serialization.orjson
+
+    def validated():
+        return json.dumps(jsonable_encoder(Finding(**document))).encode()
+
+    def trusted():
+        return serialization.dumps(document)
+
+    def trusted_json():
+        serialization.orjson = None
+        try:
+            return serialization.dumps(document)
+        finally:
+            serialization.orjson = fast_encoder
+
+    for name, function in (
+        ("response_model validation + json", validated),
+        ("trusted, json module", trusted_json),
+        (f"trusted, {'orjson' if fast_encoder else 'json module'}", trusted),
+    ):
+        elapsed = min(timeit.repeat(function, number=ITERATIONS, repeat=3))
+        print(
+            f"{name:<36} {elapsed / ITERATIONS * 1e6:10.2f} us/document "
+            f"{len(function()):8d} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Micro-benchmark of the per-request cost of reading settings.
+
+Compares the previous behaviour, where every call to get_context()
+re-ran load_dotenv() and rebuilt the Confite object, against the
+memoized settings snapshot.
+
+Usage (from the src folder):
+    python -m benchmarks.settings_overhead
+"""
+
+import timeit
+
+from confite import Confite
+from dotenv import load_dotenv
+
+from app.context import ENV_VARIABLE_NAMES, get_context
+from benchmarks import prepare_environment
+
+ITERATIONS = 20000
+
+
+# ---------------------------------------------------------
+# METHOD PREVIOUS REQUEST PATH
+# ---------------------------------------------------------
+def previous_request_path():
+    # Equivalent of the former ServerContext constructor
+    load_dotenv()
+    context = Confite(ENV_VARIABLE_NAMES)
+    return context.as_str("JWT_SECRET_KEY"), context.as_int("QUERY_LIMIT")
+
+
+# ---------------------------------------------------------
+# METHOD SNAPSHOT REQUEST PATH
+# ---------------------------------------------------------
+def snapshot_request_path():
+    context = get_context()
+    return context.jwt_key, context.query_limit
+
+
+# ---------------------------------------------------------
+# METHOD MAIN
+# ---------------------------------------------------------
+def main():
+    prepare_environment()
+    for name, function in (
+        ("load_dotenv + ServerContext per call", previous_request_path),
+        ("memoized settings snapshot", snapshot_request_path),
+    ):
+        elapsed = min(timeit.repeat(function, number=ITERATIONS, repeat=3))
+        print(f"{name:<40} {elapsed / ITERATIONS * 1e6:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import sys
+
+from rich import print
+
+from app.business_objects.core.indexes import IndexManager
+from app.business_objects.repositories import get_indexed_repositories
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Reconcile the declared repository indexes with MongoDB"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only report drift, exit with status 1 when indexes are out of sync",
+    )
+    parser.add_argument(
+        "--drop-changed",
+        action="store_true",
+        help="drop and rebuild indexes whose options differ from the declaration",
+    )
+    parser.add_argument(
+        "--drop-extra",
+        action="store_true",
+        help="drop indexes that are not declared by any repository",
+    )
+    arguments = parser.parse_args()
+
+    manager = IndexManager(get_indexed_repositories())
+    if arguments.check:
+        report = manager.drift()
+    else:
+        report = manager.reconcile(
+            drop_changed=arguments.drop_changed, drop_extra=arguments.drop_extra
+        )
+    for drift in report:
+        print(drift.dict())
+    if arguments.check and not all(drift.in_sync for drift in report):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+from app.business_objects.core.bulk import BulkResult, chunked
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN ITEMS ARE CHUNKED THE LAST CHUNK HOLDS THE REMAINDER
+# -----------------------------------------------------------------------------
+def test_chunked_when_items_are_chunked_the_last_chunk_holds_the_remainder():
+    # Prepare
+    items = iter(range(7))
+
+    # Act
+    chunks = list(chunked(items, 3))
+
+    # Assert
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A CHUNK FAILS ERRORS POINT TO THE POSITION IN THE INPUT
+# -----------------------------------------------------------------------------
+def test_bulk_result_when_a_chunk_fails_errors_point_to_the_position_in_the_input():
+    # Prepare
+    result = BulkResult()
+    details = {
+        "nInserted": 2,
+        "writeErrors": [{"index": 1, "code": 11000, "errmsg": "E11000 duplicate key"}],
+        "writeConcernErrors": [],
+    }
+
+    # Act
+    result.add_error_details(details, offset=1000)
+
+    # Assert
+    assert result.inserted == 2
+    assert not result.succeeded
+    assert result.errors == [
+        {"index": 1001, "code": 11000, "message": "E11000 duplicate key"}
+    ]
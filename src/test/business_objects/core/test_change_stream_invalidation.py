@@ -0,0 +1,138 @@
+import pytest
+from pymongo.errors import OperationFailure
+
+from app.business_objects.core.cache import CachePolicy, get_document_cache
+from app.business_objects.core.invalidation import TTL_ONLY, ChangeStreamInvalidator
+from app.context import ENV_VARIABLE_NAMES, ServerContext
+
+COLLECTION = "change_stream_members"
+POLICY = CachePolicy(keys=("id",), max_size=10, ttl=60)
+
+
+# =========================================================
+# CLASS STUB DATABASE
+# =========================================================
+class StubDatabase:
+
+    def watch(self, pipeline, resume_after=None, max_await_time_ms=None):
+        raise OperationFailure(
+            "The $changeStream stage is only supported on replica sets", 40573
+        )
+
+
+# =========================================================
+# CLASS STUB DATABASE CONTEXT
+# =========================================================
+class StubDatabaseContext(ServerContext):
+    """
+    Server context built from the environment, whose database
+    is the stub so no server is needed.
+    """
+
+    @property
+    def database(self):
+        return StubDatabase()
+
+
+# -----------------------------------------------------------------------------
+# GET CONTEXT
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def get_context(monkeypatch):
+    def build(mongo_cluster: bool) -> ServerContext:
+        for name in ENV_VARIABLE_NAMES:
+            monkeypatch.setenv(name, "1")
+        monkeypatch.setenv("LOG_LEVEL", "warning")
+        monkeypatch.setenv("MONGO_CLUSTER", "1" if mongo_cluster else "0")
+        return StubDatabaseContext(ENV_VARIABLE_NAMES)
+
+    return build
+
+
+# -----------------------------------------------------------------------------
+# GET CACHED DOCUMENT
+# -----------------------------------------------------------------------------
+def get_cached_document(document: dict):
+    cache = get_document_cache(COLLECTION, POLICY)
+    cache.clear()
+    key = cache.key_of({"id": document["id"]}, None, True)
+    cache.put(key, document, cache.generation)
+    return cache, key
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A DOCUMENT IS UPDATED ELSEWHERE ITS ENTRY IS INVALIDATED BY _ID
+# -----------------------------------------------------------------------------
+def test_change_stream_invalidator_when_a_document_is_updated_elsewhere_its_entry_is_invalidated_by_id(
+    get_context,
+):
+    # Prepare
+    cache, key = get_cached_document({"_id": 7, "id": "m-1", "email": "jane@doe.com"})
+    invalidator = ChangeStreamInvalidator(get_context(True), [COLLECTION])
+
+    # Act
+    invalidator.apply(
+        {
+            "operationType": "update",
+            "ns": {"db": "darkstar", "coll": COLLECTION},
+            "documentKey": {"_id": 7},
+            "updateDescription": {"updatedFields": {"email": "john@doe.com"}},
+        }
+    )
+
+    # Assert
+    assert cache.get(key) is None
+    assert invalidator.statistics["events"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE COLLECTION IS DROPPED THE WHOLE CACHE IS CLEARED
+# -----------------------------------------------------------------------------
+def test_change_stream_invalidator_when_the_collection_is_dropped_the_whole_cache_is_cleared(
+    get_context,
+):
+    # Prepare
+    cache, key = get_cached_document({"_id": 8, "id": "m-2"})
+    invalidator = ChangeStreamInvalidator(get_context(True), [COLLECTION])
+
+    # Act
+    invalidator.apply(
+        {"operationType": "drop", "ns": {"db": "darkstar", "coll": COLLECTION}}
+    )
+
+    # Assert
+    assert cache.get(key) is None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE DEPLOYMENT IS NOT A CLUSTER CACHES FALL BACK TO TTL ONLY
+# -----------------------------------------------------------------------------
+def test_change_stream_invalidator_when_the_deployment_is_not_a_cluster_caches_fall_back_to_ttl_only(
+    get_context,
+):
+    # Prepare
+    invalidator = ChangeStreamInvalidator(get_context(False), [COLLECTION])
+
+    # Act
+    thread = invalidator.start()
+
+    # Assert
+    assert thread is None
+    assert invalidator.statistics["state"] == TTL_ONLY
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE SERVER HAS NO CHANGE STREAMS THE LISTENER STOPS
+# -----------------------------------------------------------------------------
+def test_change_stream_invalidator_when_the_server_has_no_change_streams_the_listener_stops(
+    get_context,
+):
+    # Prepare
+    invalidator = ChangeStreamInvalidator(get_context(True), [COLLECTION])
+
+    # Act
+    invalidator.start().join(5)
+
+    # Assert
+    assert invalidator.statistics["state"] == TTL_ONLY
+    invalidator.stop()
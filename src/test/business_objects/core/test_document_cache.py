@@ -0,0 +1,151 @@
+from app.business_objects.core.cache import (
+    CachePolicy,
+    DocumentCache,
+    MISSING,
+    widen_projection,
+)
+from app.business_objects.member import Members
+from app.business_objects.member.repository import MEMBER_CACHE_POLICY
+
+POLICY = CachePolicy(keys=("id", "email"), max_size=10, ttl=60, negative_ttl=60)
+
+
+# =========================================================
+# CLASS STUB CURSOR
+# =========================================================
+class StubCursor(list):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+# =========================================================
+# CLASS STUB COLLECTION
+# =========================================================
+class StubCollection:
+
+    def __init__(self, documents: list):
+        self.documents = documents
+        self.reads = 0
+
+    def find(self, query: dict, projection=None, batch_size=None, limit=0):
+        self.reads += 1
+        return StubCursor(
+            dict(document)
+            for document in self.documents
+            if all(document.get(field) == value for field, value in query.items())
+        )
+
+    def update_one(self, query: dict, update: dict):
+        for document in self.documents:
+            if all(document.get(field) == value for field, value in query.items()):
+                document.update(update["$set"])
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A DOCUMENT IS CACHED A COPY IS RETURNED
+# -----------------------------------------------------------------------------
+def test_document_cache_when_a_document_is_cached_a_copy_is_returned():
+    # Prepare
+    cache = DocumentCache("members", POLICY)
+    key = cache.key_of({"id": "m-1"}, None, True)
+    cache.put(key, {"id": "m-1", "email": "jane@doe.com"}, cache.generation)
+
+    # Act
+    document = cache.get(key)
+    document["email"] = "changed"
+
+    # Assert
+    assert cache.get(key) == {"id": "m-1", "email": "jane@doe.com"}
+    assert cache.statistics["hits"] == 2
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A WRITE TOUCHES ANOTHER KEY OF THE DOCUMENT ITS ENTRIES ARE DROPPED
+# -----------------------------------------------------------------------------
+def test_document_cache_when_a_write_touches_another_key_of_the_document_its_entries_are_dropped():
+    # Prepare
+    cache = DocumentCache("members", POLICY)
+    key = cache.key_of({"email": "jane@doe.com"}, None, False)
+    cache.put(key, {"id": "m-1", "email": "jane@doe.com"}, cache.generation)
+
+    # Act
+    cache.invalidate_write({"id": "m-1"}, {"name": "Jane"})
+
+    # Assert
+    assert cache.get(key) is None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A LOOKUP MISSES THE MISS IS CACHED UNTIL THE DOCUMENT IS CREATED
+# -----------------------------------------------------------------------------
+def test_document_cache_when_a_lookup_misses_the_miss_is_cached_until_the_document_is_created():
+    # Prepare
+    cache = DocumentCache("members", POLICY)
+    key = cache.key_of({"id": "m-2"}, None, True)
+    cache.put(key, None, cache.generation)
+    cached_miss = cache.get(key)
+
+    # Act
+    cache.invalidate_write(None, {"id": "m-2", "email": "john@doe.com"})
+
+    # Assert
+    assert cached_miss is MISSING
+    assert cache.get(key) is None
+    assert cache.statistics["negative_hits"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A WRITE HAPPENS DURING A READ THE FILL IS DISCARDED
+# -----------------------------------------------------------------------------
+def test_document_cache_when_a_write_happens_during_a_read_the_fill_is_discarded():
+    # Prepare
+    cache = DocumentCache("members", POLICY)
+    key = cache.key_of({"id": "m-1"}, None, True)
+    generation = cache.generation
+    cache.invalidate_write({"id": "m-1"}, {"name": "Jane"})
+
+    # Act
+    cache.put(key, {"id": "m-1", "name": "Old"}, generation)
+
+    # Assert
+    assert cache.get(key) is None
+    assert cache.statistics["discarded_fills"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE PROJECTION OMITS A KEY FIELD IT IS FETCHED TO TAG THE ENTRY
+# -----------------------------------------------------------------------------
+def test_widen_projection_when_the_projection_omits_a_key_field_it_is_fetched_to_tag_the_entry():
+    # Act
+    inclusion, added_to_inclusion = widen_projection({"_id": 0, "name": 1}, ("id",))
+    exclusion, added_to_exclusion = widen_projection({"id": 0, "blob": 0}, ("id",))
+
+    # Assert
+    assert inclusion == {"_id": 0, "name": 1, "id": 1}
+    assert added_to_inclusion == ["id"]
+    assert exclusion == {"blob": 0}
+    assert added_to_exclusion == ["id"]
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A REPOSITORY CACHES LOOKUPS UPDATES ARE READ AGAIN
+# -----------------------------------------------------------------------------
+def test_repository_when_it_caches_lookups_updates_are_read_again():
+    # Prepare
+    members = Members()
+    members.entities = StubCollection([{"id": "m-1", "name": "Jane"}])
+    members.document_cache = DocumentCache("members", MEMBER_CACHE_POLICY)
+    members.get_by_id("m-1")
+    members.get_by_id("m-1")
+
+    # Act
+    members.update_one("m-1", {"name": "Janet"})
+    document = members.get_by_id("m-1")
+
+    # Assert
+    assert document["name"] == "Janet"
+    assert members.entities.reads == 2
@@ -0,0 +1,86 @@
+from app.business_objects.core.indexes import IndexSpec, compute_index_drift
+
+
+# -----------------------------------------------------------------------------
+# GET INDEX INFORMATION
+# -----------------------------------------------------------------------------
+def get_index_information() -> dict:
+    return {
+        "_id_": {"v": 2, "key": [("_id", 1)]},
+        "username_1": {"v": 2, "key": [("username", 1)], "unique": True},
+        "legacy_email": {"v": 2, "key": [("email", 1)]},
+        "status_1_last_seen_-1": {"v": 2, "key": [("status", 1), ("last_seen", -1)]},
+    }
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SPEC IS A SINGLE FIELD THE GENERATED NAME MATCHES MONGO
+# -----------------------------------------------------------------------------
+def test_index_spec_when_spec_is_a_single_field_the_generated_name_matches_mongo():
+    # Act
+    spec = IndexSpec("email")
+
+    # Assert
+    assert spec.name == "email_1"
+    assert spec.to_index_model().document["key"] == {"email": 1}
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SPEC IS TTL AND PARTIAL THE OPTIONS ARE PART OF THE MODEL
+# -----------------------------------------------------------------------------
+def test_index_spec_when_spec_is_ttl_and_partial_the_options_are_part_of_the_model():
+    # Act
+    document = (
+        IndexSpec(
+            "expires_at",
+            expire_after_seconds=0,
+            partial_filter={"expires_at": {"$exists": True}},
+        )
+        .to_index_model()
+        .document
+    )
+
+    # Assert
+    assert document["expireAfterSeconds"] == 0
+    assert document["partialFilterExpression"] == {"expires_at": {"$exists": True}}
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN INDEXES MATCH THE DECLARATION THERE IS NO DRIFT
+# -----------------------------------------------------------------------------
+def test_compute_index_drift_when_indexes_match_the_declaration_there_is_no_drift():
+    # Prepare
+    specs = [
+        IndexSpec("username", unique=True),
+        IndexSpec("email"),
+        IndexSpec([("status", 1), ("last_seen", -1)]),
+    ]
+
+    # Act
+    drift = compute_index_drift("users", specs, get_index_information())
+
+    # Assert
+    assert drift.in_sync
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN INDEXES DIFFER THE DRIFT IS REPORTED
+# -----------------------------------------------------------------------------
+def test_compute_index_drift_when_indexes_differ_the_drift_is_reported():
+    # Prepare
+    specs = [
+        IndexSpec("username"),
+        IndexSpec("email"),
+        IndexSpec("id", unique=True),
+    ]
+
+    # Act
+    drift = compute_index_drift("users", specs, get_index_information())
+
+    # Assert
+    assert drift.dict() == {
+        "collection": "users",
+        "missing": ["id_1"],
+        "changed": ["username_1"],
+        "extra": ["status_1_last_seen_-1"],
+    }
@@ -0,0 +1,167 @@
+from types import SimpleNamespace
+from typing import Dict, List
+
+from app.business_objects.core.bulk import BulkResult
+from app.business_objects.core.migration import SchemaBackfill
+from app.business_objects.core.schema import Schema, get_path, to_int
+
+
+# =============================================================================
+# STUB COLLECTION
+# =============================================================================
+class StubCollection:
+    def __init__(self, documents: List[Dict]):
+        self.documents: Dict = {document["_id"]: document for document in documents}
+        self.query: Dict = {}
+        self.size: int = 0
+
+    def find(self, query: Dict):
+        self.query = query
+        return self
+
+    def sort(self, *args):
+        return self
+
+    def limit(self, size: int):
+        self.size = size
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def __iter__(self):
+        last_id = self.query.get("_id", {}).get("$gt", "")
+        pending = [
+            document
+            for _id, document in sorted(self.documents.items())
+            if _id > last_id and isinstance(document.get("port"), str)
+        ]
+        return iter([dict(document) for document in pending[: self.size]])
+
+
+# =============================================================================
+# STUB CHECKPOINTS
+# =============================================================================
+class StubCheckpoints:
+    def __init__(self):
+        self.documents: Dict = {}
+
+    def find_one(self, query: Dict):
+        return self.documents.get(query["_id"])
+
+    def update_one(self, query: Dict, update: Dict, upsert: bool):
+        document = self.documents.setdefault(query["_id"], {"_id": query["_id"]})
+        document.update(update["$set"])
+        for name, value in update["$inc"].items():
+            document[name] = document.get(name, 0) + value
+
+    def delete_one(self, query: Dict):
+        self.documents.pop(query["_id"], None)
+
+
+# =============================================================================
+# STUB REPOSITORY
+# =============================================================================
+class StubRepository:
+    def __init__(self, documents: List[Dict]):
+        self.collection_name: str = "findings"
+        self.schema: Schema = Schema({"port": to_int})
+        self.entities: StubCollection = StubCollection(documents)
+        self.db: Dict = {"migrations": StubCheckpoints()}
+        self.context = SimpleNamespace(
+            bulk_chunk_size=2,
+            logger=lambda name: SimpleNamespace(warning=lambda *args: None),
+        )
+
+    def collection(self, routing=None) -> StubCollection:
+        self.routing = routing
+        return self.entities
+
+    def native_updates(self, document: Dict):
+        return self.schema.native_values(document)
+
+    def bulk_write(self, operations, chunk_size: int) -> BulkResult:
+        result = BulkResult()
+        for operation in operations:
+            guard = operation._filter
+            stored = self.entities.documents[guard["_id"]]
+            if all(get_path(stored, path)[1] == value for path, value in guard.items()):
+                stored.update(operation._doc["$set"])
+                result.matched += 1
+                result.modified += 1
+        return result
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN INTERRUPTED THE BACKFILL RESUMES AFTER ITS CHECKPOINT
+# -----------------------------------------------------------------------------
+def test_backfill_when_interrupted_the_backfill_resumes_after_its_checkpoint():
+    # Prepare
+    repository = StubRepository(
+        [
+            {"_id": "a", "port": "443"},
+            {"_id": "b", "port": 80},
+            {"_id": "c", "port": "https"},
+            {"_id": "d", "port": "22"},
+            {"_id": "e", "port": ""},
+        ]
+    )
+
+    # Act
+    first = SchemaBackfill(repository).run(max_batches=1)
+    second = SchemaBackfill(repository).run()
+
+    # Assert
+    assert first == {
+        "scanned": 2,
+        "converted": 1,
+        "conflicts": 0,
+        "failed": 1,
+        "complete": False,
+    }
+    assert second == {
+        "scanned": 2,
+        "converted": 2,
+        "conflicts": 0,
+        "failed": 0,
+        "complete": True,
+    }
+    assert [
+        document["port"] for document in repository.entities.documents.values()
+    ] == [
+        443,
+        80,
+        "https",
+        22,
+        None,
+    ]
+    assert repository.routing.read_preference == "primary"
+    checkpoint = repository.db["migrations"].documents["findings.native-types"]
+    assert checkpoint["last_id"] == "e"
+    assert checkpoint["converted"] == 3
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A DOCUMENT CHANGED SINCE IT WAS READ IT IS LEFT AS A CONFLICT
+# -----------------------------------------------------------------------------
+def test_backfill_when_a_document_changed_since_it_was_read_it_is_left_as_a_conflict():
+    # Prepare
+    repository = StubRepository([{"_id": "a", "port": "443"}])
+    bulk_write = repository.bulk_write
+
+    def concurrent_bulk_write(operations, chunk_size):
+        repository.entities.documents["a"]["port"] = "8443"
+        return bulk_write(operations, chunk_size)
+
+    repository.bulk_write = concurrent_bulk_write
+
+    # Act
+    statistics = SchemaBackfill(repository).run(max_batches=1)
+
+    # Assert
+    assert statistics["converted"] == 0
+    assert statistics["conflicts"] == 1
+    assert repository.entities.documents["a"]["port"] == "8443"
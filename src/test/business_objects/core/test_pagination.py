@@ -0,0 +1,160 @@
+import pytest
+from bson import ObjectId
+
+from app.business_objects.core.pagination import (
+    InvalidPageTokenError,
+    KeysetPagination,
+)
+
+
+# -----------------------------------------------------------------------------
+# GET DOCUMENTS
+# -----------------------------------------------------------------------------
+def get_documents(count: int) -> list:
+    return [
+        {"_id": ObjectId(), "email": f"member{index}@mail.com"}
+        for index in range(count)
+    ]
+
+
+# -----------------------------------------------------------------------------
+# FETCH
+# -----------------------------------------------------------------------------
+def fetch(documents: list, pagination: KeysetPagination) -> list:
+    """
+    Minimal in-memory evaluation of the keyset filter and
+    sort used by the repositories, for _id based pagination.
+    """
+    condition = pagination.filter.get("_id", {})
+    selected = [
+        document
+        for document in documents
+        if ("$gt" not in condition or document["_id"] > condition["$gt"])
+        and ("$lt" not in condition or document["_id"] < condition["$lt"])
+    ]
+    order = pagination.sort[0][1]
+    selected.sort(key=lambda document: document["_id"], reverse=order == -1)
+    return [dict(document) for document in selected[: pagination.limit]]
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN FIRST PAGE IS FETCHED ONLY A NEXT TOKEN IS ISSUED
+# -----------------------------------------------------------------------------
+def test_keyset_pagination_when_first_page_is_fetched_only_a_next_token_is_issued():
+    # Prepare
+    documents = get_documents(5)
+    pagination = KeysetPagination({}, page_size=2)
+
+    # Act
+    page = pagination.build_page(fetch(documents, pagination))
+
+    # Assert
+    assert [item["_id"] for item in page.items] == [d["_id"] for d in documents[:2]]
+    assert page.next_page_token is not None
+    assert page.previous_page_token is None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN PAGES ARE TRAVERSED FORWARD AND BACKWARD THE ORDER IS KEPT
+# -----------------------------------------------------------------------------
+def test_keyset_pagination_when_pages_are_traversed_forward_and_backward_the_order_is_kept():
+    # Prepare
+    documents = get_documents(5)
+    first = KeysetPagination({}, page_size=2)
+    first_page = first.build_page(fetch(documents, first))
+    second = KeysetPagination({}, page_size=2, token=first_page.next_page_token)
+    second_page = second.build_page(fetch(documents, second))
+    third = KeysetPagination({}, page_size=2, token=second_page.next_page_token)
+    third_page = third.build_page(fetch(documents, third))
+
+    # Act
+    back = KeysetPagination({}, page_size=2, token=third_page.previous_page_token)
+    back_page = back.build_page(fetch(documents, back))
+
+    # Assert
+    assert [item["_id"] for item in third_page.items] == [documents[4]["_id"]]
+    assert third_page.next_page_token is None
+    assert [item["_id"] for item in back_page.items] == [
+        d["_id"] for d in documents[2:4]
+    ]
+    assert back_page.next_page_token is not None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN PROJECTION EXCLUDES ID IT IS FETCHED BUT STRIPPED FROM ITEMS
+# -----------------------------------------------------------------------------
+def test_keyset_pagination_when_projection_excludes_id_it_is_fetched_but_stripped_from_items():
+    # Prepare
+    documents = get_documents(3)
+    pagination = KeysetPagination({}, page_size=2, projection={"_id": 0})
+
+    # Act
+    page = pagination.build_page(fetch(documents, pagination))
+
+    # Assert
+    assert pagination.fetch_projection is None
+    assert page.items == [{"email": "member0@mail.com"}, {"email": "member1@mail.com"}]
+    assert page.next_page_token is not None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SORT KEY IS NOT ID THE FILTER BREAKS TIES BY ID
+# -----------------------------------------------------------------------------
+def test_keyset_pagination_when_sort_key_is_not_id_the_filter_breaks_ties_by_id():
+    # Prepare
+    document = {"_id": ObjectId(), "email": "a@mail.com"}
+    token = KeysetPagination.encode_token("next", "email", document)
+
+    # Act
+    pagination = KeysetPagination({"active": True}, 10, token, sort_key="email")
+
+    # Assert
+    assert pagination.filter == {
+        "$and": [
+            {"active": True},
+            {
+                "$or": [
+                    {"email": {"$gt": "a@mail.com"}},
+                    {"email": "a@mail.com", "_id": {"$gt": document["_id"]}},
+                ]
+            },
+        ]
+    }
+    assert pagination.sort == [("email", 1), ("_id", 1)]
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN TOKEN IS INVALID AN INVALID PAGE TOKEN ERROR IS RAISED
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not-a-token",
+        KeysetPagination.encode_token(
+            "next", "email", {"_id": ObjectId(), "email": "a@mail.com"}
+        ),
+    ],
+)
+def test_keyset_pagination_when_token_is_invalid_an_invalid_page_token_error_is_raised(
+    token,
+):
+    # Assert
+    with pytest.raises(InvalidPageTokenError):
+        KeysetPagination({}, 10, token, sort_key="_id")
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN TOKEN HOLDS A QUERY OPERATOR AN INVALID PAGE TOKEN ERROR IS RAISED
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "key", [{"$ne": None}, {"$regex": ".*", "$options": ""}, [{"$gt": ""}]]
+)
+def test_keyset_pagination_when_token_holds_a_query_operator_it_is_rejected(key):
+    # Prepare
+    token = KeysetPagination.encode_token(
+        "next", "email", {"_id": ObjectId(), "email": key}
+    )
+
+    # Assert
+    with pytest.raises(InvalidPageTokenError):
+        KeysetPagination({}, page_size=2, token=token, sort_key="email")
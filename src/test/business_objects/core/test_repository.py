@@ -0,0 +1,127 @@
+from typing import Dict, List
+
+import pytest
+from fastapi import HTTPException
+from pymongo.errors import OperationFailure
+from pymongo.results import BulkWriteResult, InsertOneResult
+
+from app.business_objects.core.dao import EntityRepository
+from app.business_objects.core.schema import Schema, to_int
+from app.context import ENV_VARIABLE_NAMES, ServerContext
+
+
+# =========================================================
+# CLASS STUB COLLECTION
+# =========================================================
+class StubCollection:
+    def __init__(self):
+        self.written: List = []
+
+    def find(self, query: Dict, projection: Dict or None = None, **kwargs):
+        raise OperationFailure("operation exceeded time limit", 50)
+
+    def insert_one(self, document: Dict) -> InsertOneResult:
+        self.written.append(document)
+        return InsertOneResult(len(self.written), True)
+
+    def bulk_write(self, operations: List, ordered: bool) -> BulkWriteResult:
+        self.written.extend(operations)
+        return BulkWriteResult({"nInserted": len(operations)}, True)
+
+
+# =========================================================
+# CLASS STUB DATABASE CONTEXT
+# =========================================================
+class StubDatabaseContext(ServerContext):
+    """
+    Server context built from the environment, whose database
+    holds stub collections so no server is needed.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.collections: Dict = {}
+
+    @property
+    def database(self):
+        return self.collections
+
+
+# =========================================================
+# CLASS PORTS
+# =========================================================
+class Ports(EntityRepository):
+    def __init__(self, context: ServerContext):
+        context.collections["ports"] = StubCollection()
+        super().__init__("ports", context)
+
+    def get_index_fields(self) -> List[str]:
+        return ["id"]
+
+    def get_schema(self) -> Schema:
+        return Schema({"port": to_int})
+
+
+# -----------------------------------------------------------------------------
+# GET REPOSITORY
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def get_repository(monkeypatch):
+    for name in ENV_VARIABLE_NAMES:
+        monkeypatch.setenv(name, "1")
+    monkeypatch.setenv("LOG_LEVEL", "warning")
+    monkeypatch.setenv("MONGO_BULK_CHUNK_SIZE", "2")
+    return Ports(StubDatabaseContext(ENV_VARIABLE_NAMES))
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A VALUE CANNOT BE CONVERTED CREATE IS REJECTED WITH 422
+# -----------------------------------------------------------------------------
+def test_create_when_a_value_cannot_be_converted_it_is_rejected_with_422(
+    get_repository,
+):
+    # Prepare
+    repository = get_repository
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        repository.create({"id": "p-1", "port": "https"})
+
+    # Assert
+    assert error.value.status_code == 422
+    assert repository.entities.written == []
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A LATER DOCUMENT CANNOT BE CONVERTED NOTHING IS WRITTEN
+# -----------------------------------------------------------------------------
+def test_create_many_when_a_later_document_cannot_be_converted_nothing_is_written(
+    get_repository,
+):
+    # Prepare
+    repository = get_repository
+    documents = [{"id": f"p-{i}", "port": str(i)} for i in range(4)]
+    documents.append({"id": "p-4", "port": "https"})
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        repository.create_many(iter(documents))
+
+    # Assert
+    assert error.value.status_code == 422
+    assert repository.entities.written == []
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE LOOKUP FAILS GET BY ID ANSWERS 503
+# -----------------------------------------------------------------------------
+def test_get_by_id_when_the_lookup_fails_it_answers_503(get_repository):
+    # Prepare
+    repository = get_repository
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        repository.get_by_id("p-1")
+
+    # Assert
+    assert error.value.status_code == 503
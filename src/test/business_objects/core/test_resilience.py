@@ -0,0 +1,188 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from pymongo.errors import AutoReconnect, OperationFailure
+
+from app.business_objects.core import resilience
+from app.business_objects.core.dao import inject_mongodb_error_handling
+from app.business_objects.core.errors import CircuitOpenError
+from app.business_objects.core.resilience import (
+    CircuitBreaker,
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    RetryPolicy,
+)
+
+
+# -----------------------------------------------------------------------------
+# FUNCTION FLAKY
+# -----------------------------------------------------------------------------
+def flaky(failures: int, error: Exception = None):
+    calls = []
+
+    def operation():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error or AutoReconnect("not primary")
+        return "done"
+
+    return operation, calls
+
+
+# -----------------------------------------------------------------------------
+# FUNCTION POLICY
+# -----------------------------------------------------------------------------
+def policy(
+    attempts: int = 3, threshold: int = 5, reset_timeout: float = 30
+) -> RetryPolicy:
+    return RetryPolicy(attempts, 0.0, 0.0, 5, CircuitBreaker(threshold, reset_timeout))
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN AN IDEMPOTENT OPERATION FAILS TRANSIENTLY IT IS RETRIED
+# -----------------------------------------------------------------------------
+def test_retry_policy_when_an_idempotent_operation_fails_transiently_it_is_retried():
+    # Prepare
+    retry_policy = policy()
+    operation, calls = flaky(2)
+
+    # Act
+    result = retry_policy.call("find_one", True, operation)
+
+    # Assert
+    assert result == "done"
+    assert len(calls) == 3
+    assert retry_policy.breaker.state == CLOSED
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN AN OPERATION IS NOT IDEMPOTENT IT IS ATTEMPTED ONCE
+# -----------------------------------------------------------------------------
+def test_retry_policy_when_an_operation_is_not_idempotent_it_is_attempted_once():
+    # Prepare
+    retry_policy = policy()
+    operation, calls = flaky(1)
+
+    # Act
+    with pytest.raises(AutoReconnect):
+        retry_policy.call("bulk_write", False, operation)
+
+    # Assert
+    assert len(calls) == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE ERROR IS NOT TRANSIENT IT IS NOT RETRIED
+# -----------------------------------------------------------------------------
+def test_retry_policy_when_the_error_is_not_transient_it_is_not_retried():
+    # Prepare
+    retry_policy = policy()
+    operation, calls = flaky(1, OperationFailure("bad query", code=2))
+
+    # Act
+    with pytest.raises(OperationFailure):
+        retry_policy.call("find_one", True, operation)
+
+    # Assert
+    assert len(calls) == 1
+    assert retry_policy.breaker.statistics["consecutive_failures"] == 0
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE BACKOFF DOES NOT FIT IN THE DEADLINE RETRIES STOP
+# -----------------------------------------------------------------------------
+def test_retry_policy_when_the_backoff_does_not_fit_in_the_deadline_retries_stop():
+    # Prepare
+    retry_policy = RetryPolicy(5, 10.0, 10.0, 0.05, CircuitBreaker(0, 30))
+    retry_policy.backoff = lambda attempt: 10.0
+    operation, calls = flaky(4)
+
+    # Act
+    with pytest.raises(AutoReconnect):
+        retry_policy.call("find_one", True, operation)
+
+    # Assert
+    assert len(calls) == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN FAILURES REACH THE THRESHOLD THE CIRCUIT OPENS AND FAILS FAST
+# -----------------------------------------------------------------------------
+def test_circuit_breaker_when_failures_reach_the_threshold_the_circuit_opens_and_fails_fast():
+    # Prepare
+    retry_policy = policy(attempts=1, threshold=2)
+    operation, calls = flaky(10)
+    for _ in range(2):
+        with pytest.raises(AutoReconnect):
+            retry_policy.call("find_one", True, operation)
+
+    # Act
+    with pytest.raises(CircuitOpenError) as error:
+        retry_policy.call("find_one", True, operation)
+
+    # Assert
+    assert len(calls) == 2
+    assert retry_policy.breaker.state == OPEN
+    assert error.value.retry_after > 0
+    assert retry_policy.breaker.statistics["rejected"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE RESET TIMEOUT ELAPSES A SUCCESSFUL PROBE CLOSES THE CIRCUIT
+# -----------------------------------------------------------------------------
+def test_circuit_breaker_when_the_reset_timeout_elapses_a_successful_probe_closes_the_circuit():
+    # Prepare
+    breaker = CircuitBreaker(1, 0)
+    breaker.record_failure()
+
+    # Act
+    probe_allowed = breaker.allow()
+    state_during_probe = breaker.state
+    breaker.record_success()
+
+    # Assert
+    assert probe_allowed
+    assert state_during_probe == HALF_OPEN
+    assert breaker.state == CLOSED
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A COROUTINE FAILS TRANSIENTLY IT IS RETRIED
+# -----------------------------------------------------------------------------
+def test_retry_policy_when_a_coroutine_fails_transiently_it_is_retried():
+    # Prepare
+    retry_policy = policy()
+    operation, calls = flaky(1)
+
+    async def coroutine():
+        return operation()
+
+    # Act
+    result = asyncio.run(retry_policy.call_async("find_one", True, coroutine))
+
+    # Assert
+    assert result == "done"
+    assert len(calls) == 2
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN RETRIES ARE EXHAUSTED THE DECORATOR RAISES A 503
+# -----------------------------------------------------------------------------
+def test_error_handling_when_retries_are_exhausted_the_decorator_raises_a_503(
+    monkeypatch,
+):
+    # Prepare
+    monkeypatch.setitem(resilience._retry_policy, "instance", policy(attempts=2))
+    operation, calls = flaky(10)
+    decorated = inject_mongodb_error_handling(operation)
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        decorated()
+
+    # Assert
+    assert len(calls) == 2
+    assert error.value.status_code == 503
+    assert "Retry-After" in error.value.headers
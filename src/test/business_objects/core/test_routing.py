@@ -0,0 +1,75 @@
+import pytest
+from pymongo import MongoClient
+from pymongo.read_preferences import ReadPreference
+
+from app.business_objects.core.routing import Routing
+
+
+# -----------------------------------------------------------------------------
+# FUNCTION COLLECTION
+# -----------------------------------------------------------------------------
+def collection():
+    return MongoClient("mongodb://localhost:27017", connect=False)["test"]["members"]
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A READ PREFERENCE IS SET READS ARE ROUTED TO IT
+# -----------------------------------------------------------------------------
+def test_routing_when_a_read_preference_is_set_reads_are_routed_to_it():
+    # Prepare
+    routing = Routing(
+        read_preference="nearest", max_staleness_seconds=120, read_concern="majority"
+    )
+
+    # Act
+    routed = routing.apply(collection())
+
+    # Assert
+    assert routed.read_preference.mode == ReadPreference.NEAREST.mode
+    assert routed.read_preference.max_staleness == 120
+    assert routed.read_concern.level == "majority"
+    assert routed.write_concern.document == {}
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN NOTHING IS SET THE COLLECTION IS RETURNED AS IS
+# -----------------------------------------------------------------------------
+def test_routing_when_nothing_is_set_the_collection_is_returned_as_is():
+    # Prepare
+    members = collection()
+
+    # Act
+    routed = Routing().apply(members)
+
+    # Assert
+    assert routed is members
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A PER CALL ROUTING IS MERGED ITS FIELDS TAKE PRECEDENCE
+# -----------------------------------------------------------------------------
+def test_routing_when_a_per_call_routing_is_merged_its_fields_take_precedence():
+    # Prepare
+    repository_routing = Routing(
+        read_preference="secondaryPreferred",
+        max_staleness_seconds=90,
+        write_concern="majority",
+    )
+
+    # Act
+    merged = repository_routing.merge(Routing(read_preference="primary"))
+    routed = merged.apply(collection())
+
+    # Assert
+    assert merged == Routing(read_preference="primary", write_concern="majority")
+    assert routed.read_preference == ReadPreference.PRIMARY
+    assert routed.write_concern.document == {"w": "majority"}
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN MAX STALENESS IS SET WITH THE PRIMARY IT IS REJECTED
+# -----------------------------------------------------------------------------
+def test_routing_when_max_staleness_is_set_with_the_primary_it_is_rejected():
+    # Act
+    with pytest.raises(ValueError):
+        Routing(read_preference="primary", max_staleness_seconds=90)
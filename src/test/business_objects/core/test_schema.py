@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+
+from app.business_objects.core.errors import SchemaError
+from app.business_objects.core.schema import (
+    Schema,
+    to_datetime,
+    to_double,
+    to_epoch_datetime,
+    to_int,
+)
+
+SCHEMA = Schema(
+    {
+        "port": to_int,
+        "base_score": to_double,
+        "last_seen": to_epoch_datetime,
+        "crt_date_first_seen": to_datetime,
+        "repository.repository_id": to_int,
+    }
+)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN VALUES ARE STRINGS THEY ARE CONVERTED TO NATIVE TYPES
+# -----------------------------------------------------------------------------
+def test_converters_when_values_are_strings_they_are_converted_to_native_types():
+    # Act & Assert
+    assert to_int(" 443") == 443
+    assert to_int(80.0) == 80
+    assert to_double("7.5") == 7.5
+    assert to_epoch_datetime("1658961003") == datetime.datetime(2022, 7, 27, 22, 30, 3)
+    assert to_datetime("2022-10-07T23:30:14.000+0200") == datetime.datetime(
+        2022, 10, 7, 21, 30, 14
+    )
+    assert to_int("") is None
+    with pytest.raises(ValueError):
+        to_int("4.5")
+    with pytest.raises(TypeError):
+        to_double(True)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A DOCUMENT IS COERCED ONLY CHANGED SUB-DOCUMENTS ARE COPIED
+# -----------------------------------------------------------------------------
+def test_coerce_when_a_document_is_coerced_only_changed_sub_documents_are_copied():
+    # Prepare
+    repository = {"repository_id": "12", "name": "internal"}
+    document = {
+        "port": "443",
+        "base_score": "",
+        "crt_date_first_seen": "2022-10-07T23:30:14",
+        "repository": repository,
+        "plugin_name": "SSL Certificate Expiry",
+    }
+
+    # Act
+    coerced = SCHEMA.coerce(document)
+
+    # Assert
+    assert coerced == {
+        "port": 443,
+        "base_score": None,
+        "crt_date_first_seen": datetime.datetime(2022, 10, 7, 23, 30, 14),
+        "repository": {"repository_id": 12, "name": "internal"},
+        "plugin_name": "SSL Certificate Expiry",
+    }
+    assert document["port"] == "443"
+    assert repository["repository_id"] == "12"
+    assert SCHEMA.coerce(coerced) is coerced
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A $SET USES DOTTED PATHS THEY ARE CONVERTED
+# -----------------------------------------------------------------------------
+def test_coerce_when_a_set_uses_dotted_paths_they_are_converted():
+    # Act
+    coerced = SCHEMA.coerce({"repository.repository_id": "12"})
+
+    # Assert
+    assert coerced == {"repository.repository_id": 12}
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN VALUES CANNOT BE CONVERTED A SCHEMA ERROR LISTS THEIR FIELDS
+# -----------------------------------------------------------------------------
+def test_coerce_when_values_cannot_be_converted_a_schema_error_lists_their_fields():
+    # Act
+    with pytest.raises(SchemaError) as error:
+        SCHEMA.coerce({"port": "https", "last_seen": "yesterday", "base_score": "5"})
+
+    # Assert
+    assert error.value.fields == ["port", "last_seen"]
+
+
+# -----------------------------------------------------------------------------
+# TEST PENDING QUERY MATCHES STRING VALUES OF EVERY FIELD
+# -----------------------------------------------------------------------------
+def test_pending_query_matches_string_values_of_every_field():
+    # Act
+    query = Schema({"port": to_int, "repository.repository_id": to_int}).pending_query
+
+    # Assert
+    assert query == {
+        "$or": [
+            {"port": {"$type": "string"}},
+            {"repository.repository_id": {"$type": "string"}},
+        ]
+    }
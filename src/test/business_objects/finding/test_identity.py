@@ -0,0 +1,119 @@
+from pymongo import UpdateOne
+
+from app.business_objects.finding.identity import (
+    finding_fingerprint,
+    finding_identity,
+    merge_operation,
+)
+from app.business_objects.finding.normalization import normalize_finding
+
+RECORD: dict = {
+    "id": "FBK1111104743443TCP1600879153",
+    "plugin_id": "104743",
+    "ip": "1.1.1.1",
+    "port": "443",
+    "protocol": "TCP",
+    "severity": "medium",
+    "repository": {"name": "softlayer_fileblock_credentialed", "repository_id": "498"},
+    "last_seen": "1639451554",
+}
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN ONLY LAST SEEN CHANGES THE IDENTITY AND FINGERPRINT ARE KEPT
+# -----------------------------------------------------------------------------
+def test_finding_fingerprint_when_only_last_seen_changes_the_identity_and_fingerprint_are_kept():
+    # Prepare
+    rescanned = {**RECORD, "port": 443, "last_seen": "1669016031"}
+
+    # Act
+    identities = {finding_identity(RECORD), finding_identity(rescanned)}
+    fingerprints = {
+        finding_fingerprint(RECORD),
+        finding_fingerprint({**RECORD, "last_seen": "0"}),
+    }
+
+    # Assert
+    assert len(identities) == 1
+    assert len(fingerprints) == 1
+    assert finding_fingerprint({**RECORD, "severity": "high"}) not in fingerprints
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE REPOSITORY DIFFERS THE IDENTITY DIFFERS
+# -----------------------------------------------------------------------------
+def test_finding_identity_when_the_repository_differs_the_identity_differs():
+    # Act
+    other = {**RECORD, "repository": {"repository_id": "483"}}
+
+    # Assert
+    assert finding_identity(other) != finding_identity(RECORD)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE CONTENT CHANGED THE WHOLE FINDING IS UPSERTED
+# -----------------------------------------------------------------------------
+def test_merge_operation_when_the_content_changed_the_whole_finding_is_upserted():
+    # Prepare
+    finding = normalize_finding(RECORD)
+    stored = {"identity": finding["identity"], "fingerprint": "stale", "last_seen": "1"}
+
+    # Act
+    operation = merge_operation(finding, stored)
+
+    # Assert
+    values = {
+        key: value for key, value in finding.items() if key != "db_creation_datetime"
+    }
+    assert operation == UpdateOne(
+        {"identity": finding["identity"]},
+        {
+            "$set": values,
+            "$setOnInsert": {"db_creation_datetime": finding["db_creation_datetime"]},
+        },
+        upsert=True,
+    )
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN NOTHING MOVED FORWARD THERE IS NOTHING TO WRITE
+# -----------------------------------------------------------------------------
+def test_merge_operation_when_nothing_moved_forward_there_is_nothing_to_write():
+    # Prepare
+    finding = normalize_finding(RECORD)
+    stored = {
+        "identity": finding["identity"],
+        "fingerprint": finding["fingerprint"],
+        "last_seen": "1669016031",
+    }
+
+    # Act
+    operation = merge_operation(finding, stored)
+
+    # Assert
+    assert operation is None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE STORED LAST SEEN IS AN OLDER STRING IT MOVES FORWARD
+# -----------------------------------------------------------------------------
+def test_merge_operation_when_the_stored_last_seen_is_an_older_string_it_moves_forward():
+    # Prepare
+    finding = normalize_finding(RECORD)
+    stored = {
+        "identity": finding["identity"],
+        "fingerprint": finding["fingerprint"],
+        "last_seen": "1600879153",
+    }
+
+    # Act
+    operation = merge_operation(finding, stored)
+
+    # Assert
+    assert operation == UpdateOne(
+        {"identity": finding["identity"], "fingerprint": finding["fingerprint"]},
+        {
+            "$max": {"last_seen": finding["last_seen"]},
+            "$set": {"db_update_datetime": finding["db_update_datetime"]},
+        },
+    )
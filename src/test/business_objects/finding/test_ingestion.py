@@ -0,0 +1,171 @@
+import asyncio
+import datetime
+
+import pytest
+
+from app.business_objects.core.bulk import BulkResult
+from app.business_objects.finding.identity import IDENTITY
+from app.business_objects.finding.ingestion import FindingIngestion, IngestionWriteError
+from app.business_objects.finding.normalization import (
+    InvalidFindingError,
+    normalize_finding,
+)
+
+
+# =========================================================
+# CLASS STUB FINDINGS
+# =========================================================
+class StubFindings:
+
+    def __init__(self):
+        self.stored = {}
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_fingerprints(self, identities):
+        return {
+            identity: self.stored[identity]
+            for identity in identities
+            if identity in self.stored
+        }
+
+    async def bulk_write(self, operations, chunk_size=None) -> BulkResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.batches.append(operations)
+        result = BulkResult()
+        for operation in operations:
+            document = operation._doc.get("$set", {})
+            identity = operation._filter[IDENTITY]
+            if identity in self.stored:
+                result.matched += 1
+            else:
+                result.upserted += 1
+            self.stored.setdefault(identity, {}).update(document)
+        return result
+
+
+# -----------------------------------------------------------------------------
+# GET RECORDS
+# -----------------------------------------------------------------------------
+async def get_records(count: int, last_seen: str = "1639451554"):
+    for index in range(count):
+        record = {
+            "id": f"f-{index}",
+            "plugin_id": "104743",
+            "ip": "1.1.1.1",
+            "port": str(index),
+            "severity": "Medium",
+            "last_seen": last_seen,
+        }
+        yield index, record if index % 10 else {"id": f"f-{index}"}
+
+
+# -----------------------------------------------------------------------------
+# INGESTION
+# -----------------------------------------------------------------------------
+def ingestion(findings: StubFindings) -> FindingIngestion:
+    return FindingIngestion(findings, batch_size=10, max_in_flight=1)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A RECORD IS EXPORTED IT IS NORMALIZED
+# -----------------------------------------------------------------------------
+def test_normalize_finding_when_a_record_is_exported_it_is_normalized():
+    # Prepare
+    now = datetime.datetime(2022, 9, 11, 7, 2, 21)
+    record = {
+        "_id": "client-side",
+        "id": "FBK1",
+        "plugin_id": "104743",
+        "ip": "1.1.1.1",
+        "severity": " High",
+        "'plugin_info'": "104743 - TLS Version 1.0 Protocol Detection",
+    }
+
+    # Act
+    finding = normalize_finding(record, now)
+
+    # Assert
+    assert "_id" not in finding
+    assert finding["plugin_id"] == 104743
+    assert finding["severity"] == "high"
+    assert finding["plugin_info"] == record["'plugin_info'"]
+    assert finding["db_creation_datetime"] == now
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A REQUIRED FIELD IS MISSING THE RECORD IS INVALID
+# -----------------------------------------------------------------------------
+def test_normalize_finding_when_a_required_field_is_missing_the_record_is_invalid():
+    # Act
+    with pytest.raises(InvalidFindingError) as error:
+        normalize_finding({"id": "FBK1", "plugin_id": "", "severity": "high"})
+
+    # Assert
+    assert "plugin_id, ip" in str(error.value)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN RECORDS ARE STREAMED THEY ARE WRITTEN IN CONCURRENT BATCHES
+# -----------------------------------------------------------------------------
+def test_finding_ingestion_when_records_are_streamed_they_are_written_in_concurrent_batches():
+    # Prepare
+    findings = StubFindings()
+    ingestion = FindingIngestion(findings, batch_size=10, max_in_flight=3)
+
+    # Act
+    report = asyncio.run(ingestion.ingest(get_records(100)))
+
+    # Assert
+    assert report.dict()["received"] == 100
+    assert report.accepted == 90 and report.rejected == 10
+    assert report.errors[0]["index"] == 0
+    assert report.inserted == 90
+    assert sum(len(batch) for batch in findings.batches) == 90
+    assert max(len(batch) for batch in findings.batches) == 10
+    assert findings.max_in_flight == 3
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN FINDINGS ARE RESENT ONLY THOSE SEEN LATER ARE WRITTEN
+# -----------------------------------------------------------------------------
+def test_finding_ingestion_when_findings_are_resent_only_those_seen_later_are_written():
+    # Prepare
+    findings = StubFindings()
+    asyncio.run(ingestion(findings).ingest(get_records(20)))
+    findings.batches.clear()
+
+    # Act
+    unchanged = asyncio.run(ingestion(findings).ingest(get_records(20)))
+    seen = asyncio.run(ingestion(findings).ingest(get_records(20, "1639451600")))
+
+    # Assert
+    assert (unchanged.inserted, unchanged.updated, unchanged.unchanged) == (0, 0, 18)
+    assert (seen.inserted, seen.updated, seen.unchanged) == (0, 18, 0)
+    operations = [operation for batch in findings.batches for operation in batch]
+    assert all(set(operation._doc) == {"$max", "$set"} for operation in operations)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN STORED FINDINGS CANNOT BE READ THE INGESTION FAILS WITH A WRITE ERROR
+# -----------------------------------------------------------------------------
+def test_finding_ingestion_when_stored_findings_cannot_be_read_a_write_error_is_raised():
+    # Prepare
+    findings = StubFindings()
+
+    async def get_fingerprints(identities):
+        # What the Mongo error handling returns on failure
+        return False
+
+    findings.get_fingerprints = get_fingerprints
+
+    # Act
+    with pytest.raises(IngestionWriteError):
+        asyncio.run(ingestion(findings).ingest(get_records(20)))
+
+    # Assert
+    assert findings.batches == []
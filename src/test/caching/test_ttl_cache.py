@@ -0,0 +1,59 @@
+import time
+
+from app.caching import TTLCache
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN CACHE IS FULL THE LEAST RECENTLY USED ENTRY IS EVICTED
+# -----------------------------------------------------------------------------
+def test_ttl_cache_when_cache_is_full_the_least_recently_used_entry_is_evicted():
+    # Prepare
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.statistics["evictions"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN ENTRY EXPIRES IT IS A MISS
+# -----------------------------------------------------------------------------
+def test_ttl_cache_when_entry_expires_it_is_a_miss():
+    # Prepare
+    cache = TTLCache(max_size=2, ttl=0.01)
+    cache.set("a", 1)
+
+    # Act
+    time.sleep(0.02)
+
+    # Assert
+    assert cache.get("a") is None
+    assert cache.statistics["expirations"] == 1
+    assert cache.statistics["misses"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE LEAST RECENTLY USED ENTRY EXPIRED IT IS COUNTED AS EXPIRED
+# -----------------------------------------------------------------------------
+def test_ttl_cache_when_the_least_recently_used_entry_expired_it_is_counted_as_expired():
+    # Prepare
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1, ttl=0.01)
+    cache.set("b", 2)
+    time.sleep(0.02)
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert len(cache) == 2
+    assert cache.statistics["expirations"] == 1
+    assert cache.statistics["evictions"] == 0
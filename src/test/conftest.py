@@ -0,0 +1,30 @@
+import os
+
+# Settings of the test run. Modules of the application build
+# the server context when they are imported, so they are set
+# before any test module is collected. Variables already set
+# in the environment take precedence.
+TEST_ENVIRONMENT: dict = {
+    "MONGO_USER": "test",
+    "MONGO_PASSWORD": "test",
+    "MONGO_SERVER": "localhost",
+    "MONGO_DB": "test",
+    "MONGO_PORT": "27017",
+    "MONGO_TLS_CONNECTION": "0",
+    "MONGO_REPLICA_SET": "rs0",
+    "MONGO_CLUSTER": "0",
+    "MONGO_SRV": "0",
+    "OIDC_DISCOVERY_ENDPOINT": "http://localhost/.well-known/openid-configuration",
+    "OIDC_CLIENT_ID": "test",
+    "OIDC_CLIENT_SECRET": "test",
+    "SESSION_MIDDLEWARE_KEY": "test",
+    "API_VERSION": "v1",
+    "QUERY_LIMIT": "100",
+    "LOG_LEVEL": "INFO",
+    "JWT_SECRET_KEY": "test",
+    "JWT_SIGN_ALGORITHM": "HS256",
+    "JWT_TOKEN_DURATION_IN_MINUTES": "30",
+}
+
+for name, value in TEST_ENVIRONMENT.items():
+    os.environ.setdefault(name, value)
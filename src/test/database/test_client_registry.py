@@ -0,0 +1,81 @@
+import asyncio
+
+from app.database import MongoClientRegistry
+
+URI = "mongodb://localhost:27017/test"
+
+
+# -----------------------------------------------------------------------------
+# GET REGISTRY
+# -----------------------------------------------------------------------------
+def get_registry() -> MongoClientRegistry:
+    return MongoClientRegistry()
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SAME URI AND OPTIONS ARE REQUESTED THE CLIENT IS REUSED
+# -----------------------------------------------------------------------------
+def test_registry_when_same_uri_and_options_are_requested_the_client_is_reused():
+    # Prepare
+    registry = get_registry()
+
+    # Act
+    client_1 = registry.get_client(URI, maxPoolSize=10, connect=False)
+    client_2 = registry.get_client(URI, maxPoolSize=10, connect=False)
+
+    # Assert
+    assert client_1 is client_2
+    registry.close()
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN DIFFERENT OPTIONS ARE REQUESTED A NEW CLIENT IS CREATED
+# -----------------------------------------------------------------------------
+def test_registry_when_different_options_are_requested_a_new_client_is_created():
+    # Prepare
+    registry = get_registry()
+
+    # Act
+    client_1 = registry.get_client(URI, maxPoolSize=10, connect=False)
+    client_2 = registry.get_client(URI, maxPoolSize=20, connect=False)
+
+    # Assert
+    assert client_1 is not client_2
+    assert len(registry.statistics) == 2
+    registry.close()
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN RESET AFTER FORK THE INHERITED CLIENTS ARE FORGOTTEN
+# -----------------------------------------------------------------------------
+def test_registry_when_reset_after_fork_the_inherited_clients_are_forgotten():
+    # Prepare
+    registry = get_registry()
+    client_1 = registry.get_client(URI, connect=False)
+
+    # Act
+    registry.reset_after_fork()
+    client_2 = registry.get_client(URI, connect=False)
+
+    # Assert
+    assert client_1 is not client_2
+    assert registry.statistics[0]["connections_open"] == 0
+    client_1.close()
+    registry.close()
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN ASYNC CLIENT IS REQUESTED IT IS KEPT APART FROM THE SYNC CLIENT
+# -----------------------------------------------------------------------------
+def test_registry_when_async_client_is_requested_it_is_kept_apart_from_the_sync_client():
+    # Prepare
+    registry = get_registry()
+
+    # Act
+    client_1 = registry.get_client(URI, connect=False)
+    client_2 = registry.get_async_client(URI, connect=False)
+
+    # Assert
+    assert client_1 is not client_2
+    assert registry.get_async_client(URI, connect=False) is client_2
+    asyncio.run(registry.close_async())
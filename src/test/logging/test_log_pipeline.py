@@ -0,0 +1,55 @@
+import io
+import json
+import logging
+import queue
+
+from app.logging import LogPipeline, NonBlockingQueueHandler
+
+
+# -----------------------------------------------------------------------------
+# GET RECORD
+# -----------------------------------------------------------------------------
+def get_record(message: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, args, None)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN RECORDS ARE LOGGED THEY ARE WRITTEN AS JSON LINES
+# -----------------------------------------------------------------------------
+def test_log_pipeline_when_records_are_logged_they_are_written_as_json_lines():
+    # Prepare
+    stream = io.StringIO()
+    pipeline = LogPipeline(stream, batch_size=2)
+    pipeline.start()
+
+    # Act
+    for index in range(3):
+        pipeline.handler.handle(get_record("member %s created", index))
+    pipeline.stop()
+
+    # Assert
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == [
+        "member 0 created",
+        "member 1 created",
+        "member 2 created",
+    ]
+    assert lines[0]["logger"] == "test"
+    assert lines[0]["level"] == "INFO"
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN QUEUE IS FULL RECORDS ARE DROPPED WITHOUT BLOCKING
+# -----------------------------------------------------------------------------
+def test_non_blocking_queue_handler_when_queue_is_full_records_are_dropped():
+    # Prepare
+    handler = NonBlockingQueueHandler(queue.Queue(1))
+    record = get_record("message %s", "argument")
+
+    # Act
+    handler.handle(record)
+    handler.handle(get_record("dropped"))
+
+    # Assert
+    assert handler.dropped == 1
+    assert handler.queue.get_nowait().args == ("argument",)
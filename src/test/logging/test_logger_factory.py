@@ -0,0 +1,76 @@
+import logging
+
+import pytest
+
+from app.logging import configure_logging, get_logger
+
+
+# -----------------------------------------------------------------------------
+# FIXTURE LOGGING SETTINGS
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def logging_settings():
+    yield configure_logging
+    configure_logging(logging.WARNING)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN LOGGER IS REQUESTED TWICE THE SAME INSTANCE IS RETURNED
+# -----------------------------------------------------------------------------
+def test_get_logger_when_logger_is_requested_twice_the_same_instance_is_returned():
+    # Assert
+    assert get_logger("app.members") is get_logger("app.members")
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN LEVEL IS DISABLED NO EVENT IS BUILT
+# -----------------------------------------------------------------------------
+def test_logger_when_level_is_disabled_no_event_is_built(logging_settings):
+    # Prepare
+    logging_settings(logging.INFO)
+
+    # Act
+    debug_event = get_logger("app.members").debug("hidden %s", "argument")
+    info_event = get_logger("app.members").info("shown %s", "argument")
+
+    # Assert
+    assert debug_event is None
+    assert info_event.message == "shown argument"
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN MODULE LEVEL IS SET IT APPLIES TO ITS SUBMODULES ONLY
+# -----------------------------------------------------------------------------
+def test_logger_when_module_level_is_set_it_applies_to_its_submodules_only(
+    logging_settings,
+):
+    # Prepare
+    logging_settings(logging.INFO, module_levels={"app.security": logging.DEBUG})
+
+    # Act
+    security_event = get_logger("app.security.oidc").debug("shown")
+    members_event = get_logger("app.members").debug("hidden")
+
+    # Assert
+    assert security_event is not None
+    assert members_event is None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SAMPLE RATE IS ZERO EVENTS OF THE LEVEL ARE DROPPED
+# -----------------------------------------------------------------------------
+def test_logger_when_sample_rate_is_zero_events_of_the_level_are_dropped(
+    logging_settings,
+):
+    # Prepare
+    logging_settings(
+        logging.DEBUG, sample_rates={logging.DEBUG: 0.0, logging.INFO: 1.0}
+    )
+
+    # Act
+    debug_events = [get_logger("app.members").debug("sampled") for _ in range(10)]
+    info_event = get_logger("app.members").info("kept")
+
+    # Assert
+    assert debug_events == [None] * 10
+    assert info_event is not None
@@ -0,0 +1,63 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.metrics import MetricsRegistry
+from app.metrics.http import HTTP_REQUESTS, MetricsMiddleware
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN HISTOGRAM IS RENDERED BUCKETS ARE CUMULATIVE
+# -----------------------------------------------------------------------------
+def test_metrics_registry_when_histogram_is_rendered_buckets_are_cumulative():
+    # Prepare
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", ("route",), (0.1, 1.0))
+
+    # Act
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "/members")
+    output = registry.render()
+
+    # Assert
+    assert 'latency_seconds_bucket{route="/members",le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{route="/members",le="1.0"} 2' in output
+    assert 'latency_seconds_bucket{route="/members",le="+Inf"} 3' in output
+    assert 'latency_seconds_count{route="/members"} 3' in output
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN LABEL HAS QUOTES THEY ARE ESCAPED
+# -----------------------------------------------------------------------------
+def test_metrics_registry_when_label_has_quotes_they_are_escaped():
+    # Prepare
+    registry = MetricsRegistry()
+    registry.counter("errors_total", "Errors", ("error",)).increment('say "hi"')
+
+    # Act
+    output = registry.render()
+
+    # Assert
+    assert 'errors_total{error="say \\"hi\\""} 1' in output
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN REQUEST IS SERVED IT IS COUNTED BY ROUTE TEMPLATE
+# -----------------------------------------------------------------------------
+def test_metrics_middleware_when_request_is_served_it_is_counted_by_route_template():
+    # Prepare
+    application = FastAPI()
+    application.add_middleware(MetricsMiddleware)
+
+    @application.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(application)
+    before = HTTP_REQUESTS.value("GET", "/items/{item_id}", "200")
+
+    # Act
+    client.get("/items/1")
+    client.get("/items/2")
+
+    # Assert
+    assert HTTP_REQUESTS.value("GET", "/items/{item_id}", "200") == before + 2
@@ -0,0 +1,106 @@
+import asyncio
+import json
+
+import pytest
+
+from app.resources.ingestion import JSONRecordParser, MalformedBodyError, parse_records
+
+
+# -----------------------------------------------------------------------------
+# GET CHUNKS
+# -----------------------------------------------------------------------------
+async def get_chunks(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+# -----------------------------------------------------------------------------
+# PARSE
+# -----------------------------------------------------------------------------
+def parse(
+    body: bytes, media_type: str, size: int = 7, max_record_size: int = 1024
+) -> list:
+    async def collect():
+        return [
+            record
+            async for record in parse_records(
+                get_chunks(body, size), media_type, max_record_size
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A JSON ARRAY IS SPLIT IN SMALL CHUNKS EVERY RECORD IS PARSED
+# -----------------------------------------------------------------------------
+def test_parse_records_when_a_json_array_is_split_in_small_chunks_every_record_is_parsed():
+    # Prepare
+    documents = [
+        {"id": f"f-{index}", "port": index * 111, "name": "é"} for index in range(20)
+    ]
+    body = json.dumps(documents, indent=2).encode()
+
+    # Act
+    records = parse(body, "application/json", size=3)
+
+    # Assert
+    assert records == list(enumerate(documents))
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A NDJSON LINE IS INVALID ONLY THAT RECORD IS REJECTED
+# -----------------------------------------------------------------------------
+def test_parse_records_when_a_ndjson_line_is_invalid_only_that_record_is_rejected():
+    # Prepare
+    body = b'{"id": "a"}\n{"id": \n\n{"id": "c"}'
+
+    # Act
+    records = parse(body, "application/x-ndjson; charset=utf-8")
+
+    # Assert
+    assert [position for position, _ in records] == [0, 1, 2]
+    assert records[0][1] == {"id": "a"} and records[2][1] == {"id": "c"}
+    assert isinstance(records[1][1], ValueError)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A NDJSON LINE IS TOO LARGE IT IS SKIPPED WITHOUT BUFFERING IT
+# -----------------------------------------------------------------------------
+def test_parse_records_when_a_ndjson_line_is_too_large_it_is_skipped_without_buffering_it():
+    # Prepare
+    body = b'{"id": "a"}\n{"id": "' + b"x" * 100 + b'"}\n{"id": "c"}\n'
+
+    # Act
+    records = parse(body, "application/x-ndjson", max_record_size=32)
+
+    # Assert
+    assert isinstance(records[1][1], ValueError)
+    assert records[2] == (2, {"id": "c"})
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE ARRAY IS MALFORMED THE RECORDS BEFORE THE ERROR ARE PARSED
+# -----------------------------------------------------------------------------
+def test_json_record_parser_when_the_array_is_malformed_the_records_before_the_error_are_parsed():
+    # Prepare
+    parser = JSONRecordParser(1024)
+
+    # Act
+    records = parser.feed('[{"id": "a"}, {"id": "b"} {"id": "c"}]'[:26])
+
+    # Assert
+    assert records == [(0, {"id": "a"}), (1, {"id": "b"})]
+    with pytest.raises(MalformedBodyError):
+        parser.feed(' {"id": "c"}]', final=True)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE BODY IS A SINGLE OBJECT IT IS ONE RECORD
+# -----------------------------------------------------------------------------
+def test_parse_records_when_the_body_is_a_single_object_it_is_one_record():
+    # Act
+    records = parse(b'{\n  "id": "a",\n  "port": 443\n}\n', "application/json")
+
+    # Assert
+    assert records == [(0, {"id": "a", "port": 443})]
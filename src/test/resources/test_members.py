@@ -0,0 +1,86 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.business_objects.core.bulk import BulkResult
+from app.business_objects.core.pagination import Page
+from app.business_objects.member import inject_async_members
+from app.resources.members.endpoints import router
+
+
+# =========================================================
+# CLASS STUB MEMBERS
+# =========================================================
+class StubMembers:
+
+    def __init__(self, result):
+        self.result = result
+        self.routing = None
+
+    async def create_many(self, documents):
+        return self.result
+
+    async def paginate(
+        self, query, page_size, token=None, projection=None, routing=None
+    ):
+        self.routing = routing
+        return self.result
+
+
+# -----------------------------------------------------------------------------
+# GET CLIENT
+# -----------------------------------------------------------------------------
+def get_client(members: StubMembers) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[inject_async_members] = lambda: members
+    return TestClient(app)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SOME MEMBERS FAIL THEY ARE REPORTED WITHOUT AN ID
+# -----------------------------------------------------------------------------
+def test_create_members_when_some_members_fail_they_are_reported_without_an_id():
+    # Prepare
+    result = BulkResult()
+    result.inserted = 1
+    result.errors.append({"index": 1, "code": 11000, "message": "E11000 duplicate key"})
+
+    # Act
+    client = get_client(StubMembers(result))
+    response = client.post("/members:batch", json=[{"name": "a"}, {"name": "b"}])
+
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ids"][0] is not None
+    assert body["ids"][1] is None
+    assert body["errors"][0]["index"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE BULK WRITE FAILS A SERVER ERROR IS ANSWERED
+# -----------------------------------------------------------------------------
+def test_create_members_when_the_bulk_write_fails_a_server_error_is_answered():
+    # Act
+    response = get_client(StubMembers(False)).post(
+        "/members:batch", json=[{"name": "a"}]
+    )
+
+    # Assert
+    assert response.status_code == 500
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN MEMBERS ARE LISTED THE SECONDARIES ARE PREFERRED
+# -----------------------------------------------------------------------------
+def test_list_members_when_members_are_listed_the_secondaries_are_preferred():
+    # Prepare
+    members = StubMembers(Page([{"id": "1"}], None, None))
+
+    # Act
+    response = get_client(members).get("/members")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": "1"}]
+    assert members.routing.read_preference == "secondaryPreferred"
@@ -0,0 +1,103 @@
+from typing import Dict, List, Optional
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Extra
+
+from app.resources.members import Member, MemberPage
+from app.resources.projection import projection_for, response_projection
+
+
+# =========================================================
+# CLASS COMPLIANCE OUTPUT
+# =========================================================
+class ComplianceOutput(BaseModel):
+
+    compliance_result: str = None
+
+
+# =========================================================
+# CLASS FINDING SUMMARY
+# =========================================================
+class FindingSummary(BaseModel):
+
+    plugin_id: str = None
+
+    severity: str = None
+
+    plugin_output: Optional[ComplianceOutput] = None
+
+    tags: Dict[str, ComplianceOutput] = None
+
+
+# =========================================================
+# CLASS OPEN DOCUMENT
+# =========================================================
+class OpenDocument(BaseModel):
+
+    name: str = None
+
+    class Config:
+        extra = Extra.allow
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE MODEL HAS SUB DOCUMENTS THEY ARE PROJECTED WITH DOTTED PATHS
+# -----------------------------------------------------------------------------
+def test_projection_for_when_the_model_has_sub_documents_they_are_projected_with_dotted_paths():
+    # Act
+    projection = projection_for(FindingSummary)
+
+    # Assert
+    assert dict(projection) == {
+        "plugin_id": 1,
+        "severity": 1,
+        "plugin_output.compliance_result": 1,
+        "tags": 1,
+        "_id": 0,
+    }
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE RESPONSE IS A PAGE OR A LIST THE ITEM MODEL IS PROJECTED
+# -----------------------------------------------------------------------------
+def test_projection_for_when_the_response_is_a_page_or_a_list_the_item_model_is_projected():
+    # Act
+    page_projection = projection_for(MemberPage)
+    list_projection = projection_for(List[Member])
+
+    # Assert
+    assert page_projection == list_projection == projection_for(Member)
+    assert "next_page_token" not in page_projection
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN THE MODEL ALLOWS EXTRA FIELDS WHOLE DOCUMENTS ARE FETCHED
+# -----------------------------------------------------------------------------
+def test_projection_for_when_the_model_allows_extra_fields_whole_documents_are_fetched():
+    # Act
+    projection = projection_for(OpenDocument)
+
+    # Assert
+    assert projection is None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN USED AS A DEPENDENCY THE ENDPOINT RESPONSE MODEL IS PROJECTED
+# -----------------------------------------------------------------------------
+def test_response_projection_when_used_as_a_dependency_the_endpoint_response_model_is_projected():
+    # Prepare
+    app = FastAPI()
+
+    @app.get("/findings", response_model=List[FindingSummary])
+    def list_findings(projection=Depends(response_projection)):
+        return [{"plugin_id": str(sorted(projection))}]
+
+    # Act
+    response = TestClient(app).get("/findings")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()[0]["plugin_id"] == str(
+        sorted(projection_for(FindingSummary))
+    )
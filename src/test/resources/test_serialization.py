@@ -0,0 +1,61 @@
+import datetime
+import json
+from decimal import Decimal
+
+from bson import Decimal128, ObjectId
+
+from app.resources import serialization
+from app.resources.serialization import dumps, TrustedJSONResponse
+
+DOCUMENT: dict = {
+    "_id": ObjectId("5f9b3b3b9d3b3b3b3b3b3b3b"),
+    "created": datetime.datetime(2022, 9, 11, 7, 2, 21),
+    "score": Decimal128(Decimal("7.5")),
+    "plugin_output": {"compliance_result": "FAILED"},
+}
+EXPECTED: dict = {
+    "_id": "5f9b3b3b9d3b3b3b3b3b3b3b",
+    "created": "2022-09-11T07:02:21",
+    "score": "7.5",
+    "plugin_output": {"compliance_result": "FAILED"},
+}
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A DOCUMENT HAS BSON TYPES THEY ARE ENCODED WITH THE CODEC
+# -----------------------------------------------------------------------------
+def test_dumps_when_a_document_has_bson_types_they_are_encoded_with_the_codec():
+    # Act
+    encoded = dumps(DOCUMENT)
+
+    # Assert
+    assert json.loads(encoded) == EXPECTED
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN ORJSON IS MISSING THE JSON MODULE PRODUCES THE SAME OUTPUT
+# -----------------------------------------------------------------------------
+def test_dumps_when_orjson_is_missing_the_json_module_produces_the_same_output(
+    monkeypatch,
+):
+    # Prepare
+    expected = dumps(DOCUMENT)
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    # Act
+    encoded = dumps(DOCUMENT)
+
+    # Assert
+    assert encoded == expected
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN RENDERED THE CONTENT IS ENCODED AS IT IS
+# -----------------------------------------------------------------------------
+def test_trusted_json_response_when_rendered_the_content_is_encoded_as_it_is():
+    # Act
+    response = TrustedJSONResponse({"items": [DOCUMENT], "next_page_token": None})
+
+    # Assert
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {"items": [EXPECTED], "next_page_token": None}
@@ -0,0 +1,71 @@
+import asyncio
+import datetime
+import json
+
+from bson import ObjectId
+
+from app.resources import streaming
+from app.resources.streaming import encode_json_array
+
+
+# -----------------------------------------------------------------------------
+# GET DOCUMENTS
+# -----------------------------------------------------------------------------
+async def get_documents(count: int):
+    for index in range(count):
+        yield {
+            "_id": ObjectId(),
+            "index": index,
+            "created": datetime.datetime(2022, 9, 11, 7, 2, 21),
+        }
+
+
+# -----------------------------------------------------------------------------
+# ENCODE
+# -----------------------------------------------------------------------------
+def encode(count: int) -> list:
+    async def collect():
+        return [chunk async for chunk in encode_json_array(get_documents(count))]
+
+    return asyncio.run(collect())
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN NO DOCUMENTS ARE STREAMED AN EMPTY ARRAY IS ENCODED
+# -----------------------------------------------------------------------------
+def test_encode_json_array_when_no_documents_are_streamed_an_empty_array_is_encoded():
+    # Act
+    chunks = encode(0)
+
+    # Assert
+    assert b"".join(chunks) == b"[]"
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN BSON TYPES ARE STREAMED THEY ARE ENCODED AS STRINGS
+# -----------------------------------------------------------------------------
+def test_encode_json_array_when_bson_types_are_streamed_they_are_encoded_as_strings():
+    # Act
+    documents = json.loads(b"".join(encode(2)))
+
+    # Assert
+    assert [document["index"] for document in documents] == [0, 1]
+    assert documents[0]["created"] == "2022-09-11T07:02:21"
+    assert isinstance(documents[0]["_id"], str)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN OUTPUT EXCEEDS CHUNK SIZE IT IS SPLIT IN SEVERAL CHUNKS
+# -----------------------------------------------------------------------------
+def test_encode_json_array_when_output_exceeds_chunk_size_it_is_split_in_several_chunks(
+    monkeypatch,
+):
+    # Prepare
+    monkeypatch.setattr(streaming, "CHUNK_SIZE", 128)
+
+    # Act
+    chunks = encode(10)
+
+    # Assert
+    assert len(chunks) > 1
+    assert len(json.loads(b"".join(chunks))) == 10
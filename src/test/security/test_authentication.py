@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+import nacl.pwhash.argon2id
+import pytest
+from fastapi import HTTPException
+
+from app.context import get_context
+from app.security.authentication import (
+    InternalTokenExpirationProvider,
+    UserAuthentication,
+)
+from app.security.cryptography import Password
+from app.security.hashing import get_password_hashing_pool
+
+
+# =============================================================================
+# STUB USERS
+# =============================================================================
+class StubUsers:
+    def __init__(self, phash: str):
+        self.user = {"_id": "1", "uid": "user-1", "phash": phash, "salt": "my_salt"}
+        self.threads = []
+
+    def get_by_username(self, username: str) -> dict:
+        self.threads.append(threading.current_thread())
+        return dict(self.user)
+
+    def update_many(self, filter_query: dict, new_values: dict) -> bool:
+        self.threads.append(threading.current_thread())
+        self.user.update(new_values)
+        return True
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN HASH IS UPGRADED ON LOGIN THE DATABASE IS NOT USED ON THE EVENT LOOP
+# -----------------------------------------------------------------------------
+def test_user_authentication_when_hash_is_upgraded_the_database_is_not_used_on_the_loop():
+    # Prepare
+    outdated_hash = nacl.pwhash.argon2id.str(
+        b"super_secretmy_salt",
+        opslimit=nacl.pwhash.argon2id.OPSLIMIT_MIN,
+        memlimit=nacl.pwhash.argon2id.MEMLIMIT_MIN,
+    ).decode()
+    users = StubUsers(outdated_hash)
+    authentication = UserAuthentication(
+        "user-1",
+        "super_secret",
+        users=users,
+        token_expiration_provider=InternalTokenExpirationProvider(),
+        context=get_context(),
+    )
+
+    # Act
+    valid = asyncio.run(authentication.verify())
+
+    # Assert
+    assert valid
+    assert len(users.threads) == 2
+    assert threading.main_thread() not in users.threads
+    assert users.user["phash"] != outdated_hash
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A TOKEN IS REQUESTED SYNCHRONOUSLY THE PASSWORD IS VERIFIED ON THE POOL
+# -----------------------------------------------------------------------------
+def test_user_authentication_when_a_token_is_requested_synchronously_the_pool_verifies():
+    # Prepare
+    users = StubUsers(
+        Password(plain_text_password="super_secret", salt="my_salt").password_hash
+    )
+    authentication = UserAuthentication(
+        "user-1",
+        "wrong_secret",
+        users=users,
+        token_expiration_provider=InternalTokenExpirationProvider(),
+        context=get_context(),
+    )
+    completed = get_password_hashing_pool().statistics["completed"]
+
+    # Act
+    with pytest.raises(HTTPException) as error:
+        authentication.jwt_access_token
+
+    # Assert
+    assert error.value.status_code == 401
+    assert get_password_hashing_pool().statistics["completed"] == completed + 1
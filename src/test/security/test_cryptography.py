@@ -7,20 +7,14 @@ import pytest
 # GET VALID PASSWORD
 # -----------------------------------------------------------------------------
 def get_valid_password() -> Password:
-    return Password(
-        plain_text_password='super_secret',
-        salt='my_salt'
-    )
+    return Password(plain_text_password="super_secret", salt="my_salt")
 
 
 # -----------------------------------------------------------------------------
 # GET VALID IDENTITY CREDENTIAL
 # -----------------------------------------------------------------------------
 def get_valid_identity_credential() -> IdentityCredential:
-    return Password(
-        plain_text_password='super_secret',
-        salt='my_salt'
-    )
+    return Password(plain_text_password="super_secret", salt="my_salt")
 
 
 # -----------------------------------------------------------------------------
@@ -28,7 +22,7 @@ def get_valid_identity_credential() -> IdentityCredential:
 # -----------------------------------------------------------------------------
 def test_password_when_valid_salt_is_provided_it_is_consistent_after_initialization():
     # Prepare
-    expected = 'my_salt'
+    expected = "my_salt"
 
     # Act
     actual = get_valid_password().salt
@@ -43,15 +37,12 @@ def test_password_when_valid_salt_is_provided_it_is_consistent_after_initializat
 def test_password_when_none_salt_is_provided_raises_a_value_error():
 
     # Prepare
-    expected_error_format = 'Invalid salt provided'
+    expected_error_format = "Invalid salt provided"
     salt = None
 
     # Assert
     with pytest.raises(ValueError, match=expected_error_format):
-        Password(
-            plain_text_password='my_password',
-            salt=salt
-        )
+        Password(plain_text_password="my_password", salt=salt)
 
 
 # -----------------------------------------------------------------------------
@@ -60,16 +51,13 @@ def test_password_when_none_salt_is_provided_raises_a_value_error():
 def test_password_when_empty_salt_is_provided_raises_a_value_error():
 
     # Prepare
-    expected_error_format = 'Invalid salt provided'
-    salt = ''
+    expected_error_format = "Invalid salt provided"
+    salt = ""
 
     # Assert
     # NOTE: This is not a real password hash... will not compromise any account. Only test data
     with pytest.raises(ValueError, match=expected_error_format):
-        Password(
-            plain_text_password='my_password',
-            salt=salt
-        )
+        Password(plain_text_password="my_password", salt=salt)
 
 
 # -----------------------------------------------------------------------------
@@ -78,14 +66,11 @@ def test_password_when_empty_salt_is_provided_raises_a_value_error():
 def test_password_when_none_password_is_provided_raises_a_value_error():
 
     # Prepare
-    expected_error_format = 'Invalid password provided'
+    expected_error_format = "Invalid password provided"
 
     # Assert
     with pytest.raises(ValueError, match=expected_error_format):
-        Password(
-            plain_text_password=None,
-            salt='my_salt'
-        )
+        Password(plain_text_password=None, salt="my_salt")
 
 
 # -----------------------------------------------------------------------------
@@ -94,14 +79,11 @@ def test_password_when_none_password_is_provided_raises_a_value_error():
 def test_password_when_empty_password_is_provided_raises_a_value_error():
 
     # Prepare
-    expected_error_format = 'Invalid password provided'
+    expected_error_format = "Invalid password provided"
 
     # Assert
     with pytest.raises(ValueError, match=expected_error_format):
-        Password(
-            plain_text_password='',
-            salt='my_salt'
-        )
+        Password(plain_text_password="", salt="my_salt")
 
 
 # -----------------------------------------------------------------------------
@@ -124,7 +106,7 @@ def test_password_when_given_same_password_and_same_salt_password_verifies_corre
 
     # Prepare
     # NOTE: This is not a real password hash... will not compromise any account. Only test data
-    password_hash = '$argon2id$v=19$m=65536,t=2,p=1$xZ/2WMequJtBMqRjp7F1Yg$NPENoE37OIcz6YD6Rk7rJSXxnWE6rOBaBkzk4m8OO8w'
+    password_hash = "$argon2id$v=19$m=65536,t=2,p=1$xZ/2WMequJtBMqRjp7F1Yg$NPENoE37OIcz6YD6Rk7rJSXxnWE6rOBaBkzk4m8OO8w"
     password = get_valid_password()
     # Act
     actual = password.verify(stored_hash=password_hash)
@@ -139,7 +121,7 @@ def test_password_when_given_same_password_and_same_salt_password_verifies_corre
 def test_password_when_no_stored_hash_is_provided_argument_error_is_raised():
 
     # Prepare
-    expected_error_format = 'stored_hash is required'
+    expected_error_format = "stored_hash is required"
     password = get_valid_password()
     # Assert
     with pytest.raises(ValueError, match=expected_error_format):
@@ -152,11 +134,11 @@ def test_password_when_no_stored_hash_is_provided_argument_error_is_raised():
 def test_password_when_empty_stored_hash_is_provided_argument_error_is_raised():
 
     # Prepare
-    expected_error_format = 'stored_hash cannot be an empty string'
+    expected_error_format = "stored_hash cannot be an empty string"
     password = get_valid_password()
     # Assert
     with pytest.raises(ValueError, match=expected_error_format):
-        password.verify(stored_hash='')
+        password.verify(stored_hash="")
 
 
 # -----------------------------------------------------------------------------
@@ -166,10 +148,28 @@ def test_identity_credential_when_given_same_password_and_same_salt_password_ver
 
     # Prepare
     # NOTE: This is not a real password hash... will not compromise any account. Only test data
-    password_hash = '$argon2id$v=19$m=65536,t=2,p=1$xZ/2WMequJtBMqRjp7F1Yg$NPENoE37OIcz6YD6Rk7rJSXxnWE6rOBaBkzk4m8OO8w'
+    password_hash = "$argon2id$v=19$m=65536,t=2,p=1$xZ/2WMequJtBMqRjp7F1Yg$NPENoE37OIcz6YD6Rk7rJSXxnWE6rOBaBkzk4m8OO8w"
     password: IdentityCredential = get_valid_identity_credential()
     # Act
     actual = password.verify(stored_hash=password_hash)
 
     # Assert
-    assert actual
\ No newline at end of file
+    assert actual
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN STORED HASH USES ANOTHER PROFILE IT NEEDS REHASH
+# -----------------------------------------------------------------------------
+def test_password_when_stored_hash_uses_another_profile_it_needs_rehash():
+    # Prepare
+    stored_hash = get_valid_password().password_hash
+
+    # Act
+    same_profile = get_valid_password().needs_rehash(stored_hash)
+    other_profile = Password(
+        plain_text_password="super_secret", salt="my_salt", profile="moderate"
+    ).needs_rehash(stored_hash)
+
+    # Assert
+    assert not same_profile
+    assert other_profile
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+
+import nacl.pwhash.argon2id
+import pytest
+
+from app.security.cryptography import Password
+from app.security.hashing import (
+    HashingPoolSaturatedError,
+    PasswordHashingPool,
+    verify_and_rehash_password,
+)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN PASSWORD IS VERIFIED ON THE POOL THE RESULT IS RETURNED
+# -----------------------------------------------------------------------------
+def test_password_hashing_pool_when_password_is_verified_on_the_pool_the_result_is_returned():
+    # Prepare
+    pool = PasswordHashingPool(workers=1, queue_size=2)
+    stored_hash = Password(
+        plain_text_password="super_secret", salt="my_salt"
+    ).password_hash
+
+    # Act
+    valid = asyncio.run(pool.verify("super_secret", "my_salt", stored_hash))
+    invalid = asyncio.run(pool.verify("wrong_secret", "my_salt", stored_hash))
+    pool.shutdown()
+
+    # Assert
+    assert valid is True
+    assert invalid is False
+    assert pool.statistics["completed"] == 2
+    assert pool.statistics["pending"] == 0
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN A SYNCHRONOUS CALLER VERIFIES IT WAITS FOR THE POOL
+# -----------------------------------------------------------------------------
+def test_password_hashing_pool_when_a_synchronous_caller_verifies_it_waits_for_the_pool():
+    # Prepare
+    pool = PasswordHashingPool(workers=1, queue_size=1)
+    stored_hash = Password(
+        plain_text_password="super_secret", salt="my_salt"
+    ).password_hash
+
+    # Act
+    valid, new_hash = pool.call(
+        verify_and_rehash_password,
+        "super_secret",
+        "my_salt",
+        stored_hash,
+        "interactive",
+    )
+    pool.shutdown()
+
+    # Assert
+    assert valid is True
+    assert new_hash is None
+    assert pool.statistics["completed"] == 1
+    assert pool.statistics["pending"] == 0
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN QUEUE IS FULL JOBS ARE REJECTED
+# -----------------------------------------------------------------------------
+def test_password_hashing_pool_when_queue_is_full_jobs_are_rejected():
+    # Prepare
+    pool = PasswordHashingPool(workers=1, queue_size=1)
+    release = threading.Event()
+
+    async def saturate():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(HashingPoolSaturatedError):
+                await pool.run(release.wait)
+        finally:
+            release.set()
+            await blocked
+
+    # Act
+    asyncio.run(saturate())
+    pool.shutdown()
+
+    # Assert
+    assert pool.statistics["rejected"] == 1
+    assert pool.statistics["completed"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN STORED HASH IS OUTDATED A NEW HASH IS RETURNED
+# -----------------------------------------------------------------------------
+def test_verify_and_rehash_password_when_stored_hash_is_outdated_a_new_hash_is_returned():
+    # Prepare
+    stored_hash = nacl.pwhash.argon2id.str(
+        b"super_secretmy_salt",
+        opslimit=nacl.pwhash.argon2id.OPSLIMIT_MIN,
+        memlimit=nacl.pwhash.argon2id.MEMLIMIT_MIN,
+    ).decode()
+
+    # Act
+    valid, new_hash = verify_and_rehash_password(
+        "super_secret", "my_salt", stored_hash, "interactive"
+    )
+
+    # Assert
+    assert valid
+    assert new_hash is not None
+    assert verify_and_rehash_password(
+        "super_secret", "my_salt", new_hash, "interactive"
+    ) == (True, None)
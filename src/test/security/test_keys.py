@@ -0,0 +1,87 @@
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from jose import JWTError
+
+from app.security.keys import KeyRing, SigningKey
+
+
+# -----------------------------------------------------------------------------
+# GET EC KEY PAIR
+# -----------------------------------------------------------------------------
+def get_ec_key_pair() -> tuple:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN KEY IS ROTATED TOKENS OF THE PREVIOUS KEY ARE STILL VALID
+# -----------------------------------------------------------------------------
+def test_key_ring_when_key_is_rotated_tokens_of_the_previous_key_are_still_valid():
+    # Prepare
+    old_private, old_public = get_ec_key_pair()
+    new_private, _ = get_ec_key_pair()
+    old_ring = KeyRing(
+        [SigningKey.from_pem("2025", "ES256", old_private, True)], "2025"
+    )
+    token = old_ring.sign({"sub": "user-1"})
+
+    # Act
+    new_ring = KeyRing(
+        [
+            SigningKey.from_pem("2025", "ES256", old_public, False),
+            SigningKey.from_pem("2026", "ES256", new_private, True),
+        ],
+        "2026",
+    )
+
+    # Assert
+    assert new_ring.decode(token) == {"sub": "user-1"}
+    assert new_ring.decode(new_ring.sign({"sub": "user-2"})) == {"sub": "user-2"}
+    assert [key["kid"] for key in new_ring.jwks["keys"]] == ["2025", "2026"]
+    assert all("d" not in key for key in new_ring.jwks["keys"])
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN TOKEN KEY IS UNKNOWN IT IS REJECTED
+# -----------------------------------------------------------------------------
+def test_key_ring_when_token_key_is_unknown_it_is_rejected():
+    # Prepare
+    private_pem, _ = get_ec_key_pair()
+    other_pem, _ = get_ec_key_pair()
+    token = KeyRing(
+        [SigningKey.from_pem("other", "ES256", other_pem, True)], "other"
+    ).sign({"sub": "user-1"})
+    ring = KeyRing([SigningKey.from_pem("2026", "ES256", private_pem, True)], "2026")
+
+    # Assert
+    with pytest.raises(JWTError):
+        ring.decode(token)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SHARED SECRET IS USED NO KEY IS PUBLISHED
+# -----------------------------------------------------------------------------
+def test_key_ring_when_shared_secret_is_used_no_key_is_published():
+    # Prepare
+    ring = KeyRing([SigningKey.from_secret("secret", "HS256")], None)
+
+    # Act
+    claims = ring.decode(ring.sign({"sub": "user-1"}))
+
+    # Assert
+    assert claims == {"sub": "user-1"}
+    assert ring.jwks == {"keys": []}
@@ -0,0 +1,133 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from app.security.oidc import ProviderMetadataCache, parse_cache_lifetime
+
+
+# -----------------------------------------------------------------------------
+# CLASS STUB DISCOVERY HANDLER
+# -----------------------------------------------------------------------------
+class StubDiscoveryHandler(BaseHTTPRequestHandler):
+    paths: list = []
+
+    def do_GET(self):
+        StubDiscoveryHandler.paths.append(self.path)
+        host = f"http://127.0.0.1:{self.server.server_port}"
+        documents = {
+            "/.well-known/openid-configuration": {
+                "issuer": host,
+                "authorization_endpoint": f"{host}/authorize",
+                "jwks_uri": f"{host}/jwks",
+            },
+            "/jwks": {"keys": [{"kty": "RSA", "kid": "1", "n": "AQAB", "e": "AQAB"}]},
+        }
+        body = json.dumps(documents[self.path]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Cache-Control", "public, max-age=120")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+# -----------------------------------------------------------------------------
+# FIXTURE DISCOVERY SERVER
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def discovery_server():
+    StubDiscoveryHandler.paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubDiscoveryHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+# -----------------------------------------------------------------------------
+# GET DISCOVERY URL
+# -----------------------------------------------------------------------------
+def get_discovery_url(server) -> str:
+    return f"http://127.0.0.1:{server.server_port}/.well-known/openid-configuration"
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN METADATA IS READ MANY TIMES THE PROVIDER IS CALLED ONCE
+# -----------------------------------------------------------------------------
+def test_provider_metadata_cache_when_metadata_is_read_many_times_the_provider_is_called_once(
+    discovery_server,
+):
+    # Prepare
+    cache = ProviderMetadataCache(get_discovery_url(discovery_server), 3600, 1)
+
+    # Act
+    results = [cache.get() for _ in range(5)]
+
+    # Assert
+    assert results[0]["jwks"]["keys"][0]["kid"] == "1"
+    assert all(result is results[0] for result in results)
+    assert StubDiscoveryHandler.paths == ["/.well-known/openid-configuration", "/jwks"]
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN PROVIDER IS DOWN THE LAST GOOD COPY IS SERVED
+# -----------------------------------------------------------------------------
+def test_provider_metadata_cache_when_provider_is_down_the_last_good_copy_is_served(
+    discovery_server,
+):
+    # Prepare
+    cache = ProviderMetadataCache(get_discovery_url(discovery_server), 3600, 1)
+    metadata = cache.get()
+    discovery_server.shutdown()
+    discovery_server.server_close()
+
+    # Act
+    refreshed = cache.refresh()
+
+    # Assert
+    assert refreshed is metadata
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN PROVIDER IS DOWN ON FIRST LOAD AN ERROR IS RAISED
+# -----------------------------------------------------------------------------
+def test_provider_metadata_cache_when_provider_is_down_on_first_load_an_error_is_raised(
+    discovery_server,
+):
+    # Prepare
+    url = get_discovery_url(discovery_server)
+    discovery_server.shutdown()
+    discovery_server.server_close()
+
+    # Assert
+    with pytest.raises(requests.RequestException):
+        ProviderMetadataCache(url, 3600, 1).get()
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN CACHE HEADERS ARE SENT THEIR LIFETIME IS USED
+# -----------------------------------------------------------------------------
+def test_parse_cache_lifetime_when_cache_headers_are_sent_their_lifetime_is_used():
+    # Assert
+    assert (
+        parse_cache_lifetime({"Cache-Control": "public, max-age=300", "Age": "100"})
+        == 200
+    )
+    assert parse_cache_lifetime({"Cache-Control": "no-store"}) == 0
+    assert (
+        parse_cache_lifetime(
+            {
+                "Expires": "Wed, 21 Oct 2026 07:28:00 GMT",
+                "Date": "Wed, 21 Oct 2026 07:18:00 GMT",
+            }
+        )
+        == 600
+    )
+    assert parse_cache_lifetime({}) is None
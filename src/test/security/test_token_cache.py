@@ -0,0 +1,84 @@
+import time
+
+from jose import jwt
+
+from app.business_objects.user import UserSession
+from app.security.token_cache import VerifiedTokenCache
+
+
+# -----------------------------------------------------------------------------
+# GET TOKEN
+# -----------------------------------------------------------------------------
+def get_token(subject: str) -> tuple:
+    claims = {"sub": subject, "claims": ["authenticate"], "exp": int(time.time()) + 60}
+    return jwt.encode(claims, "secret", algorithm="HS256"), UserSession(**claims)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN TOKEN WAS VERIFIED ITS SESSION IS CACHED
+# -----------------------------------------------------------------------------
+def test_verified_token_cache_when_token_was_verified_its_session_is_cached():
+    # Prepare
+    cache = VerifiedTokenCache(max_size=10)
+    token, session = get_token("user-1")
+
+    # Act
+    cache.put(token, session)
+
+    # Assert
+    assert cache.get(token) == session
+    assert cache.statistics["hits"] == 1
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN TOKEN IS REVOKED IT IS NOT SERVED NOR ADMITTED AGAIN
+# -----------------------------------------------------------------------------
+def test_verified_token_cache_when_token_is_revoked_it_is_not_served():
+    # Prepare
+    cache = VerifiedTokenCache(max_size=10)
+    token, session = get_token("user-1")
+    cache.put(token, session)
+
+    # Act
+    cache.revoke(token)
+
+    # Assert
+    assert cache.get(token) is None
+    assert cache.is_revoked(token)
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SUBJECT IS EVICTED ONLY ITS SESSIONS ARE DROPPED
+# -----------------------------------------------------------------------------
+def test_verified_token_cache_when_subject_is_evicted_only_its_sessions_are_dropped():
+    # Prepare
+    cache = VerifiedTokenCache(max_size=10)
+    first_token, first_session = get_token("user-1")
+    second_token, second_session = get_token("user-2")
+    cache.put(first_token, first_session)
+    cache.put(second_token, second_session)
+
+    # Act
+    evicted = cache.evict_subject("user-1")
+
+    # Assert
+    assert evicted == 1
+    assert cache.get(first_token) is None
+    assert cache.get(second_token) == second_session
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN MORE TOKENS ARE REVOKED THAN CACHED THEY ALL STAY REVOKED
+# -----------------------------------------------------------------------------
+def test_verified_token_cache_when_more_tokens_are_revoked_than_cached_they_stay_revoked():
+    # Prepare
+    cache = VerifiedTokenCache(max_size=0)
+    tokens = [get_token(f"user-{index}")[0] for index in range(3)]
+
+    # Act
+    for token in tokens:
+        cache.revoke(token)
+
+    # Assert
+    assert all(cache.is_revoked(token) for token in tokens)
+    assert cache.statistics["revoked"] == 3
@@ -0,0 +1,139 @@
+import dataclasses
+import logging
+import signal
+
+import pytest
+
+import app.context
+from app.business_objects.core import resilience
+from app.context import (
+    ENV_VARIABLE_NAMES,
+    ServerContext,
+    reload_context,
+    reload_on_signal,
+)
+from app.logging import configure_logging
+
+
+# -----------------------------------------------------------------------------
+# GET CONTEXT WITH ENVIRONMENT
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def environment(monkeypatch):
+    for name in ENV_VARIABLE_NAMES:
+        monkeypatch.setenv(name, "1")
+    monkeypatch.setenv("QUERY_LIMIT", "50")
+    monkeypatch.setenv("LOG_LEVEL", "warning")
+    return monkeypatch
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN CONTEXT IS BUILT SETTINGS ARE PARSED INTO TYPED VALUES
+# -----------------------------------------------------------------------------
+def test_context_when_built_settings_are_parsed_into_typed_values(environment):
+    # Act
+    context = ServerContext(ENV_VARIABLE_NAMES)
+
+    # Assert
+    assert context.query_limit == 50
+    assert context.log_level == 30
+    assert context.mongo_pool_options["maxPoolSize"] == 100
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SETTINGS ARE MODIFIED A FROZEN INSTANCE ERROR IS RAISED
+# -----------------------------------------------------------------------------
+def test_context_when_settings_are_modified_a_frozen_instance_error_is_raised(
+    environment,
+):
+    # Prepare
+    context = ServerContext(ENV_VARIABLE_NAMES)
+
+    # Assert
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        context.settings.query_limit = 10
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN RELOADED THE NEW ENVIRONMENT VALUES ARE OBSERVED
+# -----------------------------------------------------------------------------
+def test_context_when_reloaded_the_new_environment_values_are_observed(environment):
+    # Prepare
+    context = ServerContext(ENV_VARIABLE_NAMES)
+    environment.setenv("QUERY_LIMIT", "75")
+    environment.setenv("MONGO_MAX_POOL_SIZE", "10")
+
+    # Act
+    context.reload()
+
+    # Assert
+    assert context.query_limit == 75
+    assert context.mongo_pool_options["maxPoolSize"] == 10
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN MODULE LEVELS ARE SET THEY APPLY TO THE LOGGERS OF THE MODULES
+# -----------------------------------------------------------------------------
+def test_context_when_module_levels_are_set_they_apply_to_the_loggers_of_the_modules(
+    environment,
+):
+    # Prepare
+    environment.setenv("LOG_MODULE_LEVELS", "app.security=DEBUG")
+    context = ServerContext(ENV_VARIABLE_NAMES)
+
+    # Act
+    security_event = context.logger("app.security.authentication").debug("shown")
+    repository_event = context.logger("app.business_objects.core.dao").debug("hidden")
+    configure_logging(logging.WARNING)
+
+    # Assert
+    assert security_event is not None
+    assert repository_event is None
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN SIGHUP ARRIVES DURING A RELOAD THE RELOAD WAITS FOR THE LOCK
+# -----------------------------------------------------------------------------
+def test_reload_on_signal_when_sighup_arrives_during_a_reload_it_waits_for_the_lock(
+    monkeypatch,
+):
+    # Prepare
+    reloads = []
+
+    def reload_context():
+        with app.context._context_lock:
+            reloads.append(True)
+
+    monkeypatch.setattr(app.context, "reload_context", reload_context)
+
+    # Act
+    with app.context._context_lock:
+        thread = reload_on_signal(signal.SIGHUP, None)
+        reloaded_while_locked = bool(reloads)
+    thread.join(timeout=5)
+
+    # Assert
+    assert not reloaded_while_locked
+    assert reloads == [True]
+
+
+# -----------------------------------------------------------------------------
+# TEST WHEN RETRY SETTINGS ARE RELOADED THE RETRY POLICY IS REBUILT
+# -----------------------------------------------------------------------------
+def test_reload_context_when_retry_settings_are_reloaded_the_retry_policy_is_rebuilt(
+    environment,
+):
+    # Prepare
+    environment.setitem(
+        app.context._context, "instance", ServerContext(ENV_VARIABLE_NAMES)
+    )
+    environment.setattr(resilience, "_retry_policy", {})
+    previous = resilience.get_retry_policy()
+    environment.setenv("MONGO_RETRY_ATTEMPTS", "7")
+
+    # Act
+    reload_context()
+
+    # Assert
+    assert resilience.get_retry_policy() is not previous
+    assert resilience.get_retry_policy().attempts == 7